@@ -41,11 +41,19 @@ from .models import (
 from .adapter import ExchangeAdapter
 from .factory import ExchangeFactory, get_exchange_factory
 from .manager import ExchangeManager
+from .http_session import SharedSessionManager
 
-# 具体交易所适配器
-from .adapters.hyperliquid import HyperliquidAdapter
-from .adapters.backpack import BackpackAdapter
-from .adapters.binance import BinanceAdapter
+# 具体交易所适配器（按需加载，见 adapters/__init__.py）
+_LAZY_ADAPTERS = ('HyperliquidAdapter', 'BackpackAdapter', 'BinanceAdapter')
+
+
+def __getattr__(name):
+    if name not in _LAZY_ADAPTERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import adapters
+    value = getattr(adapters, name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     # 核心接口和基类
@@ -73,6 +81,7 @@ __all__ = [
     'ExchangeFactory',
     'get_exchange_factory',
     'ExchangeManager',
+    'SharedSessionManager',
 
     # 具体适配器
     'HyperliquidAdapter',
@@ -7,8 +7,9 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Callable, Awaitable, Tuple
 from decimal import Decimal
 import traceback
 
@@ -25,6 +26,7 @@ from .models import (
     OrderType,
     ExchangeInfo
 )
+from .utils.retry import is_retryable_error, compute_retry_delay
 
 
 class ExchangeAdapter(ExchangeInterface):
@@ -37,8 +39,14 @@ class ExchangeAdapter(ExchangeInterface):
     - 连接管理和健康检查
     - 数据标准化
     - 限频控制
+    - 行情/交易所信息短时缓存
     """
 
+    # 市场数据缓存有效期（秒）：行情类数据极短，交易所信息几乎静态
+    TICKER_CACHE_TTL = 0.1
+    ORDERBOOK_CACHE_TTL = 0.1
+    EXCHANGE_INFO_CACHE_TTL = 3600.0
+
     def __init__(self, config: ExchangeConfig, event_bus: Optional[Any] = None):
         """
         初始化适配器
@@ -82,7 +90,10 @@ class ExchangeAdapter(ExchangeInterface):
 
         # 限频控制
         self._rate_limits: Dict[str, List[float]] = {}
-        self._request_timestamps: Dict[str, List[datetime]] = {}
+        self._request_timestamps: Dict[str, List[float]] = {}
+
+        # 市场数据缓存: key -> (数据, 写入时的monotonic时间)
+        self._market_data_cache: Dict[Tuple[Any, ...], Tuple[Any, float]] = {}
 
         # 健康监控
         self._health_metrics = {
@@ -158,6 +169,7 @@ class ExchangeAdapter(ExchangeInterface):
 
                 # 子类实现具体断开逻辑
                 await self._do_disconnect()
+                self.clear_market_data_cache()
 
                 self.status = ExchangeStatus.DISCONNECTED
                 self.logger.info("交易所连接已断开")
@@ -276,10 +288,13 @@ class ExchangeAdapter(ExchangeInterface):
                     f"操作失败 {operation_name} (尝试 {attempt + 1}/{self.config.max_retry_attempts}): {str(e)}"
                 )
 
-                # 如果不是最后一次尝试，等待后重试
+                # 参数/余额等确定性错误重试无意义，直接抛出
+                if not is_retryable_error(e):
+                    break
+
+                # 如果不是最后一次尝试，等待后重试（指数退避 + 随机抖动）
                 if attempt < self.config.max_retry_attempts - 1:
-                    delay = self.config.retry_delay * (2 ** attempt)  # 指数退避
-                    await asyncio.sleep(delay)
+                    await asyncio.sleep(compute_retry_delay(self.config.retry_delay, attempt))
 
                     # 检查是否需要重连
                     if self._should_reconnect(e):
@@ -366,7 +381,8 @@ class ExchangeAdapter(ExchangeInterface):
         max_requests = limit_config.get('max_requests', 100)
         time_window = limit_config.get('time_window', 60)  # 秒
 
-        now = datetime.now()
+        # 限频窗口只关心时长，使用单调时钟（不受系统时间校正影响）
+        now = time.monotonic()
 
         # 初始化时间戳列表
         if operation not in self._request_timestamps:
@@ -375,15 +391,13 @@ class ExchangeAdapter(ExchangeInterface):
         timestamps = self._request_timestamps[operation]
 
         # 清理过期的时间戳
-        cutoff_time = now - timedelta(seconds=time_window)
+        cutoff_time = now - time_window
         timestamps[:] = [ts for ts in timestamps if ts > cutoff_time]
 
         # 检查是否超过限制
         if len(timestamps) >= max_requests:
             # 计算需要等待的时间
-            oldest_timestamp = timestamps[0]
-            wait_time = (oldest_timestamp +
-                         timedelta(seconds=time_window) - now).total_seconds()
+            wait_time = timestamps[0] + time_window - now
 
             if wait_time > 0:
                 self.logger.warning(f"触发限频，等待 {wait_time:.2f} 秒")
@@ -474,6 +488,39 @@ class ExchangeAdapter(ExchangeInterface):
         # 子类可以重写此方法
         pass
 
+    # === 市场数据缓存 ===
+
+    async def _get_cached_market_data(
+        self,
+        key: Tuple[Any, ...],
+        ttl: float,
+        fetcher: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        带TTL的市场数据读取：缓存未过期直接返回，否则调用fetcher并写入缓存
+
+        Args:
+            key: 缓存键，如 ('ticker', 'BTC-USDC')
+            ttl: 有效期（秒），<=0 表示不缓存
+            fetcher: 实际请求数据的协程函数
+
+        Returns:
+            市场数据（fetcher返回None时不写入缓存）
+        """
+        if ttl > 0:
+            cached = self._market_data_cache.get(key)
+            if cached is not None and time.monotonic() - cached[1] < ttl:
+                return cached[0]
+
+        data = await fetcher()
+        if data is not None and ttl > 0:
+            self._market_data_cache[key] = (data, time.monotonic())
+        return data
+
+    def clear_market_data_cache(self) -> None:
+        """清空市场数据缓存"""
+        self._market_data_cache.clear()
+
     # === 工具方法 ===
 
     def _safe_decimal(self, value: Any, default: Decimal = Decimal('0')) -> Decimal:
@@ -19,12 +19,27 @@
    - 符合MESA事件驱动架构
    """
 
-from .hyperliquid import HyperliquidAdapter
-from .backpack import BackpackAdapter
-from .binance import BinanceAdapter
-from .okx import OKXAdapter
-from .edgex import EdgeXAdapter
-from .lighter import LighterAdapter
+import importlib
+
+# 适配器按需加载（PEP 562）：只在首次访问时导入对应子模块，
+# 避免导入任意一个适配器时连带加载所有交易所的SDK依赖
+_LAZY_ADAPTERS = {
+    'HyperliquidAdapter': '.hyperliquid',
+    'BackpackAdapter': '.backpack',
+    'BinanceAdapter': '.binance',
+    'OKXAdapter': '.okx',
+    'EdgeXAdapter': '.edgex',
+    'LighterAdapter': '.lighter',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'HyperliquidAdapter',
@@ -7,7 +7,6 @@ Backpack交易所适配器 - 重构版本
 """
 
 import asyncio
-import aiohttp
 import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Callable
@@ -16,6 +15,7 @@ from decimal import Decimal
 from ....logging import get_logger
 
 from ..adapter import ExchangeAdapter
+from ..http_session import create_shared_session, release_shared_session
 from ..interface import ExchangeConfig
 from ..models import *
 from ..subscription_manager import create_subscription_manager, DataType
@@ -145,7 +145,7 @@ class BackpackAdapter(ExchangeAdapter):
         try:
             # 创建session
             if not self._session or self._session.closed:
-                self._session = aiohttp.ClientSession()
+                self._session = create_shared_session()
 
             # 设置session给各模块使用
             self._rest.session = self._session
@@ -181,8 +181,8 @@ class BackpackAdapter(ExchangeAdapter):
                 await self._rest.disconnect()
 
             # 关闭session
-            if self._session and not self._session.closed:
-                await self._session.close()
+            if self._session:
+                await release_shared_session(self._session)
 
             self._connected = False
             self._authenticated = False
@@ -246,7 +246,9 @@ class BackpackAdapter(ExchangeAdapter):
 
     async def get_exchange_info(self) -> ExchangeInfo:
         """获取交易所信息"""
-        return await self._rest.get_exchange_info()
+        return await self._get_cached_market_data(
+            ('exchange_info',), self.EXCHANGE_INFO_CACHE_TTL, self._rest.get_exchange_info
+        )
 
     async def get_supported_symbols(self) -> List[str]:
         """获取支持的交易对列表"""
@@ -288,7 +290,10 @@ class BackpackAdapter(ExchangeAdapter):
 
     async def get_ticker(self, symbol: str) -> TickerData:
         """获取单个交易对的ticker数据"""
-        return await self._rest.get_ticker(symbol)
+        return await self._get_cached_market_data(
+            ('ticker', symbol), self.TICKER_CACHE_TTL,
+            lambda: self._rest.get_ticker(symbol)
+        )
 
     async def get_tickers(self, symbols: Optional[List[str]] = None) -> List[TickerData]:
         """获取多个交易对的ticker数据"""
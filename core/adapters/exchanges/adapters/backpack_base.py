@@ -14,7 +14,7 @@ from datetime import datetime
 from ..models import (
     TickerData, OrderBookData, TradeData, BalanceData, OrderData, 
     OrderSide, OrderType, OrderStatus, PositionData, PositionSide,
-    MarginMode, OrderBookLevel
+    MarginMode, OrderBookLevel, get_quantizer
 )
 
 
@@ -378,13 +378,8 @@ class BackpackBase:
         else:
             precision = 8  # 默认精度
         
-        # 根据精度格式化
-        if precision == 0:
-            # 只接受整数（如 ASTER）
-            formatted = quantity.quantize(Decimal('1'))
-        else:
-            # 支持小数（如 BTC, ETH）
-            formatted = quantity.quantize(Decimal('0.1') ** precision)
+        # 根据精度格式化（精度为0时只接受整数，如 ASTER）
+        formatted = quantity.quantize(get_quantizer(precision))
         
         # 手动去除末尾的零，避免科学计数法
         result = str(formatted)
@@ -401,7 +396,7 @@ class BackpackBase:
             precision = 8  # 默认精度
         
         # 格式化精度
-        formatted = price.quantize(Decimal('0.1') ** precision)
+        formatted = price.quantize(get_quantizer(precision))
         
         # 手动去除末尾的零，避免科学计数法
         result = str(formatted)
@@ -4,15 +4,16 @@ Backpack REST API模块
 包含HTTP请求处理、ED25519签名认证、私有API操作等功能
 """
 
-import asyncio
-import aiohttp
 import time
 import json
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from decimal import Decimal
 from datetime import datetime
 
 from .backpack_base import BackpackBase, BackpackSymbolInfo
+from ..http_session import create_shared_session, release_shared_session
+from ..utils.concurrency import gather_limited
 from ..models import (
     BalanceData, OrderData, OrderSide, OrderType, OrderStatus,
     TickerData, OrderBookData, OrderBookLevel, TradeData, PositionData, PositionSide,
@@ -20,6 +21,26 @@ from ..models import (
 )
 
 
+@lru_cache(maxsize=256)
+def _precision_from_tick_size(tick_size: str) -> int:
+    """
+    根据tick_size字符串计算小数位数（基于Decimal指数，精确且按输入缓存）
+
+    结果与 -int(log10(tick_size)) 一致：0.01 → 2，0.05 → 1，0.5 → 0
+    """
+    tick_value = Decimal(tick_size)
+    if tick_value <= 0:
+        raise ValueError(f"无效的tick_size: {tick_size}")
+    if tick_value >= 1:
+        return 0
+    tick_value = tick_value.normalize()
+    exponent = -tick_value.adjusted()
+    # 非10的整数次幂时，log10 取整会少一位
+    if tick_value.as_tuple().digits != (1,):
+        exponent -= 1
+    return max(0, exponent)
+
+
 class BackpackRest(BackpackBase):
     """Backpack REST API接口"""
 
@@ -42,7 +63,7 @@ class BackpackRest(BackpackBase):
         """连接到Backpack REST API"""
         try:
             # 创建HTTP session
-            self.session = aiohttp.ClientSession()
+            self.session = create_shared_session()
 
             # 测试API连接并获取市场数据（一次性完成）
             if self.logger:
@@ -125,7 +146,7 @@ class BackpackRest(BackpackBase):
         """断开REST API连接"""
         try:
             if self.session and not self.session.closed:
-                await self.session.close()
+                await release_shared_session(self.session)
                 self.session = None
                 if self.logger:
                     self.logger.info("Backpack REST会话已关闭")
@@ -656,14 +677,7 @@ class BackpackRest(BackpackBase):
             精度位数
         """
         try:
-            tick_value = float(tick_size)
-            if tick_value >= 1:
-                return 0
-
-            # 计算小数点后的位数
-            import math
-            precision = -int(math.log10(tick_value))
-            return max(0, precision)
+            return _precision_from_tick_size(str(tick_size))
 
         except Exception:
             return 8  # 默认值
@@ -718,7 +732,7 @@ class BackpackRest(BackpackBase):
             if symbols:
                 # 获取指定交易对的ticker
                 tasks = [self.get_ticker(symbol) for symbol in symbols]
-                return await asyncio.gather(*tasks)
+                return await gather_limited(tasks)
             else:
                 # 确保session已创建
                 if not self.session:
@@ -160,11 +160,16 @@ class BinanceAdapter(ExchangeAdapter):
 
     async def get_exchange_info(self) -> ExchangeInfo:
         """获取交易所信息"""
-        return await self._rest.get_exchange_info()
+        return await self._get_cached_market_data(
+            ('exchange_info',), self.EXCHANGE_INFO_CACHE_TTL, self._rest.get_exchange_info
+        )
 
     async def get_ticker(self, symbol: str) -> TickerData:
         """获取行情数据"""
-        return await self._rest.get_ticker(symbol)
+        return await self._get_cached_market_data(
+            ('ticker', symbol), self.TICKER_CACHE_TTL,
+            lambda: self._rest.get_ticker(symbol)
+        )
 
     async def get_tickers(self, symbols: Optional[List[str]] = None) -> List[TickerData]:
         """获取多个行情数据"""
@@ -172,7 +177,10 @@ class BinanceAdapter(ExchangeAdapter):
 
     async def get_orderbook(self, symbol: str, limit: Optional[int] = None) -> OrderBookData:
         """获取订单簿"""
-        return await self._rest.get_orderbook(symbol, limit)
+        return await self._get_cached_market_data(
+            ('orderbook', symbol, limit), self.ORDERBOOK_CACHE_TTL,
+            lambda: self._rest.get_orderbook(symbol, limit)
+        )
 
     async def get_ohlcv(
         self,
@@ -222,6 +230,21 @@ class BinanceAdapter(ExchangeAdapter):
         
         return order
 
+    def supports_batch_orders(self) -> bool:
+        """支持原生批量下单"""
+        return True
+
+    async def create_orders(self, orders: List[Dict[str, Any]]) -> List[Optional[OrderData]]:
+        """批量创建订单"""
+        results = await self._rest.create_orders(orders)
+
+        # 触发订单创建事件
+        for order in results:
+            if order is not None:
+                await self._handle_order_update(order)
+
+        return results
+
     async def cancel_order(self, order_id: str, symbol: str) -> OrderData:
         """取消订单"""
         order = await self._rest.cancel_order(order_id, symbol)
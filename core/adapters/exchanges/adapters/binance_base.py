@@ -7,7 +7,7 @@ Binance交易所基础模块 - 重构版
 
 import time
 import decimal
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from decimal import Decimal
 from datetime import datetime
 from enum import Enum
@@ -114,6 +114,10 @@ class BinanceBase:
         self._supported_symbols = []
         self._market_info = {}
         
+        # 精度表：symbol -> (价格精度, 数量精度)，由 _market_info 一次性展开
+        self._precision_table: Dict[str, Tuple[int, int]] = {}
+        self._precision_table_source: Optional[Dict[str, Any]] = None
+        
         # CCXT兼容配置
         self.ccxt_config = self._setup_ccxt_config()
         
@@ -375,28 +379,35 @@ class BinanceBase:
         
         return True
     
+    def _get_precision_pair(self, symbol: str) -> Tuple[int, int]:
+        """获取交易对 (价格精度, 数量精度)，市场信息变化时整体重建精度表"""
+        markets = self._market_info
+        if markets is not self._precision_table_source:
+            self._precision_table = {
+                market_symbol: (
+                    market.get('quotePrecision', 8),
+                    market.get('baseAssetPrecision', 8)
+                )
+                for market_symbol, market in markets.items()
+            }
+            self._precision_table_source = markets
+        # 未知交易对使用默认精度
+        return self._precision_table.get(symbol, (8, 8))
+    
     def get_precision_info(self, symbol: str) -> Dict[str, int]:
         """获取交易对精度信息"""
-        # 从市场信息中获取精度，或使用默认值
-        if symbol in self._market_info:
-            market = self._market_info[symbol]
-            return {
-                'price_precision': market.get('quotePrecision', 8),
-                'amount_precision': market.get('baseAssetPrecision', 8)
-            }
-        
-        # 默认精度
+        price_precision, amount_precision = self._get_precision_pair(symbol)
         return {
-            'price_precision': 8,
-            'amount_precision': 8
+            'price_precision': price_precision,
+            'amount_precision': amount_precision
         }
     
     def format_price(self, price: Decimal, symbol: str) -> str:
         """格式化价格"""
-        precision = self.get_precision_info(symbol)['price_precision']
+        precision = self._get_precision_pair(symbol)[0]
         return f"{price:.{precision}f}"
     
     def format_amount(self, amount: Decimal, symbol: str) -> str:
         """格式化数量"""
-        precision = self.get_precision_info(symbol)['amount_precision']
+        precision = self._get_precision_pair(symbol)[1]
         return f"{amount:.{precision}f}" 
\ No newline at end of file
@@ -6,7 +6,6 @@ Binance交易所REST API模块 - 重构版
 """
 
 import asyncio
-import ccxt
 import hmac
 import hashlib
 import time
@@ -15,6 +14,8 @@ from typing import Dict, List, Optional, Any
 from decimal import Decimal
 
 from .binance_base import BinanceBase
+from ..utils.concurrency import gather_limited
+from ..utils.retry import is_retryable_error, compute_retry_delay
 from ..models import (
     TickerData, OrderBookData, TradeData, BalanceData, OrderData,
     PositionData, OHLCVData, ExchangeInfo, ExchangeType,
@@ -34,6 +35,9 @@ class BinanceRest(BinanceBase):
         self.rate_limit_orders = 1200  # 1分钟内最大订单数
         self.rate_limit_requests = 2400  # 1分钟内最大请求数
         
+        # 原生批量下单单次上限
+        self.max_batch_orders = 5
+
         # 重试配置
         self.max_retries = 3
         self.retry_delay = 1.0
@@ -41,7 +45,8 @@ class BinanceRest(BinanceBase):
     async def initialize(self) -> bool:
         """初始化CCXT交易所实例"""
         try:
-            # 创建ccxt交易所实例
+            # 创建ccxt交易所实例（ccxt导入较重，延迟到实际使用时）
+            import ccxt
             self.exchange = ccxt.binance(self.ccxt_config)
             
             # 加载市场信息
@@ -84,13 +89,15 @@ class BinanceRest(BinanceBase):
                 return result
             except Exception as e:
                 last_error = e
-                if attempt < self.max_retries - 1:
+                # 参数/余额/鉴权等确定性错误不重试（下单类操作重试无意义且有风险）
+                if attempt < self.max_retries - 1 and is_retryable_error(e):
                     if self.logger:
                         self.logger.warning(f"API调用失败 (尝试 {attempt + 1}/{self.max_retries}): {str(e)}")
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    await asyncio.sleep(compute_retry_delay(self.retry_delay, attempt))
                 else:
                     if self.logger:
                         self.logger.error(f"API调用最终失败: {str(e)}")
+                    break
         
         raise last_error
     
@@ -144,7 +151,7 @@ class BinanceRest(BinanceBase):
             if symbols:
                 # 并发获取指定符号的行情
                 tasks = [self.get_ticker(symbol) for symbol in symbols]
-                return await asyncio.gather(*tasks)
+                return await gather_limited(tasks)
             else:
                 # 获取所有行情
                 tickers_data = await self._execute_with_retry(
@@ -333,6 +340,61 @@ class BinanceRest(BinanceBase):
                 self.logger.error(f"创建订单失败 {symbol}: {str(e)}")
             raise
     
+    async def create_orders(self, orders: List[Dict[str, Any]]) -> List[Optional[OrderData]]:
+        """批量创建订单（原生批量接口，每次最多 5 笔）"""
+        requests = []
+        for order in orders:
+            mapped_symbol = self.map_symbol_to_binance(order['symbol'])
+            order_params = dict(order.get('params') or {})
+            price = order.get('price')
+            requests.append({
+                'symbol': mapped_symbol,
+                'type': self.ORDER_TYPE_MAPPING.get(order['order_type'], 'LIMIT'),
+                'side': order['side'].value.lower(),
+                'amount': float(order['amount']),
+                'price': float(price) if price else None,
+                'params': order_params
+            })
+
+        # 各分块并发提交，结果按输入顺序拼接
+        size = self.max_batch_orders
+        chunk_results = await gather_limited(
+            self._create_orders_chunk(orders[i:i + size], requests[i:i + size])
+            for i in range(0, len(requests), size)
+        )
+        return [result for chunk in chunk_results for result in chunk]
+
+    async def _create_orders_chunk(
+        self,
+        orders: List[Dict[str, Any]],
+        requests: List[Dict[str, Any]]
+    ) -> List[Optional[OrderData]]:
+        """
+        提交一个分块的批量订单
+
+        下单不走重试：响应丢失时交易所可能已接受订单，整批重发会重复挂单。
+        失败的条目返回None，由调用方决定是否重新下单。
+        """
+        try:
+            orders_data = await asyncio.get_event_loop().run_in_executor(
+                None, self.exchange.create_orders, requests
+            )
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"批量创建订单失败: {str(e)}")
+            return [None] * len(orders)
+
+        results: List[Optional[OrderData]] = []
+        for order, order_data in zip(orders, orders_data or []):
+            # 部分失败时对应条目没有订单ID
+            if order_data and order_data.get('id'):
+                results.append(self.parse_order(order_data, order['symbol']))
+            else:
+                results.append(None)
+        # 响应中缺少的条目按失败处理
+        results.extend([None] * (len(orders) - len(results)))
+        return results
+
     async def cancel_order(self, order_id: str, symbol: str) -> OrderData:
         """取消订单"""
         try:
@@ -365,21 +427,36 @@ class BinanceRest(BinanceBase):
                     self.exchange.fetch_open_orders
                 )
             
-            result = []
-            for order in open_orders:
-                try:
-                    cancelled_order = await self._execute_with_retry(
+            # 并发取消，失败的订单统一收集后记录一次日志
+            cancel_results = await gather_limited(
+                (
+                    self._execute_with_retry(
                         self.exchange.cancel_order,
                         order['id'],
                         order['symbol']
                     )
+                    for order in open_orders
+                ),
+                return_exceptions=True
+            )
+            
+            result = []
+            failed = []
+            for order, cancelled_order in zip(open_orders, cancel_results):
+                if isinstance(cancelled_order, Exception):
+                    failed.append(f"{order['id']}: {cancelled_order}")
+                    continue
+                # 单个订单解析失败不影响其余已取消订单的返回
+                try:
                     result.append(self.parse_order(
-                        cancelled_order, 
+                        cancelled_order,
                         symbol or self.map_symbol_from_binance(order['symbol'])
                     ))
                 except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"取消订单失败 {order['id']}: {str(e)}")
+                    failed.append(f"{order['id']}: 解析失败 {e}")
+            
+            if failed and self.logger:
+                self.logger.warning(f"取消订单失败 {len(failed)} 个: {'; '.join(failed)}")
             
             return result
         except Exception as e:
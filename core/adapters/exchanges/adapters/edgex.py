@@ -9,7 +9,6 @@ EdgeX交易所适配器 - 重构版本
 注意：由于EdgeX官方API文档不可用，此实现基于标准交易所API模式
 """
 
-import asyncio
 import time
 import json
 from typing import Dict, List, Optional, Any, Union, Callable
@@ -18,6 +17,7 @@ from datetime import datetime
 
 from ..adapter import ExchangeAdapter
 from ..interface import ExchangeConfig
+from ..utils.concurrency import gather_limited
 from ..models import (
     ExchangeType, OrderBookData, TradeData, TickerData, BalanceData, OrderData,
     OrderSide, OrderType, OrderStatus, PositionData, ExchangeInfo, OHLCVData
@@ -222,85 +222,15 @@ class EdgeXAdapter(ExchangeAdapter):
     # === 市场数据接口实现 ===
 
     async def get_exchange_info(self) -> ExchangeInfo:
-        """获取交易所信息"""
+        """获取交易所信息（带缓存，markets为空时不缓存）"""
         try:
-            # 获取支持的交易对列表
-            supported_symbols = await self.get_supported_symbols()
-            
-            # 构建markets字典
-            markets = {}
-            for symbol in supported_symbols:
-                # 解析symbol获取base和quote
-                if '_' in symbol:
-                    base, quote = symbol.split('_', 1)
-                else:
-                    # 回退处理
-                    if symbol.endswith('USDT'):
-                        base = symbol[:-4]
-                        quote = 'USDT'
-                    else:
-                        base = symbol
-                        quote = 'USDT'
-                
-                markets[symbol] = {
-                    'id': symbol,
-                    'symbol': symbol,
-                    'base': base,
-                    'quote': quote,
-                    'baseId': base,
-                    'quoteId': quote,
-                    'active': True,
-                    'type': 'swap',
-                    'spot': False,
-                    'margin': False,
-                    'future': False,
-                    'swap': True,
-                    'option': False,
-                    'contract': True,
-                    'contractSize': 1,
-                    'linear': True,
-                    'inverse': False,
-                    'expiry': None,
-                    'expiryDatetime': None,
-                    'strike': None,
-                    'optionType': None,
-                    'precision': {
-                        'amount': 8,
-                        'price': 8,
-                        'cost': 8,
-                        'base': 8,
-                        'quote': 8
-                    },
-                    'limits': {
-                        'amount': {'min': 0.001, 'max': 1000000},
-                        'price': {'min': 0.01, 'max': 1000000},
-                        'cost': {'min': 10, 'max': 10000000},
-                        'leverage': {'min': 1, 'max': 100}
-                    },
-                    'info': {
-                        'symbol': symbol,
-                        'exchange': 'edgex',
-                        'type': 'perpetual'
-                    }
-                }
-            
-            self.logger.info(f"✅ EdgeX交易所信息: {len(markets)}个市场")
-            
-            return ExchangeInfo(
-                name="EdgeX",
-                id="edgex",
-                type=ExchangeType.PERPETUAL,
-                supported_features=[
-                    "spot_trading", "perpetual_trading", "websocket",
-                    "orderbook", "ticker", "ohlcv", "user_stream"
-                ],
-                rate_limits=self.config.rate_limits,
-                precision=self.config.precision,
-                fees={},
-                markets=markets,
-                status="operational",
-                timestamp=datetime.now()
+            exchange_info = await self._get_cached_market_data(
+                ('exchange_info',), self.EXCHANGE_INFO_CACHE_TTL, self._build_exchange_info
             )
+            if not exchange_info.markets:
+                # 交易对列表尚未就绪，下次调用重新构建
+                self._market_data_cache.pop(('exchange_info',), None)
+            return exchange_info
             
         except Exception as e:
             self.logger.error(f"❌ 获取EdgeX交易所信息失败: {e}")
@@ -321,6 +251,86 @@ class EdgeXAdapter(ExchangeAdapter):
                 timestamp=datetime.now()
             )
 
+    async def _build_exchange_info(self) -> ExchangeInfo:
+        """根据支持的交易对构建交易所信息"""
+        # 获取支持的交易对列表
+        supported_symbols = await self.get_supported_symbols()
+        
+        # 构建markets字典
+        markets = {}
+        for symbol in supported_symbols:
+            # 解析symbol获取base和quote
+            if '_' in symbol:
+                base, quote = symbol.split('_', 1)
+            else:
+                # 回退处理
+                if symbol.endswith('USDT'):
+                    base = symbol[:-4]
+                    quote = 'USDT'
+                else:
+                    base = symbol
+                    quote = 'USDT'
+            
+            markets[symbol] = {
+                'id': symbol,
+                'symbol': symbol,
+                'base': base,
+                'quote': quote,
+                'baseId': base,
+                'quoteId': quote,
+                'active': True,
+                'type': 'swap',
+                'spot': False,
+                'margin': False,
+                'future': False,
+                'swap': True,
+                'option': False,
+                'contract': True,
+                'contractSize': 1,
+                'linear': True,
+                'inverse': False,
+                'expiry': None,
+                'expiryDatetime': None,
+                'strike': None,
+                'optionType': None,
+                'precision': {
+                    'amount': 8,
+                    'price': 8,
+                    'cost': 8,
+                    'base': 8,
+                    'quote': 8
+                },
+                'limits': {
+                    'amount': {'min': 0.001, 'max': 1000000},
+                    'price': {'min': 0.01, 'max': 1000000},
+                    'cost': {'min': 10, 'max': 10000000},
+                    'leverage': {'min': 1, 'max': 100}
+                },
+                'info': {
+                    'symbol': symbol,
+                    'exchange': 'edgex',
+                    'type': 'perpetual'
+                }
+            }
+        
+        self.logger.info(f"✅ EdgeX交易所信息: {len(markets)}个市场")
+        
+        return ExchangeInfo(
+            name="EdgeX",
+            id="edgex",
+            type=ExchangeType.PERPETUAL,
+            supported_features=[
+                "spot_trading", "perpetual_trading", "websocket",
+                "orderbook", "ticker", "ohlcv", "user_stream"
+            ],
+            rate_limits=self.config.rate_limits,
+            precision=self.config.precision,
+            fees={},
+            markets=markets,
+            status="operational",
+            timestamp=datetime.now()
+        )
+
     async def get_ticker(self, symbol: str) -> TickerData:
         """获取单个交易对行情数据"""
         try:
@@ -383,7 +393,7 @@ class EdgeXAdapter(ExchangeAdapter):
 
             # 并发获取所有ticker数据
             tasks = [self.get_ticker(symbol) for symbol in symbols]
-            tickers = await asyncio.gather(*tasks, return_exceptions=True)
+            tickers = await gather_limited(tasks, return_exceptions=True)
 
             # 过滤掉异常结果
             valid_tickers = [ticker for ticker in tickers if isinstance(ticker, TickerData)]
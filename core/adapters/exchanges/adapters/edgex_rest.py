@@ -11,6 +11,7 @@ from decimal import Decimal
 from datetime import datetime
 
 from .edgex_base import EdgeXBase
+from ..http_session import create_shared_session, release_shared_session
 from ..models import (
     BalanceData, OrderData, OrderStatus, OrderSide, OrderType, PositionData, TradeData
 )
@@ -31,7 +32,7 @@ class EdgeXRest(EdgeXBase):
     async def setup_session(self):
         """设置HTTP会话"""
         if not self.session:
-            self.session = aiohttp.ClientSession(
+            self.session = create_shared_session(
                 timeout=aiohttp.ClientTimeout(total=30),
                 headers={
                     'User-Agent': 'EdgeX-Adapter/1.0',
@@ -42,7 +43,7 @@ class EdgeXRest(EdgeXBase):
     async def close_session(self):
         """关闭HTTP会话"""
         if self.session:
-            await self.session.close()
+            await release_shared_session(self.session)
             self.session = None
 
     async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, 
@@ -338,11 +338,16 @@ class HyperliquidAdapter(ExchangeAdapter):
 
     async def get_exchange_info(self) -> ExchangeInfo:
         """获取交易所信息"""
-        return await self._rest.get_exchange_info()
+        return await self._get_cached_market_data(
+            ('exchange_info',), self.EXCHANGE_INFO_CACHE_TTL, self._rest.get_exchange_info
+        )
 
     async def get_ticker(self, symbol: str) -> TickerData:
         """获取单个交易对行情"""
-        return await self._rest.get_ticker(symbol)
+        return await self._get_cached_market_data(
+            ('ticker', symbol), self.TICKER_CACHE_TTL,
+            lambda: self._rest.get_ticker(symbol)
+        )
 
     async def get_tickers(self, symbols: Optional[List[str]] = None) -> List[TickerData]:
         """获取多个交易对行情"""
@@ -350,7 +355,10 @@ class HyperliquidAdapter(ExchangeAdapter):
 
     async def get_orderbook(self, symbol: str, limit: Optional[int] = None) -> OrderBookData:
         """获取订单簿"""
-        return await self._rest.get_orderbook(symbol, limit)
+        return await self._get_cached_market_data(
+            ('orderbook', symbol, limit), self.ORDERBOOK_CACHE_TTL,
+            lambda: self._rest.get_orderbook(symbol, limit)
+        )
 
     async def get_ohlcv(
         self,
@@ -5,9 +5,8 @@ Hyperliquid REST API模块
 """
 
 import asyncio
-import ccxt
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from decimal import Decimal
 import ssl
 import requests
@@ -15,12 +14,17 @@ from requests.adapters import HTTPAdapter
 from urllib3.poolmanager import PoolManager
 
 from .hyperliquid_base import HyperliquidBase
+from ..utils.concurrency import gather_limited
+from ..utils.retry import is_retryable_error, compute_retry_delay
 from ..models import (
     TickerData, OrderBookData, TradeData, BalanceData, PositionData,
     OrderData, OHLCVData, ExchangeInfo, OrderBookLevel,
     OrderSide, OrderType, OrderStatus, PositionSide, MarginMode, ExchangeType
 )
 
+if TYPE_CHECKING:
+    import ccxt
+
 
 class SSLAdapter(HTTPAdapter):
     """自定义 SSL 适配器 - 禁用 SSL 验证以兼容 Python 3.13"""
@@ -38,14 +42,15 @@ class HyperliquidRest(HyperliquidBase):
     def __init__(self, config=None, logger=None):
         super().__init__(config)
         self.logger = logger
-        self.exchange: Optional[ccxt.hyperliquid] = None
+        self.exchange: Optional['ccxt.hyperliquid'] = None
         self.max_retries = 3
         self.retry_delay = 1.0
 
     async def connect(self) -> bool:
         """建立连接"""
         try:
-            # 创建ccxt交易所实例
+            # 创建ccxt交易所实例（ccxt导入较重，延迟到实际使用时）
+            import ccxt
             exchange_config = {
                 'enableRateLimit': True,
                 'options': {
@@ -129,16 +134,17 @@ class HyperliquidRest(HyperliquidBase):
                 return result
             except Exception as e:
                 last_error = e
-                if attempt < self.max_retries - 1:
-                    operation = operation_name or func.__name__
+                operation = operation_name or func.__name__
+                # 参数/余额/鉴权等确定性错误不重试（下单类操作重试无意义且有风险）
+                if attempt < self.max_retries - 1 and is_retryable_error(e):
                     if self.logger:
                         self.logger.warning(
                             f"{operation} API调用失败 (尝试 {attempt + 1}/{self.max_retries}): {str(e)}")
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    await asyncio.sleep(compute_retry_delay(self.retry_delay, attempt))
                 else:
-                    operation = operation_name or func.__name__
                     if self.logger:
                         self.logger.error(f"{operation} API调用最终失败: {str(e)}")
+                    break
 
         raise last_error
 
@@ -179,7 +185,7 @@ class HyperliquidRest(HyperliquidBase):
         if symbols:
             # 获取指定交易对行情
             tasks = [self.get_ticker(symbol) for symbol in symbols]
-            return await asyncio.gather(*tasks)
+            return await gather_limited(tasks)
         else:
             # 获取所有交易对行情
             tickers_data = await self._execute_with_retry(
@@ -589,27 +595,32 @@ class HyperliquidRest(HyperliquidBase):
     async def _cancel_orders_by_symbol(self, symbol: str) -> List[Dict[str, Any]]:
         """取消指定交易对的所有订单"""
         orders = await self._fetch_open_orders_by_symbol(symbol)
-        results = []
-        for order in orders:
-            try:
-                result = await self._cancel_single_order(order['id'], symbol)
-                results.append(result)
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"取消订单失败 {order['id']}: {str(e)}")
-        return results
+        cancel_results = await gather_limited(
+            (self._cancel_single_order(order['id'], symbol) for order in orders),
+            return_exceptions=True
+        )
+        return self._collect_cancel_results(orders, cancel_results)
 
     async def _cancel_all_open_orders(self) -> List[Dict[str, Any]]:
         """取消所有开放订单"""
         orders = await self._fetch_all_open_orders()
+        cancel_results = await gather_limited(
+            (self._cancel_single_order(order['id'], order['symbol']) for order in orders),
+            return_exceptions=True
+        )
+        return self._collect_cancel_results(orders, cancel_results)
+
+    def _collect_cancel_results(self, orders: List[Dict[str, Any]], cancel_results: List[Any]) -> List[Dict[str, Any]]:
+        """整理并发取消结果：成功的结果按顺序返回，失败的订单统一记录一次日志"""
         results = []
-        for order in orders:
-            try:
-                result = await self._cancel_single_order(order['id'], order['symbol'])
+        failed = []
+        for order, result in zip(orders, cancel_results):
+            if isinstance(result, Exception):
+                failed.append(f"{order['id']}: {result}")
+            else:
                 results.append(result)
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"取消订单失败 {order['id']}: {str(e)}")
+        if failed and self.logger:
+            self.logger.error(f"取消订单失败 {len(failed)} 个: {'; '.join(failed)}")
         return results
 
     async def _fetch_order_info(self, order_id: str, symbol: str) -> Dict[str, Any]:
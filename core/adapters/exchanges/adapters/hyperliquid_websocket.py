@@ -9,7 +9,6 @@ import time
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Callable, Tuple
 from decimal import Decimal
-import ccxt.pro as ccxt
 
 from ..interface import ExchangeConfig
 from ..models import (
@@ -284,6 +283,8 @@ class HyperliquidWebSocket:
                     self.logger.info(
                         f"✅ 配置钱包地址: {self.config.wallet_address[:10]}...{self.config.wallet_address[-6:]}")
 
+            # ccxt导入较重，延迟到实际创建实例时
+            import ccxt.pro as ccxt
             self._ccxt_exchange = ccxt.hyperliquid(exchange_config)
 
             if self.logger:
@@ -343,7 +343,9 @@ class LighterAdapter(ExchangeAdapter):
         Returns:
             ExchangeInfo对象
         """
-        return await self._rest.get_exchange_info()
+        return await self._get_cached_market_data(
+            ('exchange_info',), self.EXCHANGE_INFO_CACHE_TTL, self._rest.get_exchange_info
+        )
 
     async def get_ticker(self, symbol: str) -> Optional[TickerData]:
         """
@@ -356,7 +358,10 @@ class LighterAdapter(ExchangeAdapter):
             TickerData对象
         """
         normalized_symbol = self._normalize_symbol(symbol)
-        return await self._rest.get_ticker(normalized_symbol)
+        return await self._get_cached_market_data(
+            ('ticker', normalized_symbol), self.TICKER_CACHE_TTL,
+            lambda: self._rest.get_ticker(normalized_symbol)
+        )
 
     async def get_tickers(self, symbols: Optional[List[str]] = None) -> List[TickerData]:
         """
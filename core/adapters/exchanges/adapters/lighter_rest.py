@@ -70,7 +70,8 @@ except ImportError:
 from .lighter_base import LighterBase
 from ..models import (
     TickerData, OrderBookData, TradeData, BalanceData,
-    OrderData, PositionData, ExchangeInfo, OrderBookLevel, OrderSide, OrderType, OrderStatus
+    OrderData, PositionData, ExchangeInfo, OrderBookLevel, OrderSide, OrderType, OrderStatus,
+    get_quantizer
 )
 
 # 配置 logger 输出到文件
@@ -998,10 +999,7 @@ class LighterRest(LighterBase):
         """转换市价单参数为Lighter格式"""
         # 🔥 先对价格应用精度规则（与限价单保持一致）
         price_decimals = market_info['price_decimals']
-        if price_decimals == 0:
-            quantize_precision = Decimal("1")
-        else:
-            quantize_precision = Decimal(10) ** (-price_decimals)
+        quantize_precision = get_quantizer(price_decimals)
 
         avg_execution_price_rounded = avg_execution_price.quantize(
             quantize_precision)
@@ -1071,10 +1069,7 @@ class LighterRest(LighterBase):
         # 例如：price_decimals=1 -> quantize(Decimal("0.1"))
         #      price_decimals=2 -> quantize(Decimal("0.01"))
         price_decimals = market_info['price_decimals']
-        if price_decimals == 0:
-            quantize_precision = Decimal("1")
-        else:
-            quantize_precision = Decimal(10) ** (-price_decimals)
+        quantize_precision = get_quantizer(price_decimals)
 
         price_rounded = price.quantize(quantize_precision)
 
@@ -1195,10 +1190,7 @@ class LighterRest(LighterBase):
 
             # 🔥 处理结果（使用调整后的价格，与_convert_limit_order_params保持一致）
             price_decimals = market_info['price_decimals']
-            if price_decimals == 0:
-                quantize_precision = Decimal("1")
-            else:
-                quantize_precision = Decimal(10) ** (-price_decimals)
+            quantize_precision = get_quantizer(price_decimals)
 
             price_rounded = price.quantize(quantize_precision)
 
@@ -0,0 +1,107 @@
+"""
+共享HTTP连接池
+
+所有交易所REST模块共用一个 aiohttp.TCPConnector，减少重复的TCP/TLS握手，
+提高keep-alive连接复用率。各模块仍可创建自己的 ClientSession（保留各自的
+headers/timeout），但底层连接池是共享的：session 通过 release_shared_session
+释放，最后一个 session 释放时才关闭连接池。
+"""
+
+import asyncio
+import weakref
+from typing import Optional
+
+import aiohttp
+
+
+class SharedSessionManager:
+    """共享连接池管理器（进程级单例，按事件循环重建，按存活session计数关闭）"""
+
+    # 连接池参数
+    CONNECTOR_LIMIT = 2000
+    CONNECTOR_LIMIT_PER_HOST = 200
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 75
+
+    _connector: Optional[aiohttp.TCPConnector] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    # 使用共享连接池的存活session（弱引用，被回收的session自动移除）
+    _sessions: "weakref.WeakSet[aiohttp.ClientSession]" = weakref.WeakSet()
+
+    @classmethod
+    def get_connector(cls) -> aiohttp.TCPConnector:
+        """获取共享连接池（需在事件循环中调用）"""
+        loop = asyncio.get_running_loop()
+        if cls._connector is None or cls._connector.closed or cls._loop is not loop:
+            # 旧连接池绑定在已失效的事件循环上，先关闭再替换
+            cls._discard_connector(cls._connector)
+            cls._sessions = weakref.WeakSet()
+            cls._connector = aiohttp.TCPConnector(
+                limit=cls.CONNECTOR_LIMIT,
+                limit_per_host=cls.CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=cls.DNS_CACHE_TTL,
+                keepalive_timeout=cls.KEEPALIVE_TIMEOUT
+            )
+            cls._loop = loop
+        return cls._connector
+
+    @classmethod
+    def create_session(cls, **kwargs) -> aiohttp.ClientSession:
+        """
+        创建使用共享连接池的 ClientSession
+
+        Args:
+            **kwargs: 传给 aiohttp.ClientSession 的其他参数（timeout、headers等）
+
+        Returns:
+            ClientSession（需通过 release_session 释放，关闭时不会直接关闭共享连接池）
+        """
+        session = aiohttp.ClientSession(
+            connector=cls.get_connector(),
+            connector_owner=False,
+            **kwargs
+        )
+        cls._sessions.add(session)
+        return session
+
+    @classmethod
+    async def release_session(cls, session: Optional[aiohttp.ClientSession]) -> None:
+        """
+        关闭并释放session，最后一个session释放后关闭共享连接池
+
+        重复释放同一个session是安全的（多个模块共用session时各自释放即可）
+        """
+        if session is None:
+            return
+        if not session.closed:
+            await session.close()
+        cls._sessions.discard(session)
+
+        if not cls._sessions and cls._connector is not None:
+            connector = cls._connector
+            cls._connector = None
+            cls._loop = None
+            if not connector.closed:
+                await connector.close()
+
+    @staticmethod
+    def _discard_connector(connector: Optional[aiohttp.TCPConnector]) -> None:
+        """同步关闭旧事件循环上的连接池（旧循环可能已关闭，出错忽略）"""
+        if connector is None or connector.closed:
+            return
+        try:
+            result = connector.close()
+            if asyncio.iscoroutine(result):
+                result.close()
+        except Exception:
+            pass
+
+
+def create_shared_session(**kwargs) -> aiohttp.ClientSession:
+    """创建使用共享连接池的 ClientSession"""
+    return SharedSessionManager.create_session(**kwargs)
+
+
+async def release_shared_session(session: Optional[aiohttp.ClientSession]) -> None:
+    """释放共享连接池上的 ClientSession"""
+    await SharedSessionManager.release_session(session)
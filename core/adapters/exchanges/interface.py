@@ -286,6 +286,27 @@ class ExchangeInterface(ABC):
         """
         pass
 
+    def supports_batch_orders(self) -> bool:
+        """
+        是否支持原生批量下单接口
+
+        Returns:
+            bool: 支持时可调用 create_orders 一次提交多笔订单
+        """
+        return False
+
+    async def create_orders(self, orders: List[Dict[str, Any]]) -> List[Optional[OrderData]]:
+        """
+        批量创建订单（仅 supports_batch_orders() 为True的交易所实现）
+
+        Args:
+            orders: 订单参数列表，每项包含 symbol/side/order_type/amount/price/params
+
+        Returns:
+            List[Optional[OrderData]]: 与输入顺序一致的订单数据，失败的订单为None
+        """
+        raise NotImplementedError(f"{self.config.exchange_id} 不支持批量下单")
+
     @abstractmethod
     async def cancel_order(self, order_id: str, symbol: str) -> OrderData:
         """
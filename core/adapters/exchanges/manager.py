@@ -456,6 +456,13 @@ class ExchangeManager:
         """获取所有适配器实例"""
         return self._adapters.copy()
 
+    def get_connected_adapter(self, exchange_id: str) -> Optional[ExchangeInterface]:
+        """获取单个已连接的适配器（未注册或未连接时返回None）"""
+        adapter = self._adapters.get(exchange_id)
+        if adapter is not None and self._check_adapter_connected(adapter):
+            return adapter
+        return None
+
     def get_connected_adapters(self) -> Dict[str, ExchangeInterface]:
         """获取已连接的适配器"""
         return {
@@ -513,16 +520,21 @@ class ExchangeManager:
     # === 批量操作 ===
 
     async def connect_all(self) -> Dict[str, bool]:
-        """连接所有交易所"""
+        """连接所有交易所（并发执行，总耗时取决于最慢的交易所）"""
         results = {}
 
-        for exchange_id, adapter in self._adapters.items():
-            try:
-                success = await adapter.connect()
-                results[exchange_id] = success
-            except Exception as e:
-                self.logger.error(f"连接失败 {exchange_id}: {str(e)}")
+        exchange_ids = list(self._adapters.keys())
+        connect_results = await asyncio.gather(
+            *(adapter.connect() for adapter in self._adapters.values()),
+            return_exceptions=True
+        )
+
+        for exchange_id, result in zip(exchange_ids, connect_results):
+            if isinstance(result, Exception):
+                self.logger.error(f"连接失败 {exchange_id}: {str(result)}")
                 results[exchange_id] = False
+            else:
+                results[exchange_id] = result
 
         return results
 
@@ -537,6 +549,25 @@ class ExchangeManager:
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
+    async def get_all_positions(self) -> Dict[str, List[Any]]:
+        """并发获取所有交易所的持仓"""
+        results = {}
+
+        exchange_ids = list(self._adapters.keys())
+        position_results = await asyncio.gather(
+            *(adapter.get_positions() for adapter in self._adapters.values()),
+            return_exceptions=True
+        )
+
+        for exchange_id, result in zip(exchange_ids, position_results):
+            if isinstance(result, Exception):
+                self.logger.error(f"获取持仓失败 {exchange_id}: {str(result)}")
+                results[exchange_id] = []
+            else:
+                results[exchange_id] = result
+
+        return results
+
     async def health_check_all(self) -> Dict[str, Dict[str, Any]]:
         """对所有交易所进行健康检查"""
         results = {}
@@ -5,13 +5,19 @@
 确保不同交易所之间数据格式的统一性和一致性。
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 from decimal import Decimal
 
 
+# 高频创建的模型使用 __slots__（dataclass(slots=True) 需要 Python 3.10+，低版本保持原样）
+DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 class ExchangeType(Enum):
     """交易所类型枚举"""
     SPOT = "spot"                    # 现货交易
@@ -64,7 +70,7 @@ class MarginMode(Enum):
     ISOLATED = "isolated"            # 逐仓模式
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OrderData:
     """订单数据模型"""
     id: str                          # 订单ID
@@ -102,7 +108,7 @@ class OrderData:
             self.average = Decimal(str(self.average))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PositionData:
     """持仓数据模型"""
     symbol: str                      # 交易对
@@ -160,7 +166,7 @@ class PositionData:
                 setattr(self, field_name, Decimal(str(value)))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BalanceData:
     """余额数据模型"""
     currency: str                    # 币种
@@ -183,7 +189,20 @@ class BalanceData:
             self.usd_value = Decimal(str(self.usd_value))
 
 
-@dataclass
+# TickerData.__post_init__ 需要转换的字段（模块加载时构建一次，避免每次实例化重建列表）
+_TICKER_DECIMAL_FIELDS = (
+    'bid', 'ask', 'bid_size', 'ask_size', 'last', 'open', 'high', 'low', 'close',
+    'volume', 'quote_volume', 'change', 'percentage',
+    'funding_rate', 'predicted_funding_rate', 'index_price', 'mark_price', 'oracle_price',
+    'open_interest', 'open_interest_value', 'contract_size', 'tick_size', 'lot_size'
+)
+_TICKER_TIMESTAMP_FIELDS = (
+    'funding_time', 'next_funding_time', 'high_time', 'low_time',
+    'start_time', 'end_time', 'delivery_date'
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TickerData:
     """行情数据模型
 
@@ -261,14 +280,7 @@ class TickerData:
         处理时间戳字段的格式转换。
         """
         # 需要转换为Decimal的价格和数量字段
-        decimal_fields = [
-            'bid', 'ask', 'bid_size', 'ask_size', 'last', 'open', 'high', 'low', 'close',
-            'volume', 'quote_volume', 'change', 'percentage',
-            'funding_rate', 'predicted_funding_rate', 'index_price', 'mark_price', 'oracle_price',
-            'open_interest', 'open_interest_value', 'contract_size', 'tick_size', 'lot_size'
-        ]
-
-        for field_name in decimal_fields:
+        for field_name in _TICKER_DECIMAL_FIELDS:
             value = getattr(self, field_name)
             if value is not None and isinstance(value, (int, float, str)):
                 try:
@@ -278,12 +290,7 @@ class TickerData:
                     setattr(self, field_name, None)
 
         # 处理时间戳字段的转换（从毫秒时间戳转换为datetime）
-        timestamp_fields = [
-            'funding_time', 'next_funding_time', 'high_time', 'low_time',
-            'start_time', 'end_time', 'delivery_date'
-        ]
-
-        for field_name in timestamp_fields:
+        for field_name in _TICKER_TIMESTAMP_FIELDS:
             value = getattr(self, field_name)
             if value is not None and isinstance(value, (int, float, str)):
                 try:
@@ -333,7 +340,8 @@ class TickerData:
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式，方便序列化"""
         result = {}
-        for field_name, field_value in self.__dict__.items():
+        for field_name in _TICKER_FIELD_NAMES:
+            field_value = getattr(self, field_name)
             if isinstance(field_value, Decimal):
                 result[field_name] = float(field_value)
             elif isinstance(field_value, datetime):
@@ -343,7 +351,11 @@ class TickerData:
         return result
 
 
-@dataclass
+# TickerData.to_dict 遍历的字段名（按声明顺序，slots 实例没有 __dict__）
+_TICKER_FIELD_NAMES = tuple(f.name for f in fields(TickerData))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class OHLCVData:
     """OHLCV K线数据模型"""
     symbol: str                      # 交易对
@@ -368,7 +380,7 @@ class OHLCVData:
                 setattr(self, field_name, Decimal(str(value)))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OrderBookLevel:
     """订单簿层级数据"""
     price: Decimal                   # 价格
@@ -383,7 +395,7 @@ class OrderBookLevel:
             self.size = Decimal(str(self.size))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OrderBookData:
     """订单簿数据模型"""
     symbol: str                      # 交易对
@@ -472,6 +484,14 @@ def ensure_decimal(value: Any) -> Decimal:
     return Decimal(str(value))
 
 
+@lru_cache(maxsize=64)
+def get_quantizer(precision: int) -> Decimal:
+    """获取指定小数位数的quantize基准（如 2 -> Decimal('0.01')），结果按精度缓存"""
+    if precision <= 0:
+        return Decimal('1')
+    return Decimal(1).scaleb(-precision)
+
+
 def format_decimal(value: Decimal, precision: int) -> str:
     """格式化Decimal为指定精度的字符串"""
     if precision == 0:
@@ -1,7 +1,7 @@
 """
 交易所适配器工具模块
 
-提供日志优化、格式化等工具函数
+提供日志优化、格式化、并发控制、重试退避等工具函数
 """
 
 from .setup_logging import (
@@ -19,6 +19,18 @@ from .log_formatter import (
     ColoredFormatter,
 )
 
+from .concurrency import (
+    DEFAULT_CONCURRENCY_LIMIT,
+    gather_limited,
+)
+
+from .retry import (
+    MAX_RETRY_DELAY,
+    RETRY_JITTER,
+    is_retryable_error,
+    compute_retry_delay,
+)
+
 __all__ = [
     # 日志配置
     'LoggingConfig',
@@ -34,4 +46,14 @@ __all__ = [
     'CompactFormatter',
     'DetailedFormatter',
     'ColoredFormatter',
+
+    # 并发控制
+    'DEFAULT_CONCURRENCY_LIMIT',
+    'gather_limited',
+
+    # 重试
+    'MAX_RETRY_DELAY',
+    'RETRY_JITTER',
+    'is_retryable_error',
+    'compute_retry_delay',
 ]
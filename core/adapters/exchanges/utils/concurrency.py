@@ -0,0 +1,36 @@
+"""
+并发控制工具
+
+为按交易对扇出的批量请求提供有上限的并发执行，避免一次性创建过多并发任务
+"""
+
+import asyncio
+from typing import Any, Awaitable, Iterable, List
+
+# 默认最大并发数
+DEFAULT_CONCURRENCY_LIMIT = 20
+
+
+async def gather_limited(
+    aws: Iterable[Awaitable[Any]],
+    limit: int = DEFAULT_CONCURRENCY_LIMIT,
+    return_exceptions: bool = False
+) -> List[Any]:
+    """
+    限制并发数的 asyncio.gather
+
+    Args:
+        aws: 待执行的协程/awaitable
+        limit: 同时执行的最大数量
+        return_exceptions: 与 asyncio.gather 相同，为True时异常作为结果返回
+
+    Returns:
+        与输入顺序一致的结果列表
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_run(aw) for aw in aws), return_exceptions=return_exceptions)
@@ -0,0 +1,73 @@
+"""
+重试工具
+
+REST 调用的重试判定与退避计算：指数退避（有上限）+ 随机抖动，
+参数错误、余额不足、鉴权失败等确定性错误不重试
+"""
+
+import random
+
+# 单次退避等待上限与随机抖动幅度（秒）
+MAX_RETRY_DELAY = 5.0
+RETRY_JITTER = 0.1
+
+# 可重试的异常类型名：ccxt 的 NetworkError（含 InvalidNonce、RequestTimeout、
+# ExchangeNotAvailable、DDoSProtection 等子类）、aiohttp 客户端错误、超时/连接错误、
+# 响应不是合法JSON
+RETRYABLE_ERROR_TYPES = frozenset({
+    'NetworkError', 'ClientError', 'TimeoutError', 'ConnectionError',
+    'JSONDecodeError'
+})
+
+# 不可重试的异常类型名（含 ccxt 的确定性错误，按类名匹配以免引入 ccxt 依赖）
+NON_RETRYABLE_ERROR_TYPES = frozenset({
+    'ValueError', 'TypeError', 'KeyError', 'NotImplementedError',
+    'AuthenticationError', 'PermissionDenied', 'AccountSuspended',
+    'InsufficientFunds', 'InvalidOrder', 'OrderNotFound', 'BadRequest',
+    'BadSymbol', 'ArgumentsRequired', 'NotSupported'
+})
+
+# 异常类型无法判定时使用的错误关键字（余额不足、鉴权失败、交易对/订单参数无效等）
+NON_RETRYABLE_ERRORS = (
+    'insufficient', 'unauthorized', 'forbidden', 'invalid signature',
+    'invalid api', 'invalid symbol', 'invalid order', 'not supported'
+)
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    判断错误是否值得重试（网络/超时/5xx等临时性错误）
+
+    先按异常类型判定（继承链上最具体的已知类型优先），
+    类型未知时再匹配错误信息中的关键字。
+
+    Args:
+        error: 发生的异常
+
+    Returns:
+        bool: 是否重试
+    """
+    for cls in type(error).__mro__:
+        name = cls.__name__
+        if name in RETRYABLE_ERROR_TYPES:
+            return True
+        if name in NON_RETRYABLE_ERROR_TYPES:
+            return False
+
+    error_str = str(error).lower()
+    return not any(err in error_str for err in NON_RETRYABLE_ERRORS)
+
+
+def compute_retry_delay(base_delay: float, attempt: int) -> float:
+    """
+    计算第 attempt 次失败后的等待时间（从0开始计数）
+
+    Args:
+        base_delay: 基础等待时间（秒）
+        attempt: 已失败的尝试序号
+
+    Returns:
+        float: 指数退避（不超过 MAX_RETRY_DELAY）加随机抖动后的等待秒数
+    """
+    delay = min(base_delay * (1 << attempt), MAX_RETRY_DELAY)
+    return delay + random.random() * RETRY_JITTER
@@ -5,7 +5,8 @@
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Callable, Set
+import time
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -46,6 +47,9 @@ class MarketSnapshot:
 class DataAggregator:
     """数据聚合器 - 使用依赖注入的ExchangeManager和简化的事件处理"""
     
+    # 重复ticker去重窗口（秒）：窗口内内容相同的ticker不再重复分发给回调和事件
+    TICKER_DEDUP_TTL = 0.05
+    
     @inject
     def __init__(self, exchange_manager: ExchangeManager, event_handler: EventHandler, symbol_cache_service: ISymbolCacheService):
         # 使用统一日志入口 - 数据专用日志器
@@ -64,6 +68,8 @@ class DataAggregator:
         self.orderbook_data: Dict[str, Dict[str, OrderBookData]] = {}  # symbol -> {exchange: OrderBookData}
         # 🔥 新增：trades数据存储
         self.trades_data: Dict[str, Dict[str, List[TradeData]]] = {}  # symbol -> {exchange: List[TradeData]}
+        # ticker分发去重：(symbol, exchange) -> (内容签名, 上次分发的单调时间)
+        self._ticker_dispatch_cache: Dict[Tuple[str, str], Tuple[tuple, float]] = {}
         
         # 订阅管理
         self.subscribed_symbols: Set[str] = set()
@@ -81,6 +87,11 @@ class DataAggregator:
             DataType.TRADES: [],
             DataType.USER_DATA: []
         }
+        # 热路径直接引用各类型回调列表（与 data_callbacks 中为同一列表对象），省去每次事件的字典查找
+        self._ticker_callbacks = self.data_callbacks[DataType.TICKER]
+        self._orderbook_callbacks = self.data_callbacks[DataType.ORDERBOOK]
+        self._trades_callbacks = self.data_callbacks[DataType.TRADES]
+        self._user_data_callbacks = self.data_callbacks[DataType.USER_DATA]
         
         # 状态
         self.is_running = False
@@ -385,13 +396,10 @@ class DataAggregator:
     async def _handle_ticker_data(self, exchange_name: str, symbol: str, ticker_data: TickerData) -> None:
         """处理ticker数据 - 直接转发原始数据"""
         try:
-            # 记录接收时间
-            received_time = datetime.now()
-            ticker_data.received_timestamp = received_time
-            
-            # 记录处理时间
-            processed_time = datetime.now()
-            ticker_data.processed_timestamp = processed_time
+            # 接收/处理/发送时间共用一次时间戳（同一消息内的间隔可忽略）
+            now = datetime.now()
+            ticker_data.received_timestamp = now
+            ticker_data.processed_timestamp = now
             
             # 更新内部存储（使用原始符号）
             if symbol not in self.ticker_data:
@@ -399,41 +407,59 @@ class DataAggregator:
             self.ticker_data[symbol][exchange_name] = ticker_data
             
             # 更新市场快照
-            self._update_market_snapshot(symbol, exchange_name, 'ticker', ticker_data)
+            self._update_market_snapshot(symbol, exchange_name, 'ticker', ticker_data, now)
+            
+            # 去重窗口内的重复ticker只更新存储，不重复分发
+            if self._is_duplicate_ticker(symbol, exchange_name, ticker_data):
+                return
             
             # 记录发送时间
-            sent_time = datetime.now()
+            sent_time = now
             ticker_data.sent_timestamp = sent_time
             
-            # 创建聚合数据
-            aggregated_data = AggregatedData(
-                exchange=exchange_name,
-                symbol=symbol,  # 发送原始符号
-                data_type=DataType.TICKER,
-                data=ticker_data,
-                timestamp=sent_time
-            )
-            
-            # 调用回调函数
-            for callback in self.data_callbacks[DataType.TICKER]:
-                await self._safe_callback(callback, aggregated_data)
+            # 调用回调函数（无回调时不创建聚合数据）
+            callbacks = self._ticker_callbacks
+            if callbacks:
+                aggregated_data = AggregatedData(
+                    exchange=exchange_name,
+                    symbol=symbol,  # 发送原始符号
+                    data_type=DataType.TICKER,
+                    data=ticker_data,
+                    timestamp=sent_time
+                )
+                for callback in callbacks:
+                    await self._safe_callback(callback, aggregated_data)
                 
-            # 发送事件（简化版本）
-            await self._publish_ticker_event(symbol, exchange_name, ticker_data)
+            # 发送事件（入队后立即返回，不等待订阅者回调）
+            self._publish_ticker_event(symbol, exchange_name, ticker_data)
             
         except Exception as e:
             self.logger.error(f"处理ticker数据时出错: {e}")
     
+    def _is_duplicate_ticker(self, symbol: str, exchange_name: str, ticker_data: TickerData) -> bool:
+        """判断ticker是否与去重窗口内上一次分发的内容相同（不同则记录为最新分发）"""
+        key = (symbol, exchange_name)
+        signature = (
+            ticker_data.timestamp,
+            ticker_data.bid,
+            ticker_data.ask,
+            ticker_data.last,
+            ticker_data.funding_rate
+        )
+        now = time.monotonic()
+        cached = self._ticker_dispatch_cache.get(key)
+        if cached is not None and cached[0] == signature and now - cached[1] < self.TICKER_DEDUP_TTL:
+            return True
+        self._ticker_dispatch_cache[key] = (signature, now)
+        return False
+    
     async def _handle_orderbook_data(self, exchange_name: str, symbol: str, orderbook_data: OrderBookData) -> None:
         """处理orderbook数据 - 直接转发原始数据"""
         try:
-            # 记录接收时间
-            received_time = datetime.now()
-            orderbook_data.received_timestamp = received_time
-            
-            # 记录处理时间
-            processed_time = datetime.now()
-            orderbook_data.processed_timestamp = processed_time
+            # 接收/处理/发送时间共用一次时间戳（同一消息内的间隔可忽略）
+            now = datetime.now()
+            orderbook_data.received_timestamp = now
+            orderbook_data.processed_timestamp = now
             
             # 更新内部存储（使用原始符号）
             if symbol not in self.orderbook_data:
@@ -441,27 +467,27 @@ class DataAggregator:
             self.orderbook_data[symbol][exchange_name] = orderbook_data
             
             # 更新市场快照
-            self._update_market_snapshot(symbol, exchange_name, 'orderbook', orderbook_data)
+            self._update_market_snapshot(symbol, exchange_name, 'orderbook', orderbook_data, now)
             
             # 记录发送时间
-            sent_time = datetime.now()
+            sent_time = now
             orderbook_data.sent_timestamp = sent_time
             
-            # 创建聚合数据
-            aggregated_data = AggregatedData(
-                exchange=exchange_name,
-                symbol=symbol,  # 发送原始符号
-                data_type=DataType.ORDERBOOK,
-                data=orderbook_data,
-                timestamp=sent_time
-            )
-            
-            # 调用回调函数
-            for callback in self.data_callbacks[DataType.ORDERBOOK]:
-                await self._safe_callback(callback, aggregated_data)
+            # 调用回调函数（无回调时不创建聚合数据）
+            callbacks = self._orderbook_callbacks
+            if callbacks:
+                aggregated_data = AggregatedData(
+                    exchange=exchange_name,
+                    symbol=symbol,  # 发送原始符号
+                    data_type=DataType.ORDERBOOK,
+                    data=orderbook_data,
+                    timestamp=sent_time
+                )
+                for callback in callbacks:
+                    await self._safe_callback(callback, aggregated_data)
                 
-            # 发送事件（简化版本）
-            await self._publish_orderbook_event(symbol, exchange_name, orderbook_data)
+            # 发送事件（入队后立即返回，不等待订阅者回调）
+            self._publish_orderbook_event(symbol, exchange_name, orderbook_data)
             
         except Exception as e:
             self.logger.error(f"处理orderbook数据时出错: {e}")
@@ -469,13 +495,10 @@ class DataAggregator:
     async def _handle_trades_data(self, exchange_name: str, symbol: str, trade_data: TradeData) -> None:
         """处理trades数据 - 直接转发原始数据"""
         try:
-            # 记录接收时间
-            received_time = datetime.now()
-            trade_data.received_timestamp = received_time
-            
-            # 记录处理时间
-            processed_time = datetime.now()
-            trade_data.processed_timestamp = processed_time
+            # 接收/处理/发送时间共用一次时间戳（同一消息内的间隔可忽略）
+            now = datetime.now()
+            trade_data.received_timestamp = now
+            trade_data.processed_timestamp = now
             
             # 🔥 新增：更新内部存储（使用原始符号）
             if symbol not in self.trades_data:
@@ -489,27 +512,27 @@ class DataAggregator:
                 self.trades_data[symbol][exchange_name] = self.trades_data[symbol][exchange_name][-100:]
             
             # 更新市场快照
-            self._update_market_snapshot(symbol, exchange_name, 'trades', trade_data)
+            self._update_market_snapshot(symbol, exchange_name, 'trades', trade_data, now)
             
             # 记录发送时间
-            sent_time = datetime.now()
+            sent_time = now
             trade_data.sent_timestamp = sent_time
             
-            # 创建聚合数据
-            aggregated_data = AggregatedData(
-                exchange=exchange_name,
-                symbol=symbol,  # 发送原始符号
-                data_type=DataType.TRADES,
-                data=trade_data,
-                timestamp=sent_time
-            )
-            
-            # 调用回调函数
-            for callback in self.data_callbacks[DataType.TRADES]:
-                await self._safe_callback(callback, aggregated_data)
+            # 调用回调函数（无回调时不创建聚合数据）
+            callbacks = self._trades_callbacks
+            if callbacks:
+                aggregated_data = AggregatedData(
+                    exchange=exchange_name,
+                    symbol=symbol,  # 发送原始符号
+                    data_type=DataType.TRADES,
+                    data=trade_data,
+                    timestamp=sent_time
+                )
+                for callback in callbacks:
+                    await self._safe_callback(callback, aggregated_data)
                 
-            # 发送事件（简化版本）
-            await self._publish_trades_event(symbol, exchange_name, trade_data)
+            # 发送事件（入队后立即返回，不等待订阅者回调）
+            self._publish_trades_event(symbol, exchange_name, trade_data)
             
         except Exception as e:
             self.logger.error(f"处理trades数据时出错: {e}")
@@ -517,33 +540,31 @@ class DataAggregator:
     async def _handle_user_data(self, exchange_name: str, user_data: Dict[str, Any]) -> None:
         """处理user_data数据 - 直接转发原始数据"""
         try:
-            # 记录接收时间
-            received_time = datetime.now()
-            user_data['received_timestamp'] = received_time.isoformat()
-            
-            # 记录处理时间
-            processed_time = datetime.now()
-            user_data['processed_timestamp'] = processed_time.isoformat()
+            # 接收/处理/发送时间共用一次时间戳
+            now = datetime.now()
+            now_iso = now.isoformat()
+            user_data['received_timestamp'] = now_iso
+            user_data['processed_timestamp'] = now_iso
             
             # 更新市场快照
-            self._update_market_snapshot("", exchange_name, 'user_data', user_data)
+            self._update_market_snapshot("", exchange_name, 'user_data', user_data, now)
             
             # 记录发送时间
-            sent_time = datetime.now()
-            user_data['sent_timestamp'] = sent_time.isoformat()
-            
-            # 创建聚合数据
-            aggregated_data = AggregatedData(
-                exchange=exchange_name,
-                symbol="",  # user_data不需要symbol
-                data_type=DataType.USER_DATA,
-                data=user_data,
-                timestamp=sent_time
-            )
-            
-            # 调用回调函数
-            for callback in self.data_callbacks[DataType.USER_DATA]:
-                await self._safe_callback(callback, aggregated_data)
+            sent_time = now
+            user_data['sent_timestamp'] = now_iso
+            
+            # 调用回调函数（无回调时不创建聚合数据）
+            callbacks = self._user_data_callbacks
+            if callbacks:
+                aggregated_data = AggregatedData(
+                    exchange=exchange_name,
+                    symbol="",  # user_data不需要symbol
+                    data_type=DataType.USER_DATA,
+                    data=user_data,
+                    timestamp=sent_time
+                )
+                for callback in callbacks:
+                    await self._safe_callback(callback, aggregated_data)
                 
             # 发送事件（简化版本）
             await self._publish_user_data_event(exchange_name, user_data)
@@ -551,96 +572,97 @@ class DataAggregator:
         except Exception as e:
             self.logger.error(f"处理user_data数据时出错: {e}")
     
-    async def _publish_ticker_event(self, symbol: str, exchange_name: str, ticker_data: TickerData) -> None:
+    def _publish_ticker_event(self, symbol: str, exchange_name: str, ticker_data: TickerData) -> None:
         """发布ticker事件 - 使用简化的事件处理器"""
-        try:
-            # 创建ticker事件数据
-            event_data = {
-                'event_type': 'ticker_updated',
-                'symbol': symbol,
-                'exchange': exchange_name,
-                'bid': float(ticker_data.bid or 0),
-                'ask': float(ticker_data.ask or 0),
-                'last': float(ticker_data.last or 0),
-                'volume': float(ticker_data.volume or 0),
-                'high': float(ticker_data.high or 0),
-                'low': float(ticker_data.low or 0),
-                'open_price': float(ticker_data.open or 0),
-                'close_price': float(ticker_data.close or 0),
-                'change': float(ticker_data.change or 0),
-                'percentage': float(ticker_data.percentage or 0),
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # 发布事件
-            await self.event_handler.publish('ticker_updated', event_data)
-            
-        except Exception as e:
-            self.logger.warning(f"发布ticker事件失败: {e}")
+        # 无订阅者时跳过事件数据构建
+        if not self.event_handler.has_subscribers('ticker_updated'):
+            return
+        
+        # 创建ticker事件数据
+        event_data = {
+            'event_type': 'ticker_updated',
+            'symbol': symbol,
+            'exchange': exchange_name,
+            'bid': float(ticker_data.bid or 0),
+            'ask': float(ticker_data.ask or 0),
+            'last': float(ticker_data.last or 0),
+            'volume': float(ticker_data.volume or 0),
+            'high': float(ticker_data.high or 0),
+            'low': float(ticker_data.low or 0),
+            'open_price': float(ticker_data.open or 0),
+            'close_price': float(ticker_data.close or 0),
+            'change': float(ticker_data.change or 0),
+            'percentage': float(ticker_data.percentage or 0),
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        # 发布事件
+        self.event_handler.publish_nowait('ticker_updated', event_data)
     
-    async def _publish_orderbook_event(self, symbol: str, exchange_name: str, orderbook_data: OrderBookData) -> None:
+    def _publish_orderbook_event(self, symbol: str, exchange_name: str, orderbook_data: OrderBookData) -> None:
         """发布orderbook事件 - 使用简化的事件处理器"""
-        try:
-            # 转换订单簿数据格式
-            bids_data = [[float(level.price), float(level.size)] for level in orderbook_data.bids]
-            asks_data = [[float(level.price), float(level.size)] for level in orderbook_data.asks]
-            
-            # 创建orderbook事件数据
-            event_data = {
-                'event_type': 'orderbook_updated',
-                'symbol': symbol,
-                'exchange': exchange_name,
-                'bids': bids_data,
-                'asks': asks_data,
-                'sequence': orderbook_data.nonce,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # 发布事件
-            await self.event_handler.publish('orderbook_updated', event_data)
-            
-        except Exception as e:
-            self.logger.warning(f"发布orderbook事件失败: {e}")
+        # 无订阅者时跳过事件数据构建
+        if not self.event_handler.has_subscribers('orderbook_updated'):
+            return
+        
+        # 转换订单簿数据格式
+        bids_data = [[float(level.price), float(level.size)] for level in orderbook_data.bids]
+        asks_data = [[float(level.price), float(level.size)] for level in orderbook_data.asks]
+        
+        # 创建orderbook事件数据
+        event_data = {
+            'event_type': 'orderbook_updated',
+            'symbol': symbol,
+            'exchange': exchange_name,
+            'bids': bids_data,
+            'asks': asks_data,
+            'sequence': orderbook_data.nonce,
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        # 发布事件
+        self.event_handler.publish_nowait('orderbook_updated', event_data)
     
-    async def _publish_trades_event(self, symbol: str, exchange_name: str, trade_data: TradeData) -> None:
+    def _publish_trades_event(self, symbol: str, exchange_name: str, trade_data: TradeData) -> None:
         """发布trades事件 - 使用简化的事件处理器"""
-        try:
-            # 创建trades事件数据
-            event_data = {
-                'event_type': 'trades_updated',
-                'symbol': symbol,
-                'exchange': exchange_name,
-                'price': float(trade_data.price or 0),
-                'quantity': float(trade_data.quantity or 0),
-                'side': trade_data.side.value if trade_data.side else 'unknown',
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # 发布事件
-            await self.event_handler.publish('trades_updated', event_data)
-            
-        except Exception as e:
-            self.logger.warning(f"发布trades事件失败: {e}")
+        # 无订阅者时跳过事件数据构建
+        if not self.event_handler.has_subscribers('trades_updated'):
+            return
+        
+        # 创建trades事件数据
+        event_data = {
+            'event_type': 'trades_updated',
+            'symbol': symbol,
+            'exchange': exchange_name,
+            'price': float(trade_data.price or 0),
+            'quantity': float(trade_data.amount or 0),
+            'side': trade_data.side.value if trade_data.side else 'unknown',
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        # 发布事件
+        self.event_handler.publish_nowait('trades_updated', event_data)
     
     async def _publish_user_data_event(self, exchange_name: str, user_data: Dict[str, Any]) -> None:
         """发布user_data事件 - 使用简化的事件处理器"""
-        try:
-            # 创建user_data事件数据
-            event_data = {
-                'event_type': 'user_data_updated',
-                'exchange': exchange_name,
-                'data': user_data,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # 发布事件
-            await self.event_handler.publish('user_data_updated', event_data)
-            
-        except Exception as e:
-            self.logger.warning(f"发布user_data事件失败: {e}")
+        # 无订阅者时跳过事件数据构建
+        if not self.event_handler.has_subscribers('user_data_updated'):
+            return
+        
+        # 创建user_data事件数据
+        event_data = {
+            'event_type': 'user_data_updated',
+            'exchange': exchange_name,
+            'data': user_data,
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        # 发布事件
+        await self.event_handler.publish('user_data_updated', event_data)
     
-    def _update_market_snapshot(self, symbol: str, exchange_name: str, data_type: str, data: Any) -> None:
-        """更新市场快照"""
+    def _update_market_snapshot(self, symbol: str, exchange_name: str, data_type: str, data: Any,
+                                now: Optional[datetime] = None) -> None:
+        """更新市场快照（now 由调用方传入，避免重复获取时间）"""
         if symbol not in self.market_snapshots:
             self.market_snapshots[symbol] = MarketSnapshot(symbol=symbol)
             
@@ -649,7 +671,7 @@ class DataAggregator:
             snapshot.exchange_data[exchange_name] = {}
             
         snapshot.exchange_data[exchange_name][data_type] = data
-        snapshot.last_update = datetime.now()
+        snapshot.last_update = now or datetime.now()
     
     def register_data_callback(self, data_type: DataType, callback: Callable[[AggregatedData], None]) -> None:
         """注册数据回调"""
@@ -729,6 +751,7 @@ class DataAggregator:
             # 清空数据
             self.market_snapshots.clear()
             self.ticker_data.clear()
+            self._ticker_dispatch_cache.clear()
             self.orderbook_data.clear()
             self.trades_data.clear()  # 🔥 新增：清理trades数据
             self.subscribed_symbols.clear()
@@ -777,15 +800,13 @@ class DataAggregator:
     async def subscribe_ticker(self, exchange_id: str, symbols: List[str]) -> bool:
         """订阅单个交易所的ticker数据"""
         try:
-            # 从ExchangeManager获取适配器
-            connected_adapters = self.exchange_manager.get_connected_adapters()
+            # 从ExchangeManager获取适配器（只检查目标交易所）
+            adapter = self.exchange_manager.get_connected_adapter(exchange_id)
             
-            if exchange_id not in connected_adapters:
+            if adapter is None:
                 self.logger.error(f"未找到交易所: {exchange_id}")
                 return False
             
-            adapter = connected_adapters[exchange_id]
-            
             # 创建ticker回调
             async def ticker_callback(symbol: str, ticker_data: TickerData):
                 await self._handle_ticker_data(exchange_id, symbol, ticker_data)
@@ -818,15 +839,13 @@ class DataAggregator:
     async def subscribe_orderbook(self, exchange_id: str, symbols: List[str]) -> bool:
         """订阅单个交易所的orderbook数据"""
         try:
-            # 从ExchangeManager获取适配器
-            connected_adapters = self.exchange_manager.get_connected_adapters()
+            # 从ExchangeManager获取适配器（只检查目标交易所）
+            adapter = self.exchange_manager.get_connected_adapter(exchange_id)
             
-            if exchange_id not in connected_adapters:
+            if adapter is None:
                 self.logger.error(f"未找到交易所: {exchange_id}")
                 return False
             
-            adapter = connected_adapters[exchange_id]
-            
             # 创建orderbook回调
             async def orderbook_callback(symbol: str, orderbook_data: OrderBookData):
                 await self._handle_orderbook_data(exchange_id, symbol, orderbook_data)
@@ -859,18 +878,16 @@ class DataAggregator:
     async def unsubscribe_ticker(self, exchange_id: str, symbols: List[str]) -> bool:
         """取消订阅ticker数据"""
         try:
-            # 从ExchangeManager获取适配器
-            connected_adapters = self.exchange_manager.get_connected_adapters()
+            # 从ExchangeManager获取适配器（只检查目标交易所）
+            adapter = self.exchange_manager.get_connected_adapter(exchange_id)
             
-            if exchange_id not in connected_adapters:
+            if adapter is None:
                 self.logger.error(f"未找到交易所: {exchange_id}")
                 return False
             
-            adapter = connected_adapters[exchange_id]
-            
             # 取消订阅
-            for symbol in symbols:
-                if hasattr(adapter, 'unsubscribe'):
+            if hasattr(adapter, 'unsubscribe'):
+                for symbol in symbols:
                     await adapter.unsubscribe(symbol)
             
             # 更新订阅状态
@@ -886,18 +903,16 @@ class DataAggregator:
     async def unsubscribe_orderbook(self, exchange_id: str, symbols: List[str]) -> bool:
         """取消订阅orderbook数据"""
         try:
-            # 从ExchangeManager获取适配器
-            connected_adapters = self.exchange_manager.get_connected_adapters()
+            # 从ExchangeManager获取适配器（只检查目标交易所）
+            adapter = self.exchange_manager.get_connected_adapter(exchange_id)
             
-            if exchange_id not in connected_adapters:
+            if adapter is None:
                 self.logger.error(f"未找到交易所: {exchange_id}")
                 return False
             
-            adapter = connected_adapters[exchange_id]
-            
             # 取消订阅
-            for symbol in symbols:
-                if hasattr(adapter, 'unsubscribe'):
+            if hasattr(adapter, 'unsubscribe'):
+                for symbol in symbols:
                     await adapter.unsubscribe(symbol)
             
             # 更新订阅状态
@@ -5,13 +5,19 @@
 
 import yaml
 import os
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 优先使用 libyaml 的C实现解析器，未编译libyaml时回退到纯Python实现
+try:
+    _YamlSafeLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlSafeLoader = yaml.SafeLoader
+
 @dataclass
 class ExchangeConfig:
     """交易所配置"""
@@ -53,14 +59,27 @@ class ConfigManager:
         self.config_dir = Path(config_dir)
         self.monitoring_config: Optional[MonitoringConfig] = None
         self.exchange_configs: Dict[str, ExchangeConfig] = {}
+        # 已解析的YAML缓存：路径 -> (文件修改时间, 解析结果)，文件变化时自动失效
+        self._yaml_cache: Dict[Path, Tuple[int, Any]] = {}
+    
+    def _load_yaml(self, config_path: Path) -> Any:
+        """读取并解析YAML文件（文件未修改时直接返回缓存的解析结果，调用方不应修改返回值）"""
+        mtime = config_path.stat().st_mtime_ns
+        cached = self._yaml_cache.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config_data = yaml.load(file, Loader=_YamlSafeLoader)
+        self._yaml_cache[config_path] = (mtime, config_data)
+        return config_data
         
     def load_monitoring_config(self) -> MonitoringConfig:
         """加载全局监控配置"""
         config_path = self.config_dir / "monitoring" / "monitoring.yaml"
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                config_data = yaml.safe_load(file)
+            config_data = self._load_yaml(config_path)
                 
             self.monitoring_config = MonitoringConfig(
                 enabled=config_data.get('enabled', True),
@@ -98,8 +117,7 @@ class ConfigManager:
         config_path = self.config_dir / "exchanges" / config_filename
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                config_data = yaml.safe_load(file)
+            config_data = self._load_yaml(config_path)
             
             # 🔥 适配现有的复杂配置格式
             exchange_data = config_data.get(exchange_name, {})
@@ -0,0 +1,24 @@
+"""
+事件循环配置
+入口脚本在 asyncio.run 之前调用，使用 uvloop 缩短回调调度延迟
+"""
+
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """
+    安装 uvloop 事件循环策略
+
+    uvloop 在 Linux/macOS 上是必需依赖；Windows 不支持 uvloop，
+    导入失败时保持 asyncio 默认事件循环。
+
+    Returns:
+        bool: 是否已启用 uvloop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
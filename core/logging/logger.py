@@ -84,30 +84,37 @@ class BaseLogger:
         file_handler.setFormatter(file_formatter)
         self.logger.addHandler(file_handler)
 
-    def debug(self, message: str, **kwargs):
+    def isEnabledFor(self, level: int) -> bool:
+        """是否启用指定级别（用于热路径跳过日志参数的构造）"""
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level: int, message: str, args: tuple, kwargs: dict):
+        """统一输出：级别未启用时直接返回，args 按 % 格式延迟格式化"""
+        if not self.logger.isEnabledFor(level):
+            return
+        if kwargs:
+            message = f"{message} | {self._format_extra(**kwargs)}"
+        self.logger.log(level, message, *args, stacklevel=3)
+
+    def debug(self, message: str, *args, **kwargs):
         """调试日志"""
-        extra_info = f" | {self._format_extra(**kwargs)}" if kwargs else ""
-        self.logger.debug(f"{message}{extra_info}")
+        self._log(logging.DEBUG, message, args, kwargs)
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """信息日志"""
-        extra_info = f" | {self._format_extra(**kwargs)}" if kwargs else ""
-        self.logger.info(f"{message}{extra_info}")
+        self._log(logging.INFO, message, args, kwargs)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """警告日志"""
-        extra_info = f" | {self._format_extra(**kwargs)}" if kwargs else ""
-        self.logger.warning(f"{message}{extra_info}")
+        self._log(logging.WARNING, message, args, kwargs)
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """错误日志"""
-        extra_info = f" | {self._format_extra(**kwargs)}" if kwargs else ""
-        self.logger.error(f"{message}{extra_info}")
+        self._log(logging.ERROR, message, args, kwargs)
 
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """严重错误日志"""
-        extra_info = f" | {self._format_extra(**kwargs)}" if kwargs else ""
-        self.logger.critical(f"{message}{extra_info}")
+        self._log(logging.CRITICAL, message, args, kwargs)
 
     def _format_extra(self, **kwargs) -> str:
         """格式化额外信息"""
@@ -170,7 +177,7 @@ class DataLogger(BaseLogger):
 
     def price_update(self, exchange: str, symbol: str, bid: float, ask: float, **kwargs):
         """记录价格更新"""
-        self.debug(f"📊 价格更新: {exchange} {symbol} bid:{bid} ask:{ask}",
+        self.debug("📊 价格更新: %s %s bid:%s ask:%s", exchange, symbol, bid, ask,
                    exchange=exchange, symbol=symbol, bid=bid, ask=ask, **kwargs)
 
     def websocket_connected(self, exchange: str, **kwargs):
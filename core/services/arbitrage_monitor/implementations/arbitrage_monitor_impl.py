@@ -6,6 +6,7 @@
 
 import asyncio
 import logging
+import time
 from decimal import Decimal
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -25,6 +26,20 @@ from ..models.arbitrage_models import (
 from ..utils.symbol_converter import SimpleSymbolConverter
 
 
+_HUNDRED = Decimal("100")
+
+# ticker 价格合理性阈值（模块加载时构建，避免每个 tick 重新创建 Decimal）
+_MAX_VALID_PRICE = Decimal("1000000000")
+_MIN_VALID_PRICE = Decimal("0.0001")
+# 主流币种价格合理范围：symbol -> (下限, 上限, 币种名)
+_PRICE_SANITY_RANGES = {
+    'BTC-USDC-PERP': (Decimal("10000"), Decimal("200000"), 'BTC'),
+    'BTC-USD-PERP': (Decimal("10000"), Decimal("200000"), 'BTC'),
+    'ETH-USDC-PERP': (Decimal("500"), Decimal("10000"), 'ETH'),
+    'ETH-USD-PERP': (Decimal("500"), Decimal("10000"), 'ETH'),
+}
+
+
 class ArbitrageMonitorService(IArbitrageMonitorService):
     """套利监控服务实现"""
     
@@ -66,7 +81,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
         self.opportunity_callbacks = []
         
         # 🔥 WebSocket连接监控（新增 - 解决数据停止更新问题）
-        self.last_data_time: Dict[str, Dict[str, datetime]] = defaultdict(dict)  # {exchange: {symbol: 最后更新时间}}
+        self.last_data_time: Dict[str, Dict[str, float]] = defaultdict(dict)  # {exchange: {symbol: 最后更新时间（time.monotonic()）}}
         self.data_timeout_seconds = 90  # 🔧 数据超时阈值（90秒，平衡灵敏度和稳定性）
         self.connection_monitor_task = None  # 连接监控任务
         self.connection_check_interval = 45  # 🔧 连接检查间隔（45秒，更及时发现问题）
@@ -238,8 +253,11 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                                 self.logger.error(f"⚠️  未知的回调参数格式: {len(args)} 个参数")
                                 return
                             
-                            # 调用统一的处理函数
-                            self._on_ticker_update(ex, std_symbol, ticker)
+                            # 调用统一的处理函数（回调边界统一捕获异常）
+                            try:
+                                self._on_ticker_update(ex, std_symbol, ticker)
+                            except Exception as e:
+                                self.logger.error(f"❌ {ex} 回调处理失败 ({std_symbol}): {e}", exc_info=True)
                         return callback_wrapper
                     
                     # 订阅ticker数据（使用包装后的回调）
@@ -267,7 +285,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
             return
         
         # 🔥 记录数据更新时间（新增 - 用于连接健康检查）
-        self.last_data_time[exchange][symbol] = datetime.now()
+        self.last_data_time[exchange][symbol] = time.monotonic()
         
         # 重置重连计数（数据正常更新说明连接恢复）
         if self.reconnect_attempts[exchange] > 0:
@@ -275,7 +293,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
             self.reconnect_attempts[exchange] = 0
         
         self.ticker_data[exchange][symbol] = ticker
-        self.logger.debug(f"📊 {exchange}.{symbol}: 价格={ticker.last}, 资金费率={ticker.funding_rate}")
+        self.logger.debug("📊 %s.%s: 价格=%s, 资金费率=%s", exchange, symbol, ticker.last, ticker.funding_rate)
     
     def _validate_ticker_data(self, ticker: TickerData, exchange: str, symbol: str) -> bool:
         """
@@ -289,42 +307,34 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
         Returns:
             数据是否有效
         """
-        try:
-            # 1. 价格必须存在且大于 0
-            if ticker.last is None or ticker.last <= 0:
-                self.logger.warning(f"⚠️  {exchange}.{symbol}: 价格无效 (last={ticker.last})")
-                return False
-            
-            # 2. 价格不能异常大（> 10亿）
-            if ticker.last > Decimal("1000000000"):
-                self.logger.warning(f"⚠️  {exchange}.{symbol}: 价格异常大 (last={ticker.last})")
-                return False
-            
-            # 3. 价格不能异常小（< 0.0001）
-            if ticker.last < Decimal("0.0001"):
-                self.logger.warning(f"⚠️  {exchange}.{symbol}: 价格异常小 (last={ticker.last})")
-                return False
-            
-            # 4. 对于主流币种，检查价格范围是否合理
-            if symbol in ['BTC-USDC-PERP', 'BTC-USD-PERP']:
-                # BTC 价格应该在 10,000 ~ 200,000 之间
-                if ticker.last < Decimal("10000") or ticker.last > Decimal("200000"):
-                    self.logger.warning(
-                        f"⚠️  {exchange}.{symbol}: BTC价格超出合理范围 (last={ticker.last})")
-                    return False
-            
-            elif symbol in ['ETH-USDC-PERP', 'ETH-USD-PERP']:
-                # ETH 价格应该在 500 ~ 10,000 之间
-                if ticker.last < Decimal("500") or ticker.last > Decimal("10000"):
-                    self.logger.warning(
-                        f"⚠️  {exchange}.{symbol}: ETH价格超出合理范围 (last={ticker.last})")
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"❌ 验证ticker数据失败 {exchange}.{symbol}: {e}")
+        last = ticker.last
+        
+        # 1. 价格必须存在且大于 0
+        if last is None or last <= 0:
+            self.logger.warning(f"⚠️  {exchange}.{symbol}: 价格无效 (last={last})")
+            return False
+        
+        # 2. 价格不能异常大（> 10亿）
+        if last > _MAX_VALID_PRICE:
+            self.logger.warning(f"⚠️  {exchange}.{symbol}: 价格异常大 (last={last})")
+            return False
+        
+        # 3. 价格不能异常小（< 0.0001）
+        if last < _MIN_VALID_PRICE:
+            self.logger.warning(f"⚠️  {exchange}.{symbol}: 价格异常小 (last={last})")
             return False
+        
+        # 4. 对于主流币种，检查价格范围是否合理
+        #    BTC 应在 10,000 ~ 200,000 之间，ETH 应在 500 ~ 10,000 之间
+        sanity_range = _PRICE_SANITY_RANGES.get(symbol)
+        if sanity_range is not None:
+            low, high, coin = sanity_range
+            if last < low or last > high:
+                self.logger.warning(
+                    f"⚠️  {exchange}.{symbol}: {coin}价格超出合理范围 (last={last})")
+                return False
+        
+        return True
     
     async def _monitor_loop(self):
         """监控循环"""
@@ -338,7 +348,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                 all_opportunities = []
                 
                 for symbol in self.config.symbols:
-                    opportunities = await self._check_arbitrage_opportunity(symbol)
+                    opportunities = self._check_arbitrage_opportunity(symbol)
                     all_opportunities.extend(opportunities)
                 
                 # 更新机会缓存
@@ -360,8 +370,8 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
             except Exception as e:
                 self.logger.error(f"❌ 监控循环错误: {e}", exc_info=True)
     
-    async def _check_arbitrage_opportunity(self, symbol: str) -> List[ArbitrageOpportunity]:
-        """检查单个交易对的套利机会"""
+    def _check_arbitrage_opportunity(self, symbol: str) -> List[ArbitrageOpportunity]:
+        """检查单个交易对的套利机会（纯内存计算，无需await，同步调用避免协程开销）"""
         # 收集所有交易所的价格和资金费率
         prices = {}
         funding_rates = {}
@@ -399,26 +409,30 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
     ) -> List[ArbitrageOpportunity]:
         """识别套利机会"""
         opportunities = []
+        # 同一轮计算共用一个时间戳，避免每个交易所组合都调用 datetime.now()
+        now = datetime.now()
         
         # 1. 价差套利机会
-        price_spreads = self._calculate_price_spreads(symbol, prices)
+        price_spreads = self._calculate_price_spreads(symbol, prices, now)
         for spread in price_spreads:
             if spread.spread_pct >= self.config.price_spread_threshold:
                 opportunities.append(ArbitrageOpportunity(
                     symbol=symbol,
                     opportunity_type="price_spread",
-                    price_spread=spread
+                    price_spread=spread,
+                    detected_at=now
                 ))
         
         # 2. 资金费率套利机会
         if funding_rates:
-            funding_spreads = self._calculate_funding_rate_spreads(symbol, funding_rates)
+            funding_spreads = self._calculate_funding_rate_spreads(symbol, funding_rates, now)
             for spread in funding_spreads:
                 if spread.spread_abs >= self.config.funding_rate_threshold:
                     opportunities.append(ArbitrageOpportunity(
                         symbol=symbol,
                         opportunity_type="funding_rate",
-                        funding_rate_spread=spread
+                        funding_rate_spread=spread,
+                        detected_at=now
                     ))
         
         # 3. 组合套利机会（价差 + 资金费率）
@@ -443,7 +457,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                             rate_low=rate_sell,
                             spread_abs=rate_buy - rate_sell,
                             spread_pct=Decimal("0"),
-                            timestamp=datetime.now()
+                            timestamp=now
                         )
                         
                         # 检查是否都超过阈值
@@ -453,7 +467,8 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                                 symbol=symbol,
                                 opportunity_type="combined",
                                 price_spread=best_price_spread,
-                                funding_rate_spread=funding_spread
+                                funding_rate_spread=funding_spread,
+                                detected_at=now
                             ))
         
         # 按评分降序排列
@@ -464,10 +479,13 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
     def _calculate_price_spreads(
         self,
         symbol: str,
-        prices: Dict[str, Decimal]
+        prices: Dict[str, Decimal],
+        now: Optional[datetime] = None
     ) -> List[PriceSpread]:
         """计算价差"""
         spreads = []
+        if now is None:
+            now = datetime.now()
         
         # 对所有交易所两两组合计算价差
         for exchange1, exchange2 in combinations(prices.keys(), 2):
@@ -492,7 +510,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
             
             # 计算价差
             spread_abs = price_sell - price_buy
-            spread_pct = (spread_abs / price_buy) * Decimal("100")
+            spread_pct = (spread_abs / price_buy) * _HUNDRED
             
             spreads.append(PriceSpread(
                 symbol=symbol,
@@ -502,7 +520,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                 price_sell=price_sell,
                 spread_abs=spread_abs,
                 spread_pct=spread_pct,
-                timestamp=datetime.now()
+                timestamp=now
             ))
         
         # 按价差百分比降序排列
@@ -513,10 +531,13 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
     def _calculate_funding_rate_spreads(
         self,
         symbol: str,
-        funding_rates: Dict[str, Decimal]
+        funding_rates: Dict[str, Decimal],
+        now: Optional[datetime] = None
     ) -> List[FundingRateSpread]:
         """计算资金费率差"""
         spreads = []
+        if now is None:
+            now = datetime.now()
         
         # 对所有交易所两两组合计算费率差
         for exchange1, exchange2 in combinations(funding_rates.keys(), 2):
@@ -540,7 +561,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
             
             # 计算百分比差
             if rate_low != 0:
-                spread_pct = (spread_abs / abs(rate_low)) * Decimal("100")
+                spread_pct = (spread_abs / abs(rate_low)) * _HUNDRED
             else:
                 spread_pct = Decimal("0")
             
@@ -552,7 +573,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                 rate_low=rate_low,
                 spread_abs=spread_abs,
                 spread_pct=spread_pct,
-                timestamp=datetime.now()
+                timestamp=now
             ))
         
         # 按绝对费率差降序排列
@@ -580,6 +601,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
         while self.running:
             try:
                 current_time = datetime.now()
+                now = time.monotonic()  # 数据时效性使用单调时钟
                 
                 # 🔧 启动缓冲期检查
                 elapsed_since_start = (current_time - self.start_time).total_seconds()
@@ -609,7 +631,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                     stale_symbols = []
                     
                     for symbol in self.config.symbols:
-                        if self._is_data_stale(exchange_name, symbol, current_time):
+                        if self._is_data_stale(exchange_name, symbol, now):
                             stale_symbols.append(symbol)
                     
                     # 🔧 只有当大部分符号都超时时才重连（避免误判）
@@ -628,7 +650,7 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                 # 🔧 定期输出健康检查日志（每5分钟一次）
                 time_since_last_log = (current_time - self.last_health_check_log).total_seconds()
                 if time_since_last_log >= self.health_check_log_interval:
-                    self._log_connection_health(current_time)
+                    self._log_connection_health(now)
                     self.last_health_check_log = current_time
                 
                 # 等待下次检查
@@ -641,14 +663,14 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                 self.logger.error(f"❌ 连接监控循环异常: {e}", exc_info=True)
                 await asyncio.sleep(10)  # 出错后等待10秒再继续
     
-    def _is_data_stale(self, exchange: str, symbol: str, current_time: datetime) -> bool:
+    def _is_data_stale(self, exchange: str, symbol: str, now: float) -> bool:
         """
         检查指定交易所和符号的数据是否过期
         
         Args:
             exchange: 交易所名称
             symbol: 交易对符号
-            current_time: 当前时间
+            now: 当前时间（time.monotonic()）
             
         Returns:
             bool: 数据是否过期
@@ -660,19 +682,19 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
             return True
         
         # 计算距离上次更新的时间
-        elapsed = (current_time - last_update).total_seconds()
+        elapsed = now - last_update
         
         # 超过阈值认为过期
         return elapsed > self.data_timeout_seconds
     
-    def _log_connection_health(self, current_time: datetime):
+    def _log_connection_health(self, now: float):
         """
         输出连接健康状态日志
         
         定期输出每个交易所的数据更新情况，帮助用户了解系统状态
         
         Args:
-            current_time: 当前时间
+            now: 当前时间（time.monotonic()）
         """
         self.logger.info("=" * 60)
         self.logger.info("📊 WebSocket 连接健康检查")
@@ -691,9 +713,9 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                     stale_count += 1
                     continue
                 
-                elapsed = (current_time - last_update).total_seconds()
+                elapsed = now - last_update
                 
-                if self._is_data_stale(exchange_name, symbol, current_time):
+                if self._is_data_stale(exchange_name, symbol, now):
                     stale_count += 1
                 
                 # 更新最小/最大时间差
@@ -839,7 +861,10 @@ class ArbitrageMonitorService(IArbitrageMonitorService):
                                     _, ticker = args
                                 else:
                                     return
-                                self._on_ticker_update(ex, std_symbol, ticker)
+                                try:
+                                    self._on_ticker_update(ex, std_symbol, ticker)
+                                except Exception as e:
+                                    self.logger.error(f"❌ {ex} 回调处理失败 ({std_symbol}): {e}", exc_info=True)
                             return callback_wrapper
                         
                         # 重新订阅
@@ -9,6 +9,8 @@ from decimal import Decimal
 from datetime import datetime
 from typing import List, Optional
 
+from core.adapters.exchanges.models import DATACLASS_SLOTS
+
 
 @dataclass
 class ArbitrageConfig:
@@ -36,7 +38,7 @@ class ArbitrageConfig:
     show_funding_rates: bool = True                       # 显示资金费率
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PriceSpread:
     """价差数据"""
     symbol: str                     # 标准化交易对符号（如BTC-USDC-PERP）
@@ -54,7 +56,7 @@ class PriceSpread:
         return int(self.spread_pct * 10000)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FundingRateSpread:
     """资金费率差"""
     symbol: str                     # 标准化交易对符号
@@ -72,7 +74,7 @@ class FundingRateSpread:
         return int(self.spread_abs * 10000)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ArbitrageOpportunity:
     """套利机会"""
     symbol: str                                             # 标准化交易对符号
@@ -4,7 +4,8 @@
 定义新架构中使用的基础事件类型
 """
 
-import uuid
+import itertools
+import secrets
 from datetime import datetime
 from typing import Any, Dict, Optional
 from dataclasses import dataclass, field
@@ -12,6 +13,23 @@ from abc import ABC
 from decimal import Decimal
 
 
+# 事件ID = 进程级随机前缀 + 单调递增序号，避免每个事件都读取系统随机源
+_EVENT_ID_PREFIX = secrets.token_hex(8)
+_event_id_counter = itertools.count()
+
+
+def _new_event_id() -> str:
+    """生成进程内唯一的事件ID"""
+    return f"{_EVENT_ID_PREFIX}-{next(_event_id_counter):012x}"
+
+
+# Event 基类字段（_get_data 中排除，只返回业务数据）
+_EVENT_BASE_FIELDS = frozenset({
+    'event_id', 'event_type', 'timestamp', 'correlation_id',
+    'source', 'source_id', 'priority', 'metadata'
+})
+
+
 @dataclass
 class Event(ABC):
     """
@@ -22,7 +40,7 @@ class Event(ABC):
     """
 
     # 事件元数据
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = field(default_factory=_new_event_id)
     event_type: str = field(init=False)
     timestamp: datetime = field(default_factory=datetime.utcnow)
     correlation_id: Optional[str] = None
@@ -59,12 +77,9 @@ class Event(ABC):
     def _get_data(self) -> Dict[str, Any]:
         """获取事件的业务数据，子类可以重写此方法"""
         # 排除基类字段，只返回业务数据
-        base_fields = {'event_id', 'event_type', 'timestamp', 'correlation_id',
-                       'source', 'source_id', 'priority', 'metadata'}
-
         data = {}
         for key, value in self.__dict__.items():
-            if key not in base_fields:
+            if key not in _EVENT_BASE_FIELDS:
                 # 处理特殊类型的序列化
                 if isinstance(value, Decimal):
                     data[key] = float(value)
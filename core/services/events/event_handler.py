@@ -36,6 +36,11 @@ class EventHandler:
     提供统一的事件发布和订阅机制，支持同步和异步回调
     """
     
+    # publish_nowait 队列容量（满时丢弃最旧的事件）
+    EVENT_QUEUE_MAXSIZE = 10000
+    # 每丢弃多少个事件输出一次告警
+    EVENT_DROP_LOG_INTERVAL = 1000
+    
     def __init__(self, name: str = "EventHandler"):
         self.name = name
         self.logger = get_system_logger()
@@ -49,12 +54,17 @@ class EventHandler:
             'events_published': 0,
             'events_processed': 0,
             'errors': 0,
-            'subscribers': 0
+            'subscribers': 0,
+            'events_dropped': 0
         }
         
         # 异步任务管理
         self._background_tasks: List[asyncio.Task] = []
         
+        # 非阻塞发布队列（首次 publish_nowait 时在事件循环内创建）
+        self._event_queue: Optional[asyncio.Queue] = None
+        self._consumer_task: Optional[asyncio.Task] = None
+        
         self.logger.info(f"事件处理器初始化完成: {name}")
     
     def subscribe(self, event_type: str, callback: Union[EventCallback, AsyncEventCallback], 
@@ -145,9 +155,9 @@ class EventHandler:
                 event_type = event.get('event_type', 'unknown')
                 event_data = event
             elif isinstance(event, Event):
-                # Event类实例
+                # Event类实例（有订阅者时才序列化）
                 event_type = event.event_type
-                event_data = event.to_dict()
+                event_data = None
             else:
                 self.logger.warning(f"不支持的事件类型: {type(event)}")
                 return
@@ -158,6 +168,9 @@ class EventHandler:
                 self.logger.debug(f"没有订阅者的事件: {event_type}")
                 return
             
+            if event_data is None:
+                event_data = event.to_dict()
+            
             # 并发处理所有订阅者
             tasks = []
             for subscription in subscriptions:
@@ -177,6 +190,51 @@ class EventHandler:
             self._stats['errors'] += 1
             self.logger.error(f"发布事件失败: {e}")
     
+    def has_subscribers(self, event_type: str) -> bool:
+        """是否存在该事件类型的订阅者（发布方可据此跳过事件数据的构建）"""
+        return event_type in self._subscriptions
+    
+    def publish_nowait(self, event: Union[Event, Dict[str, Any], str], data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        非阻塞发布事件（需在事件循环中调用）
+        
+        事件进入队列后立即返回，由后台消费任务按顺序调用 publish 分发，
+        发布方不再等待订阅者回调完成。队列满时丢弃最旧的事件，
+        因此只用于可丢弃的行情数据（ticker/orderbook/trades）；
+        订单、成交等不可丢失的事件请使用 publish。
+        
+        Args:
+            event: 事件对象、事件数据字典或事件类型字符串
+            data: 事件数据（当event为字符串时使用）
+        """
+        if self._consumer_task is None or self._consumer_task.done():
+            if self._event_queue is None:
+                self._event_queue = asyncio.Queue(maxsize=self.EVENT_QUEUE_MAXSIZE)
+            self._consumer_task = asyncio.create_task(self._consume_events())
+            self._background_tasks.append(self._consumer_task)
+        
+        queue = self._event_queue
+        if queue.full():
+            queue.get_nowait()
+            queue.task_done()
+            self._stats['events_dropped'] += 1
+            dropped = self._stats['events_dropped']
+            if dropped % self.EVENT_DROP_LOG_INTERVAL == 1:
+                self.logger.warning(
+                    f"⚠️ 事件队列已满({self.EVENT_QUEUE_MAXSIZE})，丢弃最旧事件，累计丢弃 {dropped} 个"
+                )
+        queue.put_nowait((event, data))
+    
+    async def _consume_events(self) -> None:
+        """后台消费 publish_nowait 队列中的事件"""
+        queue = self._event_queue
+        while True:
+            event, data = await queue.get()
+            try:
+                await self.publish(event, data)
+            finally:
+                queue.task_done()
+    
     async def _safe_callback(self, subscription: EventSubscription, event_data: Dict[str, Any]) -> None:
         """
         安全执行回调函数
@@ -218,6 +276,7 @@ class EventHandler:
             'events_published': self._stats['events_published'],
             'events_processed': self._stats['events_processed'],
             'errors': self._stats['errors'],
+            'events_dropped': self._stats['events_dropped'],
             'subscribers': self._stats['subscribers'],
             'event_types': list(self._subscriptions.keys()),
             'subscriptions_count': {
@@ -248,6 +307,8 @@ class EventHandler:
         self._subscriptions.clear()
         self._subscriber_counters.clear()
         self._background_tasks.clear()
+        self._event_queue = None
+        self._consumer_task = None
         
         self.logger.info(f"事件处理器清理完成: {self.name}")
 
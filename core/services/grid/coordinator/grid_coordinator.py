@@ -54,7 +54,8 @@ Lighter 订单ID统一方案
 
 import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime, timedelta
 
@@ -169,7 +170,7 @@ class GridCoordinator:
         self._last_realtime_apr_estimate: Decimal = Decimal('0')
         self._last_realtime_apr_formula_data: Dict = {}
         # 🆕 循环时间戳记录（用于统计过去10分钟的循环次数）
-        self._cycle_timestamps: List[datetime] = []  # 记录每次完成循环的时间戳
+        self._cycle_timestamps: Deque[datetime] = deque()  # 记录每次完成循环的时间戳（按时间递增）
 
         # 🔥 剥头皮管理器
         self.scalping_manager: Optional[ScalpingManager] = None
@@ -423,12 +424,10 @@ class GridCoordinator:
             # 🆕 2.1. 记录循环时间戳（用于实时APR计算）
             if self.tracker.completed_cycles > prev_cycles:
                 # 循环次数增加，记录时间戳
-                self._cycle_timestamps.append(datetime.now())
-                # 只保留过去10分钟的时间戳（性能优化）
-                cutoff_time = datetime.now() - timedelta(minutes=10)
-                self._cycle_timestamps = [
-                    ts for ts in self._cycle_timestamps if ts > cutoff_time
-                ]
+                now = datetime.now()
+                self._cycle_timestamps.append(now)
+                # 只保留过去10分钟的时间戳（从队首淘汰过期项）
+                self._prune_cycle_timestamps(now)
 
             # 🔥 2.5. 记录现货买入手续费（仅现货且启用预留）
             if self.reserve_manager and filled_order.side.value == 'buy':
@@ -1316,6 +1315,13 @@ class GridCoordinator:
 
         return stats
 
+    def _prune_cycle_timestamps(self, now: datetime) -> None:
+        """淘汰10分钟之前的循环时间戳（时间戳按顺序追加，只需检查队首）"""
+        cutoff_time = now - timedelta(minutes=10)
+        timestamps = self._cycle_timestamps
+        while timestamps and timestamps[0] <= cutoff_time:
+            timestamps.popleft()
+
     def _calculate_cycle_apr(self, stats: GridStatistics) -> None:
         """
         计算循环APR预估（每10分钟更新，运行超过10分钟即可开始计算）
@@ -1441,9 +1447,8 @@ class GridCoordinator:
         # ========== 第三部分：实时循环APR（基于过去10分钟） ==========
 
         # 统计过去10分钟的循环次数
-        cutoff_time = now - timedelta(minutes=10)
-        recent_cycles = len(
-            [ts for ts in self._cycle_timestamps if ts > cutoff_time])
+        self._prune_cycle_timestamps(now)
+        recent_cycles = len(self._cycle_timestamps)
 
         if recent_cycles > 0:
             # 有过去10分钟的数据，计算实时APR
@@ -2073,15 +2078,14 @@ class GridCoordinator:
             # 🔥 新方案：直接从 client_id 缓存统计
             client_id_cache = self.engine._pending_orders_by_client_id
 
-            # 统计买单和卖单数量
-            buy_count = sum(
-                1 for order in client_id_cache.values()
-                if order.side == GridOrderSide.BUY
-            )
-            sell_count = sum(
-                1 for order in client_id_cache.values()
-                if order.side == GridOrderSide.SELL
-            )
+            # 统计买单和卖单数量（一次遍历同时统计）
+            buy_count = 0
+            sell_count = 0
+            for order in client_id_cache.values():
+                if order.side == GridOrderSide.BUY:
+                    buy_count += 1
+                elif order.side == GridOrderSide.SELL:
+                    sell_count += 1
 
             # 更新state的统计数据
             self.state.pending_buy_orders = buy_count
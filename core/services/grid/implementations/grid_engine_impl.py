@@ -25,6 +25,8 @@ Lighter 交易所特殊处理：
 """
 
 import asyncio
+import logging
+import random
 import time
 from typing import List, Optional, Callable, Dict, Set, Tuple
 from decimal import Decimal
@@ -54,6 +56,13 @@ class GridEngineImpl(IGridEngine):
     _price_max_failures = 5  # 🔥 最大连续失败次数（3次后判定为网络故障）
     _price_success_required_to_reset = 3  # 🆕 连续成功N次后才重置失败计数器（确认网络稳定）
 
+    # 下单返回None时的重试延迟（秒）：基础延迟 + 随机抖动
+    ORDER_RETRY_DELAY = 0.1
+    ORDER_RETRY_JITTER = 0.1
+
+    # 非Lighter交易所同时在途的下单请求上限（批量下单时避免瞬时打满限频）
+    MAX_CONCURRENT_ORDERS = 10
+
     def __init__(self, exchange_adapter: ExchangeInterface):
         """
         初始化执行引擎
@@ -96,6 +105,9 @@ class GridEngineImpl(IGridEngine):
         # 之前只在 grid_coordinator 的反手单中使用锁，但止盈订单、健康检查补单等也需要串行
         self._lighter_order_lock = asyncio.Lock()  # 全局下单锁
 
+        # 🔥 其他交易所：限制并发下单数量（信号量）
+        self._order_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDERS)
+
         # 🔥 新方案：通过 client_id 映射原始订单（替代价格验证方案）
         # 存储：client_id → 原始 GridOrder 对象
         # 用途：WebSocket 推送时通过 client_id 找到原始订单，使用原始价格挂反手单
@@ -197,7 +209,8 @@ class GridEngineImpl(IGridEngine):
             async with self._lighter_order_lock:
                 return await self._place_order_internal(order, batch_mode, source)
         else:
-            return await self._place_order_internal(order, batch_mode, source)
+            async with self._order_semaphore:
+                return await self._place_order_internal(order, batch_mode, source)
 
     async def _place_order_internal(self, order: GridOrder, batch_mode: bool = False, source: str = "未知") -> GridOrder:
         """
@@ -236,10 +249,12 @@ class GridEngineImpl(IGridEngine):
 
             # 🔥 检查返回值是否为None（API调用失败）- 带重试机制
             if exchange_order is None:
+                # 短延迟 + 随机抖动：批量下单同时失败时错开重试时间
+                retry_delay = self.ORDER_RETRY_DELAY + random.random() * self.ORDER_RETRY_JITTER
                 self.logger.warning(
-                    f"⚠️ 下单返回None，1秒后重试: Grid {order.grid_id}, {order.side.value} {order.amount}@{order.price}"
+                    f"⚠️ 下单返回None，{retry_delay:.2f}秒后重试: Grid {order.grid_id}, {order.side.value} {order.amount}@{order.price}"
                 )
-                await asyncio.sleep(1)  # 等待1秒
+                await asyncio.sleep(retry_delay)
 
                 # 重试一次
                 exchange_order = await self.exchange.create_order(
@@ -260,60 +275,75 @@ class GridEngineImpl(IGridEngine):
                 else:
                     self.logger.info(f"✅ 重试成功: Grid {order.grid_id}")
 
-            # 更新订单ID
-            order.order_id = exchange_order.id or exchange_order.order_id
-            order.status = GridOrderStatus.PENDING
+            return self._register_placed_order(order, exchange_order, source)
 
-            # 🔥 更新 client_id（如果交易所返回了）
-            if hasattr(exchange_order, 'client_id') and exchange_order.client_id:
-                order.client_id = str(exchange_order.client_id)
+        except Exception as e:
+            self.logger.error(f"下单失败: {e}")
+            order.mark_failed()
+            raise
 
-            # 如果订单ID为临时ID（"pending"），尝试从符号查询获取实际ID
-            if order.order_id == "pending" or not order.order_id:
-                # Backpack API 有时只返回状态，需要查询获取实际订单ID
-                # 暂时使用价格+数量作为唯一标识
-                temp_id = f"grid_{order.grid_id}_{int(order.price)}_{int(order.amount*1000000)}"
-                order.order_id = temp_id
-                self.logger.warning(
-                    f"订单ID为临时值，使用组合ID: {temp_id} "
-                    f"(Grid {order.grid_id}, {order.side.value} {order.amount}@{order.price})"
-                )
+    def _register_placed_order(self, order: GridOrder, exchange_order, source: str = "未知") -> GridOrder:
+        """
+        记录交易所下单结果：回填订单ID/client_id，并加入追踪缓存
 
-            # 添加到追踪列表
-            self._pending_orders[order.order_id] = order
+        Args:
+            order: 网格订单
+            exchange_order: 交易所返回的订单数据
+            source: 下单来源标识
 
-            # 🔥 新方案：如果有 client_id，存入 client_id 缓存
-            # 用于 WebSocket 推送时通过 client_id 查找原始订单
-            if order.client_id:
-                self._pending_orders_by_client_id[order.client_id] = order
-                self.logger.debug(
-                    f"📝 订单已缓存: client_id={order.client_id}, "
-                    f"price={order.price}, grid={order.grid_id}"
-                )
+        Returns:
+            更新后的订单
+        """
+        # 更新订单ID
+        order.order_id = exchange_order.id or exchange_order.order_id
+        order.status = GridOrderStatus.PENDING
+
+        # 🔥 更新 client_id（如果交易所返回了）
+        if hasattr(exchange_order, 'client_id') and exchange_order.client_id:
+            order.client_id = str(exchange_order.client_id)
+
+        # 如果订单ID为临时ID（"pending"），尝试从符号查询获取实际ID
+        if order.order_id == "pending" or not order.order_id:
+            # Backpack API 有时只返回状态，需要查询获取实际订单ID
+            # 暂时使用价格+数量作为唯一标识
+            temp_id = f"grid_{order.grid_id}_{int(order.price)}_{int(order.amount*1000000)}"
+            order.order_id = temp_id
+            self.logger.warning(
+                f"订单ID为临时值，使用组合ID: {temp_id} "
+                f"(Grid {order.grid_id}, {order.side.value} {order.amount}@{order.price})"
+            )
 
-            # 🔥 根据来源使用不同的标识符
-            if source == "反手单":
-                prefix = "🔄 [反手]"
-            elif source == "健康检查":
-                prefix = "🏥 [补单]"
-            elif source == "批量初始化":
-                prefix = "🎯 [初始]"
-            elif source == "止盈单":
-                prefix = "💰 [止盈]"
-            else:
-                prefix = "📝 [下单]"
+        # 添加到追踪列表
+        self._pending_orders[order.order_id] = order
 
-            self.logger.info(
-                f"{prefix} {order.side.value.upper()} {order.amount}@{order.price} "
-                f"(Grid {order.grid_id}, OrderID: {order.order_id})"
+        # 🔥 新方案：如果有 client_id，存入 client_id 缓存
+        # 用于 WebSocket 推送时通过 client_id 查找原始订单
+        if order.client_id:
+            self._pending_orders_by_client_id[order.client_id] = order
+            self.logger.debug(
+                "📝 订单已缓存: client_id=%s, price=%s, grid=%s",
+                order.client_id, order.price, order.grid_id
             )
 
-            return order
+        # 🔥 根据来源使用不同的标识符
+        if source == "反手单":
+            prefix = "🔄 [反手]"
+        elif source == "健康检查":
+            prefix = "🏥 [补单]"
+        elif source == "批量初始化":
+            prefix = "🎯 [初始]"
+        elif source == "止盈单":
+            prefix = "💰 [止盈]"
+        else:
+            prefix = "📝 [下单]"
 
-        except Exception as e:
-            self.logger.error(f"下单失败: {e}")
-            order.mark_failed()
-            raise
+        self.logger.info(
+            "%s %s %s@%s (Grid %s, OrderID: %s)",
+            prefix, order.side.value.upper(), order.amount, order.price,
+            order.grid_id, order.order_id
+        )
+
+        return order
 
     async def place_market_order(self, side: GridOrderSide, amount: Decimal) -> None:
         """
@@ -354,6 +384,53 @@ class GridEngineImpl(IGridEngine):
             self.logger.error(f"❌ 市价单失败: {e}")
             raise
 
+    async def _place_orders_native(self, orders: List[GridOrder], source: str = "批量初始化") -> List:
+        """
+        使用交易所原生批量下单接口提交订单（一次请求提交多笔）
+
+        Args:
+            orders: 订单列表
+            source: 下单来源标识
+
+        Returns:
+            与输入顺序一致的结果列表（GridOrder 或 Exception）
+        """
+        margin_mode_value = 1 if self.config.margin_mode.lower() == "isolated" else 0
+        requests = [
+            {
+                'symbol': self.config.symbol,
+                'side': self._convert_order_side(order.side),
+                'order_type': OrderType.LIMIT,
+                'amount': order.amount,
+                'price': order.price,
+                'params': {"margin_mode": margin_mode_value}
+            }
+            for order in orders
+        ]
+
+        try:
+            exchange_orders = await self.exchange.create_orders(requests)
+        except Exception as e:
+            self.logger.error(f"原生批量下单失败: {e}")
+            for order in orders:
+                order.mark_failed()
+            return [e] * len(orders)
+
+        # 响应中缺少的条目按失败处理，保证每个订单都计入成功或失败
+        exchange_orders = list(exchange_orders or [])
+        exchange_orders.extend([None] * (len(orders) - len(exchange_orders)))
+
+        results = []
+        for order, exchange_order in zip(orders, exchange_orders):
+            if exchange_order is None:
+                order.mark_failed()
+                results.append(Exception(
+                    f"批量下单失败: Grid {order.grid_id}, {order.side.value} {order.amount}@{order.price}"
+                ))
+            else:
+                results.append(self._register_placed_order(order, exchange_order, source))
+        return results
+
     async def place_batch_orders(self, orders: List[GridOrder], max_retries: int = 2) -> List[GridOrder]:
         """
         批量下单 - 优化版，支持大批量订单和失败重试
@@ -373,6 +450,11 @@ class GridEngineImpl(IGridEngine):
         successful_orders = []
         failed_orders = []  # 记录失败的订单
 
+        # 支持原生批量下单接口的交易所（如Binance/OKX）整批提交，减少请求次数
+        use_native_batch = self.exchange.supports_batch_orders()
+        if use_native_batch:
+            self.logger.info("📦 交易所支持原生批量下单，使用批量接口提交")
+
         for i in range(0, total_orders, batch_size):
             batch = orders[i:i + batch_size]
             batch_num = i // batch_size + 1
@@ -398,6 +480,9 @@ class GridEngineImpl(IGridEngine):
                     except Exception as e:
                         results.append(e)
                         self.logger.error(f"订单下单异常: {e}")
+            elif use_native_batch:
+                # 交易所支持原生批量接口：一次请求提交整批
+                results = await self._place_orders_native(batch)
             else:
                 # 并发下单当前批次（其他交易所）
                 tasks = [self.place_order(order) for order in batch]
@@ -456,6 +541,8 @@ class GridEngineImpl(IGridEngine):
                             results.append(result)
                         except Exception as e:
                             results.append(e)
+                elif use_native_batch:
+                    results = await self._place_orders_native(retry_orders, source="批量初始化重试")
                 else:
                     # 重试失败的订单（并发）
                     tasks = [self.place_order(order) for order in retry_orders]
@@ -545,6 +632,38 @@ class GridEngineImpl(IGridEngine):
 
         return len(keys_to_remove)
 
+    def _archive_order(self, order_id: str, client_id: Optional[str] = None) -> Optional[GridOrder]:
+        """
+        订单进入终态（成交/取消）后移出追踪缓存
+
+        同时清理 _pending_orders 的所有别名键（Lighter批量下单时
+        client_id + order_index 双键）和 _pending_orders_by_client_id，
+        避免已结束的订单一直留在缓存中。
+
+        Args:
+            order_id: 订单ID（可能是 client_id 或 order_index）
+            client_id: 推送中携带的 client_id（可选）
+
+        Returns:
+            被移除的订单（不存在时返回None）
+        """
+        key = order_id
+        order = self._pending_orders.get(order_id)
+        if order is None and client_id:
+            key = client_id
+            order = self._pending_orders.get(client_id)
+        if order is None:
+            if client_id:
+                self._pending_orders_by_client_id.pop(client_id, None)
+            return None
+
+        # 别名键不一定与 order.order_id 一致，按对象删除所有键
+        self._remove_order_from_pending(key)
+        for cid in (order.client_id, client_id):
+            if cid:
+                self._pending_orders_by_client_id.pop(cid, None)
+        return order
+
     async def cancel_order(self, order_id: str) -> bool:
         """
         取消订单（主动取消，不会重新挂单）
@@ -563,10 +682,9 @@ class GridEngineImpl(IGridEngine):
             await self.exchange.cancel_order(order_id, self.config.symbol)
 
             # 标记为已取消并从追踪列表移除（自动处理 Lighter 双键）
-            if order_id in self._pending_orders:
-                order = self._pending_orders[order_id]
+            order = self._archive_order(order_id)
+            if order is not None:
                 order.mark_cancelled()
-                self._remove_order_from_pending(order_id)
 
             self.logger.info(f"✅ 主动取消订单成功: {order_id}")
             return True
@@ -597,12 +715,16 @@ class GridEngineImpl(IGridEngine):
             cancelled_orders = await self.exchange.cancel_all_orders(self.config.symbol)
             count = len(cancelled_orders)
 
-            # 清空追踪列表
+            # 清空追踪列表（单次遍历；同一订单的多个键只处理一次）
+            archived = set()
             for order_id in pending_order_ids:
-                if order_id in self._pending_orders:
-                    order = self._pending_orders[order_id]
-                    order.mark_cancelled()
-                    del self._pending_orders[order_id]
+                order = self._pending_orders.pop(order_id, None)
+                if order is None or id(order) in archived:
+                    continue
+                archived.add(id(order))
+                order.mark_cancelled()
+                if order.client_id:
+                    self._pending_orders_by_client_id.pop(order.client_id, None)
 
             self.logger.info(f"✅ 主动批量取消所有订单: {count}个")
             return count
@@ -1203,15 +1325,18 @@ class GridEngineImpl(IGridEngine):
         """
         try:
             # 🔍 简化日志：仅记录关键信息到日志文件
+            # 热路径：使用 % 延迟格式化，DEBUG关闭时不产生格式化开销
             self.logger.debug(
-                f"📨 收到WebSocket订单更新，类型={type(update_data).__name__}")
+                "📨 收到WebSocket订单更新，类型=%s", type(update_data).__name__)
 
             # 🔥 更新WebSocket消息时间戳（表示WebSocket正常工作）
             self._last_ws_message_time = time.time()
 
-            self.logger.debug(f"📨 完整订单更新数据: {update_data}")
-            self.logger.debug(
-                f"📊 WebSocket消息时间戳已更新: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self._last_ws_message_time))}")
+            self.logger.debug("📨 完整订单更新数据: %s", update_data)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "📊 WebSocket消息时间戳已更新: %s",
+                    time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self._last_ws_message_time)))
 
             # 🔥 检测数据格式：Hyperliquid OrderData对象 vs Backpack字典
             from ....adapters.exchanges.models import OrderData as ExchangeOrderData
@@ -1222,8 +1347,8 @@ class GridEngineImpl(IGridEngine):
                 status = update_data.status.value.upper() if update_data.status else ""
 
                 self.logger.debug(
-                    f"收到OrderData: id={order_id}, status={status}, "
-                    f"side={update_data.side.value}, filled={update_data.filled}/{update_data.amount}")
+                    "收到OrderData: id=%s, status=%s, side=%s, filled=%s/%s",
+                    order_id, status, update_data.side.value, update_data.filled, update_data.amount)
 
                 # 🔥 新逻辑：直接根据WebSocket推送判断订单完全成交
                 if status in ["FILLED", "CLOSED"]:
@@ -1309,14 +1434,10 @@ class GridEngineImpl(IGridEngine):
                 elif status in ["CANCELLED", "CANCELED"]:
                     self.logger.debug(f"订单被取消: order_id={order_id}")
 
-                    # 从 _pending_orders 中删除
-                    if order_id in self._pending_orders:
-                        del self._pending_orders[order_id]
-
+                    # 从追踪缓存中删除（含 client_id 别名）
                     client_id = str(
                         update_data.client_id) if update_data.client_id else None
-                    if client_id and client_id in self._pending_orders:
-                        del self._pending_orders[client_id]
+                    self._archive_order(order_id, client_id)
 
                     # 检查是否是预期的取消
                     is_expected_cancellation = order_id in self._expected_cancellations
@@ -1450,8 +1571,7 @@ class GridEngineImpl(IGridEngine):
             # 🔥 处理订单取消事件
             elif status == 'Cancelled' or event_type == 'orderCancelled':
                 # 从挂单列表移除
-                if order_id in self._pending_orders:
-                    del self._pending_orders[order_id]
+                self._archive_order(order_id)
 
                 # 🔥 关键修复：区分主动取消和被动取消
                 is_expected_cancellation = order_id in self._expected_cancellations
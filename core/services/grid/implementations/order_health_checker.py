@@ -16,7 +16,7 @@ from collections import defaultdict
 
 from ....logging import get_logger
 from ....adapters.exchanges import OrderSide as ExchangeOrderSide, PositionSide, OrderType, MarginMode
-from ....adapters.exchanges.models import PositionData
+from ....adapters.exchanges.models import PositionData, get_quantizer
 from ..models import GridConfig, GridOrder, GridOrderSide, GridOrderStatus, GridType
 
 
@@ -191,8 +191,7 @@ class OrderHealthChecker:
                 # 马丁网格：逐个格式化后累加（模拟交易所处理）
                 # 假设从高价往低价连续成交（Grid N → Grid N-M+1）
                 expected_position = Decimal('0')
-                precision_quantizer = Decimal(
-                    '0.1') ** self.config.quantity_precision
+                precision_quantizer = get_quantizer(self.config.quantity_precision)
 
                 # 计算哪些Grid已成交（从高价格ID开始）
                 start_grid_id = self.config.grid_count - filled_buy_count + 1
@@ -226,8 +225,7 @@ class OrderHealthChecker:
                 # 马丁网格：逐个格式化后累加（模拟交易所处理）
                 # 假设从低价往高价连续成交（Grid 1 → Grid M）
                 expected_position = Decimal('0')
-                precision_quantizer = Decimal(
-                    '0.1') ** self.config.quantity_precision
+                precision_quantizer = get_quantizer(self.config.quantity_precision)
 
                 for grid_id in range(1, filled_sell_count + 1):
                     # 获取该网格的理论金额
@@ -8,6 +8,7 @@ from typing import Dict, List, Deque
 from decimal import Decimal
 from datetime import datetime, timedelta
 from collections import deque
+from itertools import islice
 
 from ....logging import get_logger
 from ..interfaces.position_tracker import IPositionTracker
@@ -355,9 +356,13 @@ class PositionTrackerImpl(IPositionTracker):
         Returns:
             交易记录列表
         """
-        # 返回最新的N条记录
-        history_list = list(self.trade_history)
-        return history_list[-limit:] if len(history_list) > limit else history_list
+        # 返回最新的N条记录（只遍历尾部N条，避免复制整个deque）
+        if limit <= 0:
+            # 与原切片行为保持一致（limit=0 返回全部记录）
+            return list(self.trade_history)[-limit:]
+        recent = list(islice(reversed(self.trade_history), limit))
+        recent.reverse()
+        return recent
 
     def update_balance(self, available: Decimal, frozen: Decimal):
         """
@@ -38,6 +38,7 @@ from enum import Enum
 from typing import Optional
 from decimal import Decimal
 from core.logging import get_logger
+from core.adapters.exchanges.models import get_quantizer
 
 
 class GridType(Enum):
@@ -50,6 +51,11 @@ class GridType(Enum):
     FOLLOW_SHORT = "follow_short"          # 价格移动做空网格
 
 
+# 方向分组（模块加载时构建一次，避免每次判断都临时创建列表）
+_LONG_GRID_TYPES = frozenset({GridType.LONG, GridType.FOLLOW_LONG, GridType.MARTINGALE_LONG})
+_FOLLOW_GRID_TYPES = frozenset({GridType.FOLLOW_LONG, GridType.FOLLOW_SHORT})
+
+
 class GridDirection(Enum):
     """网格方向（内部使用）"""
     UP = "up"      # 向上（价格上涨方向）
@@ -297,7 +303,7 @@ class GridConfig:
             做多网格：Grid 1 = 最低价（lower_price），向上递增
             做空网格：Grid 1 = 最高价（upper_price），向下递减
         """
-        if self.grid_type in [GridType.LONG, GridType.FOLLOW_LONG, GridType.MARTINGALE_LONG]:
+        if self.grid_type in _LONG_GRID_TYPES:
             # 做多网格：从下限开始向上递增
             # Grid 1 = 最低价，Grid N = 最高价
             return self.lower_price + ((grid_index - 1) * self.grid_interval)
@@ -324,7 +330,7 @@ class GridConfig:
             使用round()代替int()避免浮点数精度问题
             例如：174.999999... 会被round为175，而不是int为174
         """
-        if self.grid_type in [GridType.LONG, GridType.FOLLOW_LONG, GridType.MARTINGALE_LONG]:
+        if self.grid_type in _LONG_GRID_TYPES:
             # 做多网格：Grid 1 = lower_price
             # 计算价格距离下限有多少个网格间隔
             # 🔥 使用round()避免浮点数精度问题（如174.999999被int截断为174）
@@ -367,7 +373,7 @@ class GridConfig:
             True: 价格移动网格模式
             False: 其他模式
         """
-        return self.grid_type in [GridType.FOLLOW_LONG, GridType.FOLLOW_SHORT]
+        return self.grid_type in _FOLLOW_GRID_TYPES
 
     def is_long(self) -> bool:
         """
@@ -477,10 +483,7 @@ class GridConfig:
         # 问题：从交易所获取的价格可能有多余的小数位，导致计算出的价格范围精度不正确
         # 例如：current_price = 110599.70（2位小数），但 price_decimals = 1（要求1位小数）
         # 解决：对 upper_price 和 lower_price 统一做 quantize 处理
-        if self.price_decimals == 0:
-            quantize_precision = Decimal("1")
-        else:
-            quantize_precision = Decimal(10) ** (-self.price_decimals)
+        quantize_precision = get_quantizer(self.price_decimals)
 
         self.upper_price = self.upper_price.quantize(quantize_precision)
         self.lower_price = self.lower_price.quantize(quantize_precision)
@@ -550,7 +553,7 @@ class GridConfig:
         # 如果设置了马丁递增参数，则使用递增金额
         if self.martingale_increment is not None and self.martingale_increment > 0:
             # 判断网格方向
-            if self.grid_type in [GridType.LONG, GridType.FOLLOW_LONG, GridType.MARTINGALE_LONG]:
+            if self.grid_type in _LONG_GRID_TYPES:
                 # 做多：价格越低（grid_index 越小），数量越多
                 # Grid 1 = order_amount + (200-1) * increment（最多）
                 # Grid 200 = order_amount + (200-200) * increment（最少）
@@ -587,7 +590,7 @@ class GridConfig:
         raw_amount = self.get_grid_order_amount(grid_index)
 
         # 格式化到交易所精度（四舍五入）
-        precision_quantizer = Decimal('0.1') ** self.quantity_precision
+        precision_quantizer = get_quantizer(self.quantity_precision)
         formatted_amount = raw_amount.quantize(
             precision_quantizer, rounding=ROUND_HALF_UP)
 
@@ -641,7 +644,7 @@ class GridConfig:
             做多网格：Grid 1 = 最低价，Grid N = 最高价
             做空网格：Grid 1 = 最高价，Grid N = 最低价
         """
-        if self.grid_type in [GridType.LONG, GridType.FOLLOW_LONG, GridType.MARTINGALE_LONG]:
+        if self.grid_type in _LONG_GRID_TYPES:
             # 做多网格：Grid 1 = lower_price，向上递增
             index = (price - self.lower_price) / self.grid_interval + 1
             if direction == "conservative":
@@ -10,6 +10,8 @@ from typing import Optional
 from decimal import Decimal
 from datetime import datetime
 
+from core.adapters.exchanges.models import DATACLASS_SLOTS
+
 
 class GridOrderSide(Enum):
     """订单方向"""
@@ -25,7 +27,7 @@ class GridOrderStatus(Enum):
     FAILED = "failed"          # 失败
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GridOrder:
     """
     网格订单
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime
 
+from core.adapters.exchanges.models import DATACLASS_SLOTS
 from .grid_order import GridOrder, GridOrderSide
 
 
@@ -32,7 +33,7 @@ class GridLevelStatus(Enum):
     COMPLETED = "completed"        # 完成一轮循环
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GridLevel:
     """
     网格层级
@@ -157,6 +158,9 @@ class GridState:
     active_orders: Dict[str, GridOrder] = field(
         default_factory=dict)  # order_id -> GridOrder
 
+    # 已触发过（有过成交）的网格层级数，随成交增量维护
+    _triggered_level_count: int = field(default=0, init=False, repr=False)
+
     def initialize_grid_levels(self, grid_count: int, price_calculator):
         """
         初始化网格层级
@@ -166,6 +170,7 @@ class GridState:
             price_calculator: 价格计算函数 (grid_id) -> price
         """
         self.grid_levels = {}
+        self._triggered_level_count = 0
         for grid_id in range(1, grid_count + 1):
             price = price_calculator(grid_id)
             self.grid_levels[grid_id] = GridLevel(
@@ -201,8 +206,12 @@ class GridState:
         order.mark_filled(filled_price, filled_amount)
 
         # 更新网格层级
-        if order.grid_id in self.grid_levels:
-            self.grid_levels[order.grid_id].mark_order_filled()
+        level = self.grid_levels.get(order.grid_id)
+        if level is not None:
+            was_triggered = level.buy_count > 0 or level.sell_count > 0
+            level.mark_order_filled()
+            if not was_triggered and (level.buy_count > 0 or level.sell_count > 0):
+                self._triggered_level_count += 1
 
         # 更新统计
         if order.is_buy_order():
@@ -261,12 +270,7 @@ class GridState:
         if not self.grid_levels:
             return 0.0
 
-        triggered_count = sum(
-            1 for level in self.grid_levels.values()
-            if level.buy_count > 0 or level.sell_count > 0
-        )
-
-        return (triggered_count / len(self.grid_levels)) * 100
+        return (self._triggered_level_count / len(self.grid_levels)) * 100
 
     def get_pending_orders_count(self) -> tuple:
         """获取挂单数量 (买单, 卖单)"""
@@ -11,10 +11,11 @@
 """
 
 from decimal import Decimal, ROUND_DOWN
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional, Dict, List, Any
 
 from ....logging import get_logger
+from ....adapters.exchanges.models import get_quantizer
 
 
 class SpotReserveManager:
@@ -71,6 +72,11 @@ class SpotReserveManager:
         self.replenish_history: List[Dict[str, Any]] = []
         self.last_replenish_time: Optional[datetime] = None
 
+        # 状态查询用的缓存视图（随上面的状态同步更新，避免每次查询重新转换/扫描历史）
+        self._total_fee_consumed_float = 0.0
+        self._replenish_count_date: Optional[date] = None
+        self._replenish_count_today = 0
+
         self.logger.info(
             f"✅ 现货预留管理器初始化: "
             f"预留={self.reserve_amount} {self.base_currency}, "
@@ -107,12 +113,13 @@ class SpotReserveManager:
         """
         fee = buy_amount * self.spot_buy_fee_rate
         self.total_fee_consumed += fee
+        self._total_fee_consumed_float = float(self.total_fee_consumed)
 
         self.fee_history.append({
             'time': datetime.now(),
             'buy_amount': float(buy_amount),
             'fee': float(fee),
-            'total_consumed': float(self.total_fee_consumed),
+            'total_consumed': self._total_fee_consumed_float,
             'health_after': float(self.get_reserve_health_percent())
         })
 
@@ -266,15 +273,23 @@ class SpotReserveManager:
                 order_price = current_price if current_price else Decimal('0')
 
             # 记录补充历史
+            now = datetime.now()
             self.replenish_history.append({
-                'time': datetime.now(),
+                'time': now,
                 'amount': float(replenish_amount),
                 'order_id': order_id,
                 'price': float(order_price),
                 'health_before': float(self.get_reserve_health_percent()),
             })
 
-            self.last_replenish_time = datetime.now()
+            self.last_replenish_time = now
+
+            # 更新今日补充次数
+            today = now.date()
+            if self._replenish_count_date != today:
+                self._replenish_count_date = today
+                self._replenish_count_today = 0
+            self._replenish_count_today += 1
 
             # 🔥 预留基数保持为配置值（固定值，不累加）
             # 补充购买只是增加账户余额，不修改 reserve_amount
@@ -314,7 +329,7 @@ class SpotReserveManager:
             'health_percent': float(health_percent),
             'reserve_amount': float(self.reserve_amount),
             'current_reserve': float(current_reserve),
-            'total_consumed': float(self.total_fee_consumed),
+            'total_consumed': self._total_fee_consumed_float,
             'need_replenish': self.need_replenish(),
             'trades_count': len(self.fee_history),
             'replenish_count': len(self.replenish_history),
@@ -335,16 +350,15 @@ class SpotReserveManager:
         Returns:
             处理后的数量
         """
-        # 创建精度字符串，例如 "0.00001" for precision=5
-        precision_str = f"0.{'0' * self.quantity_precision}"
-        precision_decimal = Decimal(precision_str)
+        # 精度基准，例如 precision=5 -> Decimal("0.00001")
+        precision_decimal = get_quantizer(self.quantity_precision)
 
         if round_up:
             # 向上取整
             quantized = amount.quantize(precision_decimal, rounding=ROUND_DOWN)
             if quantized < amount:
                 # 如果向下取整后小于原值，加一个最小单位
-                quantized += Decimal(10) ** (-self.quantity_precision)
+                quantized += precision_decimal
             return quantized
         else:
             # 标准四舍五入
@@ -352,8 +366,6 @@ class SpotReserveManager:
 
     def _get_today_replenish_count(self) -> int:
         """获取今天的补充次数"""
-        today = datetime.now().date()
-        return sum(
-            1 for record in self.replenish_history
-            if record['time'].date() == today
-        )
+        if self._replenish_count_date != datetime.now().date():
+            return 0
+        return self._replenish_count_today
@@ -789,8 +789,13 @@ class GridTerminalUI:
             return (liquidation_price if liquidation_price > 0 else None, position_value, avg_cost)
 
         # 假设所有买单全部成交，计算最终持仓和平均成本
-        total_buy_amount = sum(o.amount for o in buy_orders)
-        total_buy_cost = sum(o.amount * o.price for o in buy_orders)
+        # 单次遍历同时累计数量和金额
+        total_buy_amount = Decimal('0')
+        total_buy_cost = Decimal('0')
+        for o in buy_orders:
+            amount = o.amount
+            total_buy_amount += amount
+            total_buy_cost += amount * o.price
 
         final_position = position + total_buy_amount
 
@@ -857,8 +862,13 @@ class GridTerminalUI:
             return (liquidation_price, position_value, avg_cost)
 
         # 假设所有卖单全部成交，计算最终持仓和平均成本
-        total_sell_amount = sum(o.amount for o in sell_orders)
-        total_sell_cost = sum(o.amount * o.price for o in sell_orders)
+        # 单次遍历同时累计数量和金额
+        total_sell_amount = Decimal('0')
+        total_sell_cost = Decimal('0')
+        for o in sell_orders:
+            amount = o.amount
+            total_sell_amount += amount
+            total_sell_cost += amount * o.price
 
         position_abs = abs(position)
         final_position_abs = position_abs + total_sell_amount
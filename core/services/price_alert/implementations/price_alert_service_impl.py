@@ -29,12 +29,18 @@ class PriceAlertServiceImpl(IPriceAlertService):
         self.exchange_adapter = exchange_adapter
         self.config: Optional[PriceAlertSystemConfig] = None
         self.statistics: Dict[str, SymbolStatistics] = {}
+        # symbol -> 代币配置索引（initialize 时构建，避免每个ticker线性查找）
+        self._symbol_configs: Dict[str, SymbolConfig] = {}
         self.logger: Optional[logging.Logger] = None
         self.alert_logger: Optional[logging.Logger] = None
         
         self._running = False
         self._should_stop = False
         self._monitor_task: Optional[asyncio.Task] = None
+        # 待播放声音的报警数：ticker回调只计数，由监控循环每轮统一播放一次
+        self._pending_sound_alerts = 0
+        # ticker回调分发目标：运行时绑定到 _on_ticker_update，未运行时绑定到空操作
+        self._ticker_handler = self._on_ticker_noop
 
     async def initialize(self, config: PriceAlertSystemConfig) -> bool:
         """初始化服务"""
@@ -52,7 +58,9 @@ class PriceAlertServiceImpl(IPriceAlertService):
             self.logger.info("=" * 70)
             
             # 初始化统计数据
+            self._symbol_configs = {}
             for symbol_config in config.symbols:
+                self._symbol_configs.setdefault(symbol_config.symbol, symbol_config)
                 if symbol_config.enabled:
                     self.statistics[symbol_config.symbol] = SymbolStatistics(
                         symbol=symbol_config.symbol
@@ -81,6 +89,7 @@ class PriceAlertServiceImpl(IPriceAlertService):
         
         self._running = True
         self._should_stop = False
+        self._ticker_handler = self._on_ticker_update
         
         self.logger.info("🚀 启动价格监控...")
         
@@ -111,6 +120,7 @@ class PriceAlertServiceImpl(IPriceAlertService):
                 pass
         
         self._running = False
+        self._ticker_handler = self._on_ticker_noop
         self.logger.info("✅ 监控已停止")
 
     def get_statistics(self) -> Dict[str, SymbolStatistics]:
@@ -129,7 +139,7 @@ class PriceAlertServiceImpl(IPriceAlertService):
                 # 创建带symbol上下文的回调函数
                 def create_callback(sym: str):
                     async def callback(ticker: TickerData):
-                        await self._on_ticker_update(sym, ticker)
+                        await self._ticker_handler(sym, ticker)
                     return callback
                 
                 await self.exchange_adapter.subscribe_ticker(
@@ -142,15 +152,19 @@ class PriceAlertServiceImpl(IPriceAlertService):
         
         self.logger.info("✅ 所有订阅完成")
 
+    async def _on_ticker_noop(self, symbol: str, ticker: TickerData):
+        """未运行时的ticker回调（直接丢弃）"""
+        return
+
     async def _on_ticker_update(self, symbol: str, ticker: TickerData):
         """ticker更新回调"""
-        if symbol not in self.statistics:
+        stats = self.statistics.get(symbol)
+        if stats is None:
             return
         
-        stats = self.statistics[symbol]
-        
-        # 更新价格数据
-        stats.add_price_point(ticker.last, datetime.now())
+        # 更新价格数据（本次回调共用一个时间戳）
+        now = datetime.now()
+        stats.add_price_point(ticker.last, now)
         
         # 更新24小时数据
         if ticker.open:
@@ -161,9 +175,9 @@ class PriceAlertServiceImpl(IPriceAlertService):
             stats.lowest_price_24h = ticker.low
         
         # 检查报警条件
-        await self._check_alerts(symbol)
+        await self._check_alerts(symbol, now)
 
-    async def _check_alerts(self, symbol: str):
+    async def _check_alerts(self, symbol: str, now: Optional[datetime] = None):
         """检查报警条件"""
         if symbol not in self.statistics:
             return
@@ -174,20 +188,24 @@ class PriceAlertServiceImpl(IPriceAlertService):
         if not symbol_config:
             return
         
+        if now is None:
+            now = datetime.now()
+        
         # 检查波动报警
         if symbol_config.volatility_alert.enabled:
-            await self._check_volatility_alert(symbol, stats, symbol_config)
+            await self._check_volatility_alert(symbol, stats, symbol_config, now)
         
         # 检查价格目标报警
         if symbol_config.price_alert.enabled:
-            await self._check_price_alert(symbol, stats, symbol_config)
+            await self._check_price_alert(symbol, stats, symbol_config, now)
 
-    async def _check_volatility_alert(self, symbol: str, stats: SymbolStatistics, symbol_config: SymbolConfig):
+    async def _check_volatility_alert(self, symbol: str, stats: SymbolStatistics, symbol_config: SymbolConfig,
+                                      now: datetime):
         """检查波动报警"""
         time_window = symbol_config.volatility_alert.time_window
         threshold = symbol_config.volatility_alert.threshold_percent
         
-        change_percent = stats.get_price_change_percent(time_window)
+        change_percent = stats.get_price_change_percent(time_window, now)
         
         if change_percent is None:
             return
@@ -195,14 +213,15 @@ class PriceAlertServiceImpl(IPriceAlertService):
         # 检查是否超过阈值
         if abs(change_percent) >= threshold:
             # 检查冷却时间
-            if stats.can_alert("volatility", self.config.alert.cooldown_seconds):
+            if stats.can_alert("volatility", self.config.alert.cooldown_seconds, now):
                 direction = "上涨" if change_percent > 0 else "下跌"
                 message = f"⚠️ {symbol} {time_window}秒内{direction} {abs(change_percent):.2f}% (阈值: {threshold}%)"
                 
                 await self._trigger_alert("volatility", symbol, message, change_percent)
-                stats.record_alert("volatility")
+                stats.record_alert("volatility", now)
 
-    async def _check_price_alert(self, symbol: str, stats: SymbolStatistics, symbol_config: SymbolConfig):
+    async def _check_price_alert(self, symbol: str, stats: SymbolStatistics, symbol_config: SymbolConfig,
+                                 now: datetime):
         """检查价格目标报警"""
         current_price = stats.current_price
         upper_limit = symbol_config.price_alert.upper_limit
@@ -210,17 +229,17 @@ class PriceAlertServiceImpl(IPriceAlertService):
         
         # 检查价格上限
         if upper_limit > Decimal("0") and current_price >= upper_limit:
-            if stats.can_alert("price_upper", self.config.alert.cooldown_seconds):
+            if stats.can_alert("price_upper", self.config.alert.cooldown_seconds, now):
                 message = f"📈 {symbol} 突破上限 {upper_limit} (当前: {current_price})"
                 await self._trigger_alert("price_upper", symbol, message)
-                stats.record_alert("price_upper")
+                stats.record_alert("price_upper", now)
         
         # 检查价格下限
         if lower_limit > Decimal("0") and current_price <= lower_limit:
-            if stats.can_alert("price_lower", self.config.alert.cooldown_seconds):
+            if stats.can_alert("price_lower", self.config.alert.cooldown_seconds, now):
                 message = f"📉 {symbol} 跌破下限 {lower_limit} (当前: {current_price})"
                 await self._trigger_alert("price_lower", symbol, message)
-                stats.record_alert("price_lower")
+                stats.record_alert("price_lower", now)
 
     async def _trigger_alert(self, alert_type: str, symbol: str, message: str, change_percent: float = 0):
         """触发报警"""
@@ -232,9 +251,9 @@ class PriceAlertServiceImpl(IPriceAlertService):
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             self.alert_logger.info(f"[{timestamp}] {alert_type.upper()} | {message}")
         
-        # 播放声音
+        # 播放声音（交给监控循环批量处理，避免在ticker回调中等待声音播放）
         if self.config.alert.sound_enabled:
-            await self._play_alert_sound()
+            self._pending_sound_alerts += 1
 
     async def _play_alert_sound(self):
         """播放报警声音"""
@@ -280,12 +299,14 @@ class PriceAlertServiceImpl(IPriceAlertService):
         while not self._should_stop:
             await asyncio.sleep(1)
 
+            # 本轮内触发的报警合并为一次声音提示
+            if self._pending_sound_alerts:
+                self._pending_sound_alerts = 0
+                await self._play_alert_sound()
+
     def _get_symbol_config(self, symbol: str) -> Optional[SymbolConfig]:
         """获取代币配置"""
-        for s in self.config.symbols:
-            if s.symbol == symbol:
-                return s
-        return None
+        return self._symbol_configs.get(symbol)
 
     def _setup_logging(self):
         """设置日志"""
@@ -1,13 +1,59 @@
 """价格监控统计模型"""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
-from collections import deque
+from typing import Any, Iterator, List, Optional
 
+from core.adapters.exchanges.models import DATACLASS_SLOTS
 
-@dataclass
+
+# 每个代币保留的价格点数量
+PRICE_HISTORY_SIZE = 1000
+
+
+class RingBuffer:
+    """
+    定长环形缓冲区
+
+    基于预分配列表 + 写指针实现，满后覆盖最旧元素。
+    与 deque 不同，按下标访问是 O(1)，适合对历史做二分查找。
+    """
+
+    __slots__ = ('_buf', '_cap', '_start', '_size')
+
+    def __init__(self, capacity: int):
+        self._buf: List[Any] = [None] * capacity
+        self._cap = capacity
+        self._start = 0  # 最旧元素的位置
+        self._size = 0
+
+    def append(self, item: Any) -> None:
+        """追加元素（已满时覆盖最旧元素）"""
+        if self._size < self._cap:
+            self._buf[(self._start + self._size) % self._cap] = item
+            self._size += 1
+        else:
+            self._buf[self._start] = item
+            self._start = (self._start + 1) % self._cap
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingBuffer index out of range")
+        return self._buf[(self._start + index) % self._cap]
+
+    def __iter__(self) -> Iterator[Any]:
+        buf, cap, start = self._buf, self._cap, self._start
+        for i in range(self._size):
+            yield buf[(start + i) % cap]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PricePoint:
     """价格点数据"""
     timestamp: datetime
@@ -24,7 +70,8 @@ class SymbolStatistics:
     lowest_price_24h: Decimal = Decimal("0")
     
     # 时间窗口内的价格历史
-    price_history: deque = field(default_factory=lambda: deque(maxlen=1000))
+    price_history: RingBuffer = field(
+        default_factory=lambda: RingBuffer(PRICE_HISTORY_SIZE))
     
     # 报警统计
     total_alerts: int = 0
@@ -54,23 +101,32 @@ class SymbolStatistics:
         if self.lowest_price_24h == Decimal("0") or price < self.lowest_price_24h:
             self.lowest_price_24h = price
     
-    def get_price_change_percent(self, time_window_seconds: int) -> Optional[float]:
-        """获取指定时间窗口内的价格变化百分比"""
+    def get_price_change_percent(self, time_window_seconds: int,
+                                 now: Optional[datetime] = None) -> Optional[float]:
+        """获取指定时间窗口内的价格变化百分比（now 可由调用方传入以复用时间戳）"""
         if not self.price_history or len(self.price_history) < 2:
             return None
         
-        current_time = datetime.now()
         current_price = self.current_price
+        if now is None:
+            now = datetime.now()
+        cutoff_time = now - timedelta(seconds=time_window_seconds)
         
-        # 找到时间窗口开始时的价格
-        window_start_price = None
-        for price_point in reversed(self.price_history):
-            time_diff = (current_time - price_point.timestamp).total_seconds()
-            if time_diff >= time_window_seconds:
-                window_start_price = price_point.price
-                break
+        # 找到时间窗口开始时的价格：price_history 按时间递增，
+        # 二分查找最后一个 timestamp <= cutoff_time 的价格点
+        history = self.price_history
+        lo, hi = 0, len(history)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if history[mid].timestamp <= cutoff_time:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == 0:
+            return None
+        window_start_price = history[lo - 1].price
         
-        if window_start_price is None or window_start_price == Decimal("0"):
+        if window_start_price == Decimal("0"):
             return None
         
         # 计算百分比变化
@@ -85,9 +141,11 @@ class SymbolStatistics:
         change_percent = float((self.current_price - self.price_24h_ago) / self.price_24h_ago * 100)
         return change_percent
     
-    def can_alert(self, alert_type: str, cooldown_seconds: int) -> bool:
+    def can_alert(self, alert_type: str, cooldown_seconds: int,
+                  now: Optional[datetime] = None) -> bool:
         """检查是否可以报警（冷却时间）"""
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         
         if alert_type == "volatility":
             if self.last_volatility_alert_time is None:
@@ -109,9 +167,10 @@ class SymbolStatistics:
         
         return False
     
-    def record_alert(self, alert_type: str):
+    def record_alert(self, alert_type: str, now: Optional[datetime] = None):
         """记录报警"""
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         self.total_alerts += 1
         
         if alert_type == "volatility":
@@ -9,6 +9,7 @@
 """
 
 import asyncio
+import logging
 import time
 from typing import Dict, List, Optional, Any
 from collections import defaultdict
@@ -182,31 +183,36 @@ class SymbolCacheServiceImpl(ISymbolCacheService):
             self.logger.info(f"✅ {exchange_id}: {len(symbols)} 个符号")
             self.logger.info(f"   前10个符号: {symbols[:10]}")
             
+            # 🔥 使用符号转换服务将交易所格式转换为标准格式（每个交易所一次批量调用）
+            try:
+                converted = await self.symbol_conversion_service.batch_convert_from_exchange_format(
+                    symbols, exchange_id
+                )
+            except Exception as e:
+                self.logger.warning(f"⚠️ 符号批量转换失败 ({exchange_id}): {e}")
+                # 转换失败时使用原始符号
+                converted = {symbol: symbol for symbol in symbols}
+            
             for symbol in symbols:
-                # 🔥 使用符号转换服务将交易所格式转换为标准格式
-                try:
-                    standardized = await self.symbol_conversion_service.convert_from_exchange_format(
-                        symbol, exchange_id
-                    )
-                    if standardized:
-                        standardized_symbol_exchanges[standardized].append(exchange_id)
-                        symbol_mapping[standardized][exchange_id] = symbol
-                except Exception as e:
-                    self.logger.warning(f"⚠️ 符号转换失败 {symbol} ({exchange_id}): {e}")
-                    # 转换失败时使用原始符号
-                    standardized_symbol_exchanges[symbol].append(exchange_id)
-                    symbol_mapping[symbol][exchange_id] = symbol
+                standardized = converted.get(symbol)
+                if standardized:
+                    standardized_symbol_exchanges[standardized].append(exchange_id)
+                    symbol_mapping[standardized][exchange_id] = symbol
         
         # 分析重叠情况
         overlap_symbols = []
         all_standardized_symbols = list(standardized_symbol_exchanges.keys())
         
-        # 详细记录重叠分析过程
-        self.logger.info("🔍 重叠分析详情:")
         for standardized_symbol, exchanges in standardized_symbol_exchanges.items():
             if len(exchanges) >= config.min_exchange_count:
                 overlap_symbols.append(standardized_symbol)
-                self.logger.info(f"✅ 重叠符号: {standardized_symbol} 存在于 {exchanges}")
+        
+        # 重叠分析结果汇总输出一次；逐个符号的详情仅在DEBUG级别启用时输出
+        self.logger.info(f"🔍 重叠分析详情: 共 {len(overlap_symbols)} 个重叠符号")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for standardized_symbol in overlap_symbols:
+                self.logger.debug("✅ 重叠符号: %s 存在于 %s",
+                                  standardized_symbol, standardized_symbol_exchanges[standardized_symbol])
         
         # 应用过滤条件
         if config.include_patterns:
@@ -5,10 +5,10 @@
 """
 
 import re
+import time
 import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
 from injector import singleton, inject
 
 from core.logging import get_logger
@@ -29,8 +29,9 @@ class SymbolConversionService(ISymbolConversionService):
         self.config = None
         self.symbol_mappings = {}
         self.exchange_formats = {}
-        self.cache = {}
-        self.cache_timestamps = {}
+        # 缓存键: (方向, 交易所, 符号)，时间戳使用 time.monotonic()
+        self.cache: Dict[Tuple[str, str, str], str] = {}
+        self.cache_timestamps: Dict[Tuple[str, str, str], float] = {}
         
         # 性能统计
         self.conversion_stats = {
@@ -104,10 +105,11 @@ class SymbolConversionService(ISymbolConversionService):
             self.conversion_stats['total_conversions'] += 1
             
             # 检查缓存
-            cache_key = f"to_{exchange}_{standard_symbol}"
-            if self._check_cache(cache_key):
+            cache_key = ('to', exchange, standard_symbol)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
                 self.conversion_stats['cache_hits'] += 1
-                return self.cache[cache_key]
+                return cached
             
             self.conversion_stats['cache_misses'] += 1
             
@@ -116,7 +118,7 @@ class SymbolConversionService(ISymbolConversionService):
             if standard_symbol in direct_mapping:
                 result = direct_mapping[standard_symbol]
                 self._set_cache(cache_key, result)
-                self.logger.debug(f"🔄 直接映射: {standard_symbol} -> {result} ({exchange})")
+                self.logger.debug("🔄 直接映射: %s -> %s (%s)", standard_symbol, result, exchange)
                 return result
             
             # 使用格式转换
@@ -124,7 +126,7 @@ class SymbolConversionService(ISymbolConversionService):
             self._set_cache(cache_key, result)
             
             if result != standard_symbol:
-                self.logger.debug(f"🔄 格式转换: {standard_symbol} -> {result} ({exchange})")
+                self.logger.debug("🔄 格式转换: %s -> %s (%s)", standard_symbol, result, exchange)
             
             return result
             
@@ -140,10 +142,11 @@ class SymbolConversionService(ISymbolConversionService):
             self.conversion_stats['total_conversions'] += 1
             
             # 检查缓存
-            cache_key = f"from_{exchange}_{exchange_symbol}"
-            if self._check_cache(cache_key):
+            cache_key = ('from', exchange, exchange_symbol)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
                 self.conversion_stats['cache_hits'] += 1
-                return self.cache[cache_key]
+                return cached
             
             self.conversion_stats['cache_misses'] += 1
             
@@ -152,7 +155,7 @@ class SymbolConversionService(ISymbolConversionService):
             if exchange_symbol in exchange_to_standard:
                 result = exchange_to_standard[exchange_symbol]
                 self._set_cache(cache_key, result)
-                self.logger.debug(f"🔄 直接映射: {exchange_symbol} -> {result} ({exchange})")
+                self.logger.debug("🔄 直接映射: %s -> %s (%s)", exchange_symbol, result, exchange)
                 return result
             
             # 其次使用standard_to_exchange反向映射
@@ -161,7 +164,7 @@ class SymbolConversionService(ISymbolConversionService):
             if exchange_symbol in reverse_mapping:
                 result = reverse_mapping[exchange_symbol]
                 self._set_cache(cache_key, result)
-                self.logger.debug(f"🔄 反向映射: {exchange_symbol} -> {result} ({exchange})")
+                self.logger.debug("🔄 反向映射: %s -> %s (%s)", exchange_symbol, result, exchange)
                 return result
             
             # 使用格式转换
@@ -169,7 +172,7 @@ class SymbolConversionService(ISymbolConversionService):
             self._set_cache(cache_key, result)
             
             if result != exchange_symbol:
-                self.logger.debug(f"🔄 反向转换: {exchange_symbol} -> {result} ({exchange})")
+                self.logger.debug("🔄 反向转换: %s -> %s (%s)", exchange_symbol, result, exchange)
             
             return result
             
@@ -329,16 +332,16 @@ class SymbolConversionService(ISymbolConversionService):
             return exchange_symbol
     
     async def batch_convert_to_exchange_format(self, symbols: List[str], exchange: str) -> Dict[str, str]:
-        """批量转换符号到交易所格式"""
+        """批量转换符号到交易所格式（重复符号只转换一次）"""
         results = {}
-        for symbol in symbols:
+        for symbol in dict.fromkeys(symbols):
             results[symbol] = await self.convert_to_exchange_format(symbol, exchange)
         return results
     
     async def batch_convert_from_exchange_format(self, symbols: List[str], exchange: str) -> Dict[str, str]:
-        """批量转换符号从交易所格式"""
+        """批量转换符号从交易所格式（重复符号只转换一次）"""
         results = {}
-        for symbol in symbols:
+        for symbol in dict.fromkeys(symbols):
             results[symbol] = await self.convert_from_exchange_format(symbol, exchange)
         return results
     
@@ -469,27 +472,27 @@ class SymbolConversionService(ISymbolConversionService):
             self.logger.error(f"重新加载配置失败: {e}")
             return False
     
-    def _check_cache(self, cache_key: str) -> bool:
-        """检查缓存是否有效"""
+    def _get_cached(self, cache_key: Tuple[str, str, str]) -> Optional[str]:
+        """读取缓存，未命中或已过期返回None"""
         if not self.cache_config.get('enabled', True):
-            return False
+            return None
         
-        if cache_key not in self.cache:
-            return False
+        value = self.cache.get(cache_key)
+        if value is None:
+            return None
         
-        # 检查TTL
+        # 检查TTL（使用单调时钟，不受系统时间调整影响）
         ttl = self.cache_config.get('ttl', 3600)
-        if cache_key in self.cache_timestamps:
-            elapsed = (datetime.now() - self.cache_timestamps[cache_key]).total_seconds()
-            if elapsed > ttl:
-                # 缓存过期，删除
-                del self.cache[cache_key]
-                del self.cache_timestamps[cache_key]
-                return False
+        cached_at = self.cache_timestamps.get(cache_key)
+        if cached_at is not None and time.monotonic() - cached_at > ttl:
+            # 缓存过期，删除
+            del self.cache[cache_key]
+            del self.cache_timestamps[cache_key]
+            return None
         
-        return True
+        return value
     
-    def _set_cache(self, cache_key: str, value: str) -> None:
+    def _set_cache(self, cache_key: Tuple[str, str, str], value: str) -> None:
         """设置缓存"""
         if not self.cache_config.get('enabled', True):
             return
@@ -504,7 +507,7 @@ class SymbolConversionService(ISymbolConversionService):
             del self.cache_timestamps[oldest_key]
         
         self.cache[cache_key] = value
-        self.cache_timestamps[cache_key] = datetime.now()
+        self.cache_timestamps[cache_key] = time.monotonic()
     
     def get_conversion_stats(self) -> Dict[str, Any]:
         """获取转换统计信息"""
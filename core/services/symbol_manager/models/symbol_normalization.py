@@ -5,6 +5,7 @@
 """
 
 import re
+from collections import defaultdict
 from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -232,30 +233,19 @@ class SymbolNormalizer:
         Returns:
             Dict[comparison_key, Dict[exchange_id, StandardizedSymbol]]
         """
-        # 标准化所有符号
-        standardized_symbols = {}
+        # 标准化并按比较键分组（单次遍历）
+        comparison_groups: Dict[str, Dict[str, StandardizedSymbol]] = defaultdict(dict)
         for exchange_id, symbols in symbols_by_exchange.items():
-            standardized_symbols[exchange_id] = []
             for symbol in symbols:
                 standardized = self.normalize_symbol(symbol, exchange_id)
-                standardized_symbols[exchange_id].append(standardized)
-        
-        # 按比较键分组
-        comparison_groups = {}
-        for exchange_id, symbols in standardized_symbols.items():
-            for symbol in symbols:
-                comparison_key = symbol.to_comparison_key()
-                if comparison_key not in comparison_groups:
-                    comparison_groups[comparison_key] = {}
-                comparison_groups[comparison_key][exchange_id] = symbol
+                comparison_groups[standardized.to_comparison_key()][exchange_id] = standardized
         
         # 过滤出重叠的符号（至少在2个交易所中存在）
-        overlapping_symbols = {}
-        for comparison_key, exchanges in comparison_groups.items():
-            if len(exchanges) >= 2:
-                overlapping_symbols[comparison_key] = exchanges
-        
-        return overlapping_symbols
+        return {
+            comparison_key: exchanges
+            for comparison_key, exchanges in comparison_groups.items()
+            if len(exchanges) >= 2
+        }
     
     def is_equivalent_quote(self, quote1: QuoteCurrency, quote2: QuoteCurrency) -> bool:
         """检查两个计价货币是否等价"""
@@ -14,6 +14,7 @@ Lighter市价刷量交易服务实现（基于Backpack信号）
 """
 
 import asyncio
+import time
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional, Tuple, Dict, Any
@@ -100,7 +101,6 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
         self._accumulated_amount: Decimal = Decimal("0")
         self._accumulated_cost: Decimal = Decimal("0")  # 用于计算平均价格
         self._fill_event: Optional[asyncio.Event] = None
-        self._fill_lock = asyncio.Lock()  # 保护状态变更
         
         # 🔥 订单状态监控（检测滑点失败）
         self._pending_order_detected = False  # 检测到挂单（滑点不足）
@@ -200,9 +200,9 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
     async def _on_order_status(self, order: OrderData):
         """
         订单状态回调（由WebSocket触发）
-        
+
         🔥 关键功能：检测市价单挂单 = 滑点不足失败
-        
+
         Args:
             order: 订单数据（包含状态）
         """
@@ -210,32 +210,31 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
             # 只处理OPEN状态的订单（挂单）
             if order.status != OrderStatus.OPEN:
                 return
-            
-            async with self._fill_lock:
-                # 如果不在等待状态，忽略
-                if self._fill_state not in ["WAITING_OPEN", "WAITING_CLOSE"]:
-                    return
-                
-                # 🔥 检测到市价单挂单 = 滑点不足
-                order_side = order.side.value.lower()
-                if order_side == self._expected_side:
-                    self.logger.warning(
-                        f"⚠️ 检测到市价单挂单（滑点不足）: "
-                        f"id={order.id}, 方向={order_side}, "
-                        f"价格={order.price}, 数量={order.amount}, "
-                        f"状态={order.status.value}"
-                    )
-                    
-                    # 标记挂单检测
-                    self._pending_order_detected = True
-                    
-                    # 触发挂单事件
-                    if self._pending_order_event:
-                        self._pending_order_event.set()
-        
+
+            # 如果不在等待状态，忽略
+            if self._fill_state not in ["WAITING_OPEN", "WAITING_CLOSE"]:
+                return
+
+            # 🔥 检测到市价单挂单 = 滑点不足
+            order_side = order.side.value.lower()
+            if order_side == self._expected_side:
+                self.logger.warning(
+                    f"⚠️ 检测到市价单挂单（滑点不足）: "
+                    f"id={order.id}, 方向={order_side}, "
+                    f"价格={order.price}, 数量={order.amount}, "
+                    f"状态={order.status.value}"
+                )
+
+                # 标记挂单检测
+                self._pending_order_detected = True
+
+                # 触发挂单事件
+                if self._pending_order_event:
+                    self._pending_order_event.set()
+
         except Exception as e:
             self.logger.error(f"❌ 处理订单状态回调失败: {e}", exc_info=True)
-    
+
     async def _on_order_fill(self, order: OrderData):
         """
         订单成交回调（由WebSocket触发）
@@ -250,58 +249,57 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
             order: 成交的订单数据
         """
         try:
-            async with self._fill_lock:
-                # 如果不在等待状态，忽略
-                if self._fill_state not in ["WAITING_OPEN", "WAITING_CLOSE"]:
+            # 如果不在等待状态，忽略
+            if self._fill_state not in ["WAITING_OPEN", "WAITING_CLOSE"]:
+                return
+
+            # 🔥 优先通过 client_id 精确匹配
+            if self._expected_client_id:
+                if order.client_id and order.client_id != self._expected_client_id:
+                    self.logger.debug(
+                        f"⏭️ client_id 不匹配，忽略 - "
+                        f"期望: {self._expected_client_id}, 收到: {order.client_id}"
+                    )
                     return
+                elif order.client_id:
+                    self.logger.info(
+                        f"✅ client_id 匹配: {order.client_id}"
+                    )
 
-                # 🔥 优先通过 client_id 精确匹配
-                if self._expected_client_id:
-                    if order.client_id and order.client_id != self._expected_client_id:
-                        self.logger.debug(
-                            f"⏭️ client_id 不匹配，忽略 - "
-                            f"期望: {self._expected_client_id}, 收到: {order.client_id}"
-                        )
-                        return
-                    elif order.client_id:
-                        self.logger.info(
-                            f"✅ client_id 匹配: {order.client_id}"
-                        )
+            # 检查方向是否匹配
+            order_side = order.side.value.lower()  # "buy" or "sell"
+            if order_side != self._expected_side:
+                return
 
-                # 检查方向是否匹配
-                order_side = order.side.value.lower()  # "buy" or "sell"
-                if order_side != self._expected_side:
-                    return
+            # 累加成交数量和成本
+            fill_amount = order.filled if order.filled else order.amount
+            fill_price = order.average if order.average else order.price
 
-                # 累加成交数量和成本
-                fill_amount = order.filled if order.filled else order.amount
-                fill_price = order.average if order.average else order.price
+            self._accumulated_amount += fill_amount
+            self._accumulated_cost += fill_amount * fill_price
 
-                self._accumulated_amount += fill_amount
-                self._accumulated_cost += fill_amount * fill_price
+            self.logger.info(
+                f"📨 WebSocket收到成交 - "
+                f"client_id: {order.client_id or 'N/A'}, "
+                f"方向: {order_side}, "
+                f"数量: {fill_amount}, "
+                f"价格: {fill_price}, "
+                f"累计: {self._accumulated_amount}/{self._expected_amount}"
+            )
 
+            # 检查是否已满足期望数量
+            if self._accumulated_amount >= self._expected_amount:
+                # 计算平均价格
+                avg_price = self._accumulated_cost / self._accumulated_amount
                 self.logger.info(
-                    f"📨 WebSocket收到成交 - "
-                    f"client_id: {order.client_id or 'N/A'}, "
-                    f"方向: {order_side}, "
-                    f"数量: {fill_amount}, "
-                    f"价格: {fill_price}, "
-                    f"累计: {self._accumulated_amount}/{self._expected_amount}"
+                    f"✅ 成交完成 - "
+                    f"总数量: {self._accumulated_amount}, "
+                    f"平均价格: {avg_price:.2f}"
                 )
 
-                # 检查是否已满足期望数量
-                if self._accumulated_amount >= self._expected_amount:
-                    # 计算平均价格
-                    avg_price = self._accumulated_cost / self._accumulated_amount
-                    self.logger.info(
-                        f"✅ 成交完成 - "
-                        f"总数量: {self._accumulated_amount}, "
-                        f"平均价格: {avg_price:.2f}"
-                    )
-
-                    # 触发等待事件
-                    if self._fill_event:
-                        self._fill_event.set()
+                # 触发等待事件
+                if self._fill_event:
+                    self._fill_event.set()
 
         except Exception as e:
             self.logger.error(f"❌ 处理订单成交回调失败: {e}", exc_info=True)
@@ -695,8 +693,8 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
                         )
                         
                         # 分段等待，以便能够响应停止信号
-                        wait_start = datetime.now()
-                        while (datetime.now() - wait_start).total_seconds() < wait_seconds:
+                        wait_start = time.monotonic()
+                        while (time.monotonic() - wait_start) < wait_seconds:
                             if self._should_stop:
                                 self.logger.info("⚠️ 等待期间收到停止信号")
                                 break
@@ -1139,7 +1137,7 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
 
         last_bid: Optional[Decimal] = None
         last_ask: Optional[Decimal] = None
-        stable_start: Optional[datetime] = None
+        stable_start: Optional[float] = None
 
         # 🔥 买卖单数量对比反转检测
         initial_orderbook_side: Optional[str] = None
@@ -1147,9 +1145,9 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
         final_ratio: Optional[float] = None
 
         timeout = 300  # 最多等待5分钟
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
-        while (datetime.now() - start_time).total_seconds() < timeout:
+        while (time.monotonic() - start_time) < timeout:
             try:
                 # 🔥 从Backpack获取订单簿（使用signal_symbol）
                 signal_symbol = self.config.signal_symbol or self.config.symbol
@@ -1200,10 +1198,10 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
                             initial_orderbook_side = current_side
                         stable_start = None
                     elif stable_start is None:
-                        stable_start = datetime.now()
+                        stable_start = time.monotonic()
                     else:
                         stable_duration = (
-                            datetime.now() - stable_start).total_seconds()
+                            time.monotonic() - stable_start)
                         if stable_duration >= duration:
                             # 🔥 买卖单数量比例检查
                             if self.config.orderbook_quantity_ratio > 0:
@@ -1330,10 +1328,10 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
         price_change_count = 0
         last_bid = initial_bid
         last_ask = initial_ask
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         try:
-            while (datetime.now() - start_time).total_seconds() < timeout:
+            while (time.monotonic() - start_time) < timeout:
                 # 🔥 从Backpack获取订单簿（使用signal_symbol）
                 signal_symbol = self.config.signal_symbol or self.config.symbol
                 orderbook = await self.signal_adapter.get_orderbook(signal_symbol)
@@ -1357,7 +1355,7 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
                     current_side = "bid_more" if current_bid_amount > current_ask_amount else "ask_more"
 
                     if current_side != initial_side:
-                        elapsed = (datetime.now() - start_time).total_seconds()
+                        elapsed = time.monotonic() - start_time
                         self.logger.info(
                             f"✅ {signal_exchange}买卖单数量反转 - "
                             f"初始: {'买单多' if initial_side == 'bid_more' else '卖单多'}, "
@@ -1381,7 +1379,7 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
 
                     # 🔥 达到要求的变化次数，触发平仓
                     if price_change_count >= required_count:
-                        elapsed = (datetime.now() - start_time).total_seconds()
+                        elapsed = time.monotonic() - start_time
                         self.logger.info(
                             f"✅ {signal_exchange}价格变化达到要求 - "
                             f"变化{price_change_count}次 >= 要求{required_count}次, "
@@ -1399,7 +1397,7 @@ class LighterMarketVolumeMakerService(IVolumeMakerService):
             return None
 
         # 超时
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = time.monotonic() - start_time
         self.logger.warning(
             f"⚠️ 等待{signal_exchange}价格变化超时 - "
             f"耗时: {elapsed:.2f}秒, 价格变化次数: {price_change_count}/{required_count}")
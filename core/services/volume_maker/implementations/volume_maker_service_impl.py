@@ -10,6 +10,7 @@
 """
 
 import asyncio
+import time
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional, Tuple, Dict, Any
@@ -68,15 +69,18 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
         self._order_fill_events: Dict[str, asyncio.Event] = {}
         self._ws_order_subscribed = False  # WebSocket订单是否已订阅
         self._ws_order_healthy = False  # WebSocket订单连接是否健康
-        # 最后收到消息的时间
-        self._ws_order_last_message_time: Optional[datetime] = None
+        # 最后收到消息的时间（time.monotonic() 秒）
+        self._ws_order_last_message_time: Optional[float] = None
 
         # 🔥 WebSocket 订单簿缓存（用于价格稳定检测）
         self._latest_orderbook: Optional['OrderBookData'] = None  # 最新订单簿数据
         self._ws_orderbook_subscribed = False  # WebSocket订单簿是否已订阅
         self._ws_orderbook_healthy = False  # WebSocket订单簿连接是否健康
-        # 最后收到消息的时间
-        self._ws_orderbook_last_message_time: Optional[datetime] = None
+        # 最后收到消息的时间（time.monotonic() 秒）
+        self._ws_orderbook_last_message_time: Optional[float] = None
+        # 订单簿回调热路径状态（预先初始化，避免每次推送都做hasattr检查）
+        self._incomplete_orderbook_count = 0
+        self._last_orderbook_log_time: Optional[float] = None
 
         # 🔥 WebSocket 重连任务
         self._ws_reconnect_task: Optional[asyncio.Task] = None
@@ -361,8 +365,8 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
                         )
 
                         # 分段等待，以便能够响应停止信号
-                        wait_start = datetime.now()
-                        while (datetime.now() - wait_start).total_seconds() < wait_seconds:
+                        wait_start = time.monotonic()
+                        while (time.monotonic() - wait_start) < wait_seconds:
                             if self._should_stop:
                                 self.logger.info("⚠️ 等待期间收到停止信号")
                                 break
@@ -792,7 +796,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
 
             self._ws_order_subscribed = True
             self._ws_order_healthy = True
-            self._ws_order_last_message_time = datetime.now()
+            self._ws_order_last_message_time = time.monotonic()
             self.logger.info("✅ WebSocket 订单更新订阅成功")
 
         except Exception as e:
@@ -815,7 +819,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
 
             self._ws_orderbook_subscribed = True
             self._ws_orderbook_healthy = True
-            self._ws_orderbook_last_message_time = datetime.now()
+            self._ws_orderbook_last_message_time = time.monotonic()
             self.logger.info("✅ WebSocket 订单簿订阅成功")
 
             # 🔥 立即获取一次订单簿快照，避免等待首次推送
@@ -847,8 +851,9 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
             orderbook: 订单簿数据
         """
         try:
-            # 🔥 更新心跳时间
-            self._ws_orderbook_last_message_time = datetime.now()
+            # 🔥 更新心跳时间（本次回调共用一个时间戳）
+            now = time.monotonic()
+            self._ws_orderbook_last_message_time = now
             if not self._ws_orderbook_healthy:
                 self._ws_orderbook_healthy = True
                 self.logger.info("✅ WebSocket 订单簿连接已恢复健康")
@@ -857,8 +862,6 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
             # 这样可以避免不完整的数据覆盖掉有效数据
             if not orderbook or not orderbook.bids or not orderbook.asks:
                 # 数据不完整，记录警告但保留旧数据
-                if not hasattr(self, '_incomplete_orderbook_count'):
-                    self._incomplete_orderbook_count = 0
                 self._incomplete_orderbook_count += 1
 
                 # 每10次不完整数据记录一次警告
@@ -873,14 +876,15 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
             self._latest_orderbook = orderbook
 
             # 🔍 调试日志（仅首次和每10秒记录一次，避免刷屏）
-            if not hasattr(self, '_last_orderbook_log_time'):
-                self._last_orderbook_log_time = datetime.now()
+            last_log_time = self._last_orderbook_log_time
+            if last_log_time is None:
+                self._last_orderbook_log_time = now
                 self.logger.info(
                     f"📖 收到首次完整订单簿推送 - "
                     f"买1: ${orderbook.bids[0].price} × {orderbook.bids[0].size}, "
                     f"卖1: ${orderbook.asks[0].price} × {orderbook.asks[0].size}")
-            elif (datetime.now() - self._last_orderbook_log_time).total_seconds() >= 10:
-                self._last_orderbook_log_time = datetime.now()
+            elif now - last_log_time >= 10:
+                self._last_orderbook_log_time = now
                 self.logger.debug(
                     f"📖 订单簿更新 - "
                     f"买1: ${orderbook.bids[0].price} × {orderbook.bids[0].size}, "
@@ -909,7 +913,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
         """
         try:
             # 🔥 更新心跳时间
-            self._ws_order_last_message_time = datetime.now()
+            self._ws_order_last_message_time = time.monotonic()
             if not self._ws_order_healthy:
                 self._ws_order_healthy = True
                 self.logger.info("✅ WebSocket 订单连接已恢复健康")
@@ -1186,12 +1190,12 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
 
         last_bid: Optional[Decimal] = None
         last_ask: Optional[Decimal] = None
-        stable_start: Optional[datetime] = None
+        stable_start: Optional[float] = None
 
         timeout = 300  # 最多等待5分钟
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
-        while (datetime.now() - start_time).total_seconds() < timeout:
+        while (time.monotonic() - start_time) < timeout:
             try:
                 # 🔥 从 WebSocket 缓存中获取最新订单簿
                 if self._latest_orderbook is None:
@@ -1218,11 +1222,11 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
                         stable_start = None
                     elif stable_start is None:
                         # 开始稳定计时
-                        stable_start = datetime.now()
+                        stable_start = time.monotonic()
                     else:
                         # 检查稳定时长
                         stable_duration = (
-                            datetime.now() - stable_start).total_seconds()
+                            time.monotonic() - stable_start)
                         if stable_duration >= duration:
                             # 价格稳定达到要求
                             # WebSocket模式下，计算当前比例用于记录
@@ -1265,7 +1269,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
 
         last_bid: Optional[Decimal] = None
         last_ask: Optional[Decimal] = None
-        stable_start: Optional[datetime] = None
+        stable_start: Optional[float] = None
 
         # 🔥 买卖单数量对比反转检测（新增）
         initial_orderbook_side: Optional[str] = None  # "ask_more" 或 "bid_more"
@@ -1273,9 +1277,9 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
         final_ratio: Optional[float] = None  # 最终的买卖单数量比例
 
         timeout = 300  # 最多等待5分钟
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
-        while (datetime.now() - start_time).total_seconds() < timeout:
+        while (time.monotonic() - start_time) < timeout:
             try:
                 # 🔥 通过 REST API 获取订单簿
                 orderbook = await self.adapter.get_orderbook(self.config.symbol)
@@ -1329,7 +1333,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
                         stable_start = None
                     elif stable_start is None:
                         # 开始稳定计时
-                        stable_start = datetime.now()
+                        stable_start = time.monotonic()
 
                         # 记录稳定开始时的状态
                         if check_reversal and initial_orderbook_side:
@@ -1339,7 +1343,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
                     else:
                         # 检查稳定时长
                         stable_duration = (
-                            datetime.now() - stable_start).total_seconds()
+                            time.monotonic() - stable_start)
                         if stable_duration >= duration:
                             # 🔥 最后一道检查：买卖单数量比例（如果启用）
                             if self.config.orderbook_quantity_ratio > 0:
@@ -1477,9 +1481,9 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
             成交的订单或None
         """
         timeout = self.config.order_timeout
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
-        while (datetime.now() - start_time).total_seconds() < timeout:
+        while (time.monotonic() - start_time) < timeout:
             try:
                 # 🔥 参考网格交易：使用 get_open_orders() 而不是 get_order()
                 # Backpack API 不支持单独查询订单（返回 404）
@@ -1620,16 +1624,15 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
                 # 🔥 立即轮询确认持仓是否清零
                 self.logger.info(f"⏳ 确认平仓（轮询 {confirm_timeout}秒）...")
                 position_closed = False
-                start_time = datetime.now()
+                start_time = time.monotonic()
 
-                while (datetime.now() - start_time).total_seconds() < confirm_timeout:
+                while (time.monotonic() - start_time) < confirm_timeout:
                     try:
                         positions = await self.adapter.get_positions([self.config.symbol])
                         # 持仓消失或变为0，说明平仓成功
                         if not positions or abs(positions[0].size) < Decimal("0.00001"):
                             position_closed = True
-                            elapsed = (datetime.now() -
-                                       start_time).total_seconds()
+                            elapsed = time.monotonic() - start_time
                             self.logger.info(f"✅ 持仓已清零 (耗时: {elapsed:.2f}秒)")
                             break
                     except Exception as e:
@@ -1781,7 +1784,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
             tuple: (是否成功, 等待时间秒数, 平仓原因)
             平仓原因: "price_change"(价格变化), "quantity_reversal"(数量反转), "timeout"(超时)
         """
-        start_time = datetime.now()
+        start_time = time.monotonic()
         # WebSocket 模式下检查间隔更短（10ms vs 100ms）
         check_interval = 0.01 if self.config.orderbook_method == "websocket" else 0.1
 
@@ -1814,7 +1817,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
         required_count = self.config.market_price_change_count
 
         try:
-            while (datetime.now() - start_time).total_seconds() < timeout:
+            while (time.monotonic() - start_time) < timeout:
                 # 🔥 根据配置选择获取方式
                 if self.config.orderbook_method == "websocket":
                     # WebSocket 模式：使用缓存的订单簿
@@ -1841,7 +1844,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
                     current_side = "bid_more" if current_bid_amount > current_ask_amount else "ask_more"
 
                     if current_side != initial_side:
-                        elapsed = (datetime.now() - start_time).total_seconds()
+                        elapsed = time.monotonic() - start_time
                         self.logger.info(
                             f"✅ 订单簿数量发生反转({self.config.orderbook_method.upper()}) - "
                             f"初始: {'买单多' if initial_side == 'bid_more' else '卖单多'}, "
@@ -1864,7 +1867,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
 
                     # 🔥 达到要求的变化次数，触发平仓
                     if price_change_count >= required_count:
-                        elapsed = (datetime.now() - start_time).total_seconds()
+                        elapsed = time.monotonic() - start_time
                         self.logger.info(
                             f"✅ 价格变化达到要求次数({self.config.orderbook_method.upper()}) - "
                             f"变化{price_change_count}次 >= 要求{required_count}次 "
@@ -1874,13 +1877,13 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
                 await asyncio.sleep(check_interval)
 
             # 超时
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
             self.logger.warning(
                 f"⚠️ 等待价格变化超时（{timeout}秒，{self.config.orderbook_method.upper()}模式），继续平仓 [平仓原因: 超时]")
             return (True, elapsed, "timeout")  # 即使超时也返回True继续平仓
 
         except Exception as e:
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
             self.logger.error(
                 f"❌ 监控价格变化失败({self.config.orderbook_method.upper()}): {e} [平仓原因: 异常]")
             return (True, elapsed, "error")  # 出错也继续平仓
@@ -1971,8 +1974,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
 
                         # 步骤3: 消息时间仅提示（不标记为不健康）
                         if self._ws_order_last_message_time:
-                            message_age = (
-                                datetime.now() - self._ws_order_last_message_time).total_seconds()
+                            message_age = time.monotonic() - self._ws_order_last_message_time
                             # 💡 只在极长时间（如5分钟）无消息时提示，但不标记为不健康
                             if message_age > 300 and check_count % 30 == 0:
                                 self.logger.info(
@@ -1981,8 +1983,8 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
 
                         # 连接和心跳都正常
                         if check_count % 3 == 0 and heartbeat_age > 0:
-                            message_age = (datetime.now() - self._ws_order_last_message_time).total_seconds(
-                            ) if self._ws_order_last_message_time else 0
+                            message_age = (time.monotonic() - self._ws_order_last_message_time
+                                           ) if self._ws_order_last_message_time else 0
                             self.logger.debug(
                                 f"💓 WebSocket订单健康: 连接正常, 心跳 {heartbeat_age:.0f}秒前, "
                                 f"消息 {message_age:.0f}秒前")
@@ -2035,8 +2037,7 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
 
                         # 步骤3: 消息时间仅提示（不标记为不健康）
                         if self._ws_orderbook_last_message_time:
-                            message_age = (
-                                datetime.now() - self._ws_orderbook_last_message_time).total_seconds()
+                            message_age = time.monotonic() - self._ws_orderbook_last_message_time
                             # 订单簿推送频率较高，300秒提示即可
                             if message_age > 300 and check_count % 30 == 0:
                                 self.logger.info(
@@ -2045,8 +2046,8 @@ class VolumeMakerServiceImpl(IVolumeMakerService):
 
                         # 连接和心跳都正常
                         if check_count % 3 == 0 and heartbeat_age > 0:
-                            message_age = (datetime.now() - self._ws_orderbook_last_message_time).total_seconds(
-                            ) if self._ws_orderbook_last_message_time else 0
+                            message_age = (time.monotonic() - self._ws_orderbook_last_message_time
+                                           ) if self._ws_orderbook_last_message_time else 0
                             self.logger.debug(
                                 f"💓 WebSocket订单簿健康: 连接正常, 心跳 {heartbeat_age:.0f}秒前, "
                                 f"消息 {message_age:.0f}秒前")
@@ -101,6 +101,21 @@ class VolumeMakerStatistics:
     # 连续失败计数
     consecutive_fails: int = 0
 
+    # recent_cycles 中有效价差（>0）的累计值与数量，随记录增删增量维护
+    _spread_sum: Decimal = field(default=Decimal("0"), init=False, repr=False)
+    _spread_count: int = field(default=0, init=False, repr=False)
+    # recent_cycles 的累计时长（秒），随记录增删增量维护
+    _duration_sum: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self):
+        """按传入的 recent_cycles 初始化增量维护的累计值"""
+        spreads = [cycle.spread for cycle in self.recent_cycles if cycle.spread > 0]
+        self._spread_sum = sum(spreads, Decimal("0"))
+        self._spread_count = len(spreads)
+        self._duration_sum = sum(
+            cycle.duration.total_seconds() for cycle in self.recent_cycles
+        )
+
     def update_from_cycle(self, result: CycleResult) -> None:
         """从轮次结果更新统计"""
         self.total_cycles += 1
@@ -121,9 +136,10 @@ class VolumeMakerStatistics:
         if result.filled_amount:
             if result.filled_side == 'buy':
                 self.total_buy_volume += result.filled_amount
+                self.total_volume += result.filled_amount
             elif result.filled_side == 'sell':
                 self.total_sell_volume += result.filled_amount
-            self.total_volume = self.total_buy_volume + self.total_sell_volume
+                self.total_volume += result.filled_amount
 
         # 更新盈亏
         self.total_pnl += result.pnl
@@ -131,8 +147,8 @@ class VolumeMakerStatistics:
         self.net_pnl = self.total_pnl - self.total_fee
 
         # 更新盈利/亏损订单统计
-        if result.status == CycleStatus.SUCCESS and result.pnl != Decimal("0"):
-            if result.pnl > Decimal("0"):
+        if result.status == CycleStatus.SUCCESS and result.pnl:
+            if result.pnl > 0:
                 self.profit_cycles += 1
             else:
                 self.loss_cycles += 1
@@ -140,8 +156,7 @@ class VolumeMakerStatistics:
         # 更新胜率和盈利率
         if self.total_cycles > 0:
             self.win_rate = self.successful_cycles / self.total_cycles
-            self.avg_pnl_per_cycle = self.net_pnl / \
-                Decimal(str(self.total_cycles))
+            self.avg_pnl_per_cycle = self.net_pnl / self.total_cycles
 
         # 计算盈利百分比（只统计有盈亏的订单）
         completed_trades = self.profit_cycles + self.loss_cycles
@@ -150,18 +165,22 @@ class VolumeMakerStatistics:
 
         # 更新价差统计
         if result.spread > 0:
-            spread_count = len(
-                [c for c in self.recent_cycles if c.spread > 0]) + 1
-            total_spread = sum(
-                c.spread for c in self.recent_cycles if c.spread > 0) + result.spread
-            self.avg_spread = total_spread / Decimal(str(spread_count))
+            self.avg_spread = (self._spread_sum + result.spread) / (self._spread_count + 1)
             self.min_spread = min(self.min_spread, result.spread)
             self.max_spread = max(self.max_spread, result.spread)
 
         # 添加到最近记录
         self.recent_cycles.append(result)
+        self._duration_sum += result.duration.total_seconds()
+        if result.spread > 0:
+            self._spread_sum += result.spread
+            self._spread_count += 1
         if len(self.recent_cycles) > 100:  # 保留最近100条
-            self.recent_cycles.pop(0)
+            removed = self.recent_cycles.pop(0)
+            self._duration_sum -= removed.duration.total_seconds()
+            if removed.spread > 0:
+                self._spread_sum -= removed.spread
+                self._spread_count -= 1
 
         # 更新运行时间
         self.running_time = datetime.now() - self.start_time
@@ -176,9 +195,7 @@ class VolumeMakerStatistics:
         """获取平均轮次时长"""
         if not self.recent_cycles:
             return timedelta(seconds=0)
-        total_duration = sum((c.duration.total_seconds()
-                             for c in self.recent_cycles), 0.0)
-        return timedelta(seconds=total_duration / len(self.recent_cycles))
+        return timedelta(seconds=self._duration_sum / len(self.recent_cycles))
 
     def get_recent_pnl(self, count: int = 10) -> Decimal:
         """获取最近N轮的盈亏"""
@@ -209,4 +226,7 @@ class VolumeMakerStatistics:
         self.min_spread = Decimal("999999")
         self.max_spread = Decimal("0")
         self.recent_cycles = []
+        self._spread_sum = Decimal("0")
+        self._spread_count = 0
+        self._duration_sum = 0.0
         self.consecutive_fails = 0
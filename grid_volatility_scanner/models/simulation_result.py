@@ -4,11 +4,23 @@
 存储和管理网格模拟的最终结果
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional
 
 
+# APR评级阈值（升序，APR >= 阈值即达到对应档位）及各档位的评级/基础评分
+_RATING_APR_THRESHOLDS = (50.0, 150.0, 300.0, 500.0)
+_RATING_TIERS = (
+    ("❌ D", 40.0),
+    ("🟡 C", 60.0),
+    ("✅ B", 75.0),
+    ("⭐ A", 85.0),
+    ("🔥 S", 95.0),
+)
+
+
 @dataclass
 class SimulationResult:
     """
@@ -65,21 +77,7 @@ class SimulationResult:
         """
         apr = float(self.estimated_apr)
 
-        if apr >= 500:
-            self.rating = "🔥 S"
-            self.score = 95.0
-        elif apr >= 300:
-            self.rating = "⭐ A"
-            self.score = 85.0
-        elif apr >= 150:
-            self.rating = "✅ B"
-            self.score = 75.0
-        elif apr >= 50:
-            self.rating = "🟡 C"
-            self.score = 60.0
-        else:
-            self.rating = "❌ D"
-            self.score = 40.0
+        self.rating, self.score = _RATING_TIERS[bisect_right(_RATING_APR_THRESHOLDS, apr)]
 
         # 根据循环次数微调评分
         if self.cycles_per_hour > Decimal('50'):
@@ -14,7 +14,7 @@ from pathlib import Path
 from decimal import Decimal
 from datetime import datetime
 from collections import deque
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set, Tuple
 from logging.handlers import RotatingFileHandler
 
 # 添加项目根目录到路径
@@ -32,6 +32,7 @@ from core.services.arbitrage_monitor import ArbitrageMonitorService, ArbitrageCo
 from core.adapters.exchanges.factory import get_exchange_factory
 # 🔥 极简符号转换器（套利系统专用）
 from core.services.arbitrage_monitor.utils import SimpleSymbolConverter
+from core.infrastructure.event_loop import install_uvloop
 
 
 class UILogHandler(logging.Handler):
@@ -287,6 +288,113 @@ class ArbitrageMonitorApp:
             self.config = yaml.safe_load(f)
         self.logger.info("✅ 配置加载成功")
     
+    async def _initialize_exchange(self, factory, exchange_name: str) -> Tuple[Optional[Any], Optional[Set[str]]]:
+        """
+        初始化单个交易所：创建并连接适配器，获取支持的永续合约（标准格式）
+        
+        Returns:
+            (适配器, 标准symbol集合)；初始化失败时返回 (None, None)
+        """
+        adapter = None
+        try:
+            # 尝试从配置文件加载（包含API密钥）
+            try:
+                adapter = await factory.create_adapter(exchange_name)
+                await adapter.connect()
+                self.logger.info(f"✅ {exchange_name} 初始化成功（使用配置文件）")
+            except Exception as config_error:
+                # 如果配置文件失败，尝试"公开数据模式"（无需API密钥）
+                self.logger.warning(f"⚠️  {exchange_name} 配置文件加载失败: {config_error}")
+                self.logger.info(f"🔄 尝试公开数据模式...")
+                
+                # 创建虚拟配置（用于公开数据访问）
+                from core.adapters.exchanges.interface import ExchangeConfig
+                from core.adapters.exchanges.models import ExchangeType
+                
+                dummy_config = ExchangeConfig(
+                    exchange_id=exchange_name,
+                    name=exchange_name.capitalize(),
+                    exchange_type=ExchangeType.PERPETUAL,  # 套利监控主要用永续合约
+                    api_key="public_data_only",
+                    api_secret="public_data_only",
+                    testnet=False
+                )
+                
+                # 根据交易所类型创建适配器
+                if exchange_name == 'backpack':
+                    from core.adapters.exchanges.adapters.backpack import BackpackAdapter
+                    adapter = BackpackAdapter(dummy_config)
+                elif exchange_name == 'edgex':
+                    from core.adapters.exchanges.adapters.edgex import EdgeXAdapter
+                    adapter = EdgeXAdapter(dummy_config)
+                elif exchange_name == 'lighter':
+                    from core.adapters.exchanges.adapters.lighter import LighterAdapter
+                    adapter = LighterAdapter(dummy_config)
+                else:
+                    raise ValueError(f"不支持的交易所: {exchange_name}")
+                
+                # 只连接WebSocket（不进行认证）
+                await adapter.connect()
+                self.logger.info(f"✅ {exchange_name} 初始化成功（公开数据模式）")
+            
+            # 🔥 获取该交易所支持的symbol（转换为标准格式）- 无论哪种模式都执行
+            if adapter:
+                try:
+                    # 🔥 EdgeX特殊处理：主动获取交易对
+                    if exchange_name == 'edgex':
+                        self.logger.info("⏳ 正在获取EdgeX支持的交易对...")
+                        print("⏳ 正在获取EdgeX交易对列表（约10秒）...")
+                        # 调用 fetch_supported_symbols() 来真正获取交易对
+                        if hasattr(adapter, 'websocket') and hasattr(adapter.websocket, 'fetch_supported_symbols'):
+                            await adapter.websocket.fetch_supported_symbols()
+                        elif hasattr(adapter, '_websocket') and hasattr(adapter._websocket, 'fetch_supported_symbols'):
+                            await adapter._websocket.fetch_supported_symbols()
+                        else:
+                            await asyncio.sleep(12)  # 降级方案：等待metadata自动到达
+                    
+                    raw_symbols = await adapter.get_supported_symbols()
+                    self.logger.info(f"🔍 {exchange_name} 原始symbols数量: {len(raw_symbols)}")
+                    
+                    if len(raw_symbols) == 0:
+                        print(f"❌ {exchange_name}: 未获取到交易对！")
+                        self.logger.warning(f"{exchange_name} 未获取到任何交易对")
+                    else:
+                        # 🔥 显示前5个原始symbol（调试用）
+                        sample_raw = raw_symbols[:5] if len(raw_symbols) >= 5 else raw_symbols
+                        print(f"   📋 前5个原始symbol: {', '.join(sample_raw)}")
+                    
+                    standard_symbols = set()
+                    for raw_symbol in raw_symbols:
+                        try:
+                            std_symbol = self.symbol_converter.convert_from_exchange(raw_symbol, exchange_name)
+                            if std_symbol.endswith('-PERP') or std_symbol.endswith('-USDC-PERP'):  # 永续合约
+                                standard_symbols.add(std_symbol)
+                        except Exception as convert_error:
+                            # 转换失败，忽略
+                            pass
+                    
+                    self.logger.info(f"📊 {exchange_name} 支持 {len(standard_symbols)} 个永续合约")
+                    
+                    if len(standard_symbols) > 0:
+                        print(f"✅ {exchange_name}: 发现 {len(raw_symbols)} 个交易对 → {len(standard_symbols)} 个永续合约")
+                    else:
+                        print(f"⚠️  {exchange_name}: {len(raw_symbols)} 个交易对中没有永续合约")
+                except Exception as e:
+                    self.logger.error(f"⚠️  无法获取 {exchange_name} 支持的symbol: {e}")
+                    print(f"❌ {exchange_name}: 获取symbol失败 - {e}")  # 临时调试
+                    import traceback
+                    self.logger.error(traceback.format_exc())
+                    standard_symbols = set()
+                
+
+            return adapter, standard_symbols
+
+        except Exception as e:
+            self.logger.error(f"❌ {exchange_name} 初始化失败: {e}")
+            import traceback
+            self.logger.debug(traceback.format_exc())
+            return None, None
+    
     async def initialize(self):
         """初始化"""
         print("\n" + "="*60)
@@ -306,105 +414,17 @@ class ArbitrageMonitorApp:
         
         factory = get_exchange_factory()
         
-        for exchange_name in self.config['exchanges']:
-            adapter = None
-            try:
-                # 尝试从配置文件加载（包含API密钥）
-                try:
-                    adapter = await factory.create_adapter(exchange_name)
-                    await adapter.connect()
-                    self.adapters[exchange_name] = adapter
-                    self.logger.info(f"✅ {exchange_name} 初始化成功（使用配置文件）")
-                except Exception as config_error:
-                    # 如果配置文件失败，尝试"公开数据模式"（无需API密钥）
-                    self.logger.warning(f"⚠️  {exchange_name} 配置文件加载失败: {config_error}")
-                    self.logger.info(f"🔄 尝试公开数据模式...")
-                    
-                    # 创建虚拟配置（用于公开数据访问）
-                    from core.adapters.exchanges.interface import ExchangeConfig
-                    from core.adapters.exchanges.models import ExchangeType
-                    
-                    dummy_config = ExchangeConfig(
-                        exchange_id=exchange_name,
-                        name=exchange_name.capitalize(),
-                        exchange_type=ExchangeType.PERPETUAL,  # 套利监控主要用永续合约
-                        api_key="public_data_only",
-                        api_secret="public_data_only",
-                        testnet=False
-                    )
-                    
-                    # 根据交易所类型创建适配器
-                    if exchange_name == 'backpack':
-                        from core.adapters.exchanges.adapters.backpack import BackpackAdapter
-                        adapter = BackpackAdapter(dummy_config)
-                    elif exchange_name == 'edgex':
-                        from core.adapters.exchanges.adapters.edgex import EdgeXAdapter
-                        adapter = EdgeXAdapter(dummy_config)
-                    elif exchange_name == 'lighter':
-                        from core.adapters.exchanges.adapters.lighter import LighterAdapter
-                        adapter = LighterAdapter(dummy_config)
-                    else:
-                        raise ValueError(f"不支持的交易所: {exchange_name}")
-                    
-                    # 只连接WebSocket（不进行认证）
-                    await adapter.connect()
-                    self.adapters[exchange_name] = adapter
-                    self.logger.info(f"✅ {exchange_name} 初始化成功（公开数据模式）")
-                
-                # 🔥 获取该交易所支持的symbol（转换为标准格式）- 无论哪种模式都执行
-                if adapter:
-                    try:
-                        # 🔥 EdgeX特殊处理：主动获取交易对
-                        if exchange_name == 'edgex':
-                            self.logger.info("⏳ 正在获取EdgeX支持的交易对...")
-                            print("⏳ 正在获取EdgeX交易对列表（约10秒）...")
-                            # 调用 fetch_supported_symbols() 来真正获取交易对
-                            if hasattr(adapter, 'websocket') and hasattr(adapter.websocket, 'fetch_supported_symbols'):
-                                await adapter.websocket.fetch_supported_symbols()
-                            elif hasattr(adapter, '_websocket') and hasattr(adapter._websocket, 'fetch_supported_symbols'):
-                                await adapter._websocket.fetch_supported_symbols()
-                            else:
-                                await asyncio.sleep(12)  # 降级方案：等待metadata自动到达
-                        
-                        raw_symbols = await adapter.get_supported_symbols()
-                        self.logger.info(f"🔍 {exchange_name} 原始symbols数量: {len(raw_symbols)}")
-                        
-                        if len(raw_symbols) == 0:
-                            print(f"❌ {exchange_name}: 未获取到交易对！")
-                            self.logger.warning(f"{exchange_name} 未获取到任何交易对")
-                        else:
-                            # 🔥 显示前5个原始symbol（调试用）
-                            sample_raw = raw_symbols[:5] if len(raw_symbols) >= 5 else raw_symbols
-                            print(f"   📋 前5个原始symbol: {', '.join(sample_raw)}")
-                        
-                        standard_symbols = set()
-                        for raw_symbol in raw_symbols:
-                            try:
-                                std_symbol = self.symbol_converter.convert_from_exchange(raw_symbol, exchange_name)
-                                if std_symbol.endswith('-PERP') or std_symbol.endswith('-USDC-PERP'):  # 永续合约
-                                    standard_symbols.add(std_symbol)
-                            except Exception as convert_error:
-                                # 转换失败，忽略
-                                pass
-                        
-                        exchange_symbols[exchange_name] = standard_symbols
-                        self.logger.info(f"📊 {exchange_name} 支持 {len(standard_symbols)} 个永续合约")
-                        
-                        if len(standard_symbols) > 0:
-                            print(f"✅ {exchange_name}: 发现 {len(raw_symbols)} 个交易对 → {len(standard_symbols)} 个永续合约")
-                        else:
-                            print(f"⚠️  {exchange_name}: {len(raw_symbols)} 个交易对中没有永续合约")
-                    except Exception as e:
-                        self.logger.error(f"⚠️  无法获取 {exchange_name} 支持的symbol: {e}")
-                        print(f"❌ {exchange_name}: 获取symbol失败 - {e}")  # 临时调试
-                        import traceback
-                        self.logger.error(traceback.format_exc())
-                        exchange_symbols[exchange_name] = set()
-                    
-            except Exception as e:
-                self.logger.error(f"❌ {exchange_name} 初始化失败: {e}")
-                import traceback
-                self.logger.debug(traceback.format_exc())
+        # 各交易所互不依赖，并发初始化（连接 + 获取交易对），总耗时取决于最慢的交易所
+        exchange_names = list(self.config['exchanges'])
+        init_results = await asyncio.gather(
+            *(self._initialize_exchange(factory, exchange_name) for exchange_name in exchange_names)
+        )
+        # 按配置顺序登记结果
+        for exchange_name, (adapter, standard_symbols) in zip(exchange_names, init_results):
+            if adapter is not None:
+                self.adapters[exchange_name] = adapter
+            if standard_symbols is not None:
+                exchange_symbols[exchange_name] = standard_symbols
         
         if not self.adapters:
             raise RuntimeError("❌ 没有可用的交易所适配器，请检查：\n"
@@ -1001,11 +1021,17 @@ class ArbitrageMonitorApp:
 
 async def main():
     """主函数"""
+    # Python 3.12+：任务在创建时立即同步执行到第一个挂起点，
+    # 无订阅者/无需等待的回调任务可直接完成，省去一次事件循环调度
+    if hasattr(asyncio, 'eager_task_factory'):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     app = ArbitrageMonitorApp()
     await app.run()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -42,6 +42,7 @@ from core.services.grid.reserve import (
     check_spot_reserve_on_startup
 )
 from core.logging import get_system_logger
+from core.infrastructure.event_loop import install_uvloop
 import sys
 import asyncio
 import yaml
@@ -789,7 +790,8 @@ if __name__ == "__main__":
             print("=" * 70)
             print()
 
-        # 运行主程序
+        # 运行主程序（可用时使用 uvloop，缩短止损/订单回调的调度延迟）
+        install_uvloop()
         asyncio.run(main(config_path, debug=args.debug))
 
     except KeyboardInterrupt:
@@ -277,12 +277,7 @@ class LighterVolumeMakerApp:
                 # 🔥 Hyperliquid使用完整适配器（包含REST+WebSocket）
                 from core.adapters.exchanges.adapters.hyperliquid import HyperliquidAdapter
                 self.signal_adapter = HyperliquidAdapter(config=signal_config)
-                # 🔥 手动调用 connect() 确保连接建立
-                print(f"🔧 Hyperliquid适配器已创建，开始连接...")
-                if not await self.signal_adapter.connect():
-                    print(f"❌ Hyperliquid连接失败")
-                    return False
-                print(f"✅ Hyperliquid适配器已连接（支持REST+WebSocket）")
+                print(f"🔧 Hyperliquid适配器已创建，将与Lighter初始化并发连接...")
             else:
                 # 🔥 Backpack使用REST适配器（传统方式）
                 self.signal_adapter = factory.create_adapter(
@@ -298,7 +293,19 @@ class LighterVolumeMakerApp:
             lighter_config['slippage'] = str(self.config.slippage)
             
             self.execution_adapter = LighterRest(config=lighter_config)
-            await self.execution_adapter.initialize()
+
+            # 🔥 信号源连接与Lighter初始化互不依赖，并发执行（总耗时取决于较慢的一方）
+            if signal_exchange == "hyperliquid":
+                signal_connected, _ = await asyncio.gather(
+                    self.signal_adapter.connect(),
+                    self.execution_adapter.initialize()
+                )
+                if not signal_connected:
+                    print(f"❌ Hyperliquid连接失败")
+                    return False
+                print(f"✅ Hyperliquid适配器已连接（支持REST+WebSocket）")
+            else:
+                await self.execution_adapter.initialize()
 
             # 🔥 创建Lighter刷量服务（双适配器）
             print("🔧 创建Lighter刷量服务...")